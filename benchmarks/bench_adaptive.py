@@ -0,0 +1,91 @@
+"""Adaptive concurrency against a simulated backend with fixed capacity.
+
+The backend serves CAPACITY calls at 10ms; beyond that latency grows with
+load, and past three times capacity calls fail. 200 clients hammer it through a
+static bulkhead and through each adaptive algorithm.
+
+Run: python -m benchmarks.bench_adaptive
+"""
+
+import asyncio
+import time
+
+from resilient_result import adaptive, bulkhead
+from resilient_result.adaptive import adaptive_limiter
+
+CAPACITY = 20
+CLIENTS = 200
+SECONDS = 2.0
+
+
+def backend():
+    """A fresh backend - its own in-flight count."""
+    inflight = 0
+
+    async def call():
+        nonlocal inflight
+        inflight += 1
+        try:
+            if inflight > 3 * CAPACITY:
+                await asyncio.sleep(0.001)
+                raise ConnectionError("overloaded")
+            await asyncio.sleep(0.01 * max(1.0, inflight / CAPACITY))
+            return "data"
+        finally:
+            inflight -= 1
+
+    return call
+
+
+async def run(func, key: str) -> tuple:
+    """(ok calls/s, error share, p99 ms, median limit) over SECONDS."""
+    ok = failed = 0
+    latencies = []
+    limits = []
+    deadline = time.monotonic() + SECONDS
+
+    async def client():
+        nonlocal ok, failed
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            result = await func()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if result.success:
+                ok += 1
+            else:
+                failed += 1
+                await asyncio.sleep(0.001)
+
+    async def sample():
+        while time.monotonic() < deadline:
+            limits.append(adaptive_limiter.limit(key))
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(sample(), *(client() for _ in range(CLIENTS)))
+    latencies.sort()
+    limits.sort()
+    p99 = latencies[int(0.99 * len(latencies))]
+    return ok / SECONDS, failed / max(1, ok + failed), p99, limits[len(limits) // 2]
+
+
+def main():
+    cases = (
+        ("static", bulkhead(max_concurrent=CLIENTS, queue_size=CLIENTS)(backend())),
+        ("aimd", adaptive(key="aimd", queue_size=CLIENTS)(backend())),
+        (
+            "gradient",
+            adaptive(key="gradient", algorithm="gradient", queue_size=CLIENTS)(
+                backend()
+            ),
+        ),
+    )
+
+    print(f"{'':<10} {'ok/s':>8} {'errors':>8} {'p99 ms':>8} {'limit':>6}")
+    for name, func in cases:
+        rate, errors, p99, limit = asyncio.run(run(func, name))
+        limit = limit or CLIENTS
+        print(f"{name:<10} {rate:>8.0f} {errors:>8.1%} {p99:>8.1f} {limit:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""CircuitBreaker hot-key cost - ns/op, calls/sec and memory per breaker.
+
+Run: python -m benchmarks.bench_circuit
+"""
+
+import time
+import tracemalloc
+
+from resilient_result.circuit import CircuitBreaker
+
+N = 100_000
+
+
+def hammer(failures: int, window: int = 60) -> float:
+    """ns per is_open + record_failure on one failing key."""
+    breaker = CircuitBreaker()
+    start = time.perf_counter()
+    for _ in range(N):
+        breaker.is_open("hot", failures, window)
+        breaker.record_failure("hot", failures)
+    return (time.perf_counter() - start) / N * 1e9
+
+
+def memory(failures: int, window: int = 60) -> int:
+    """Bytes held by one breaker after N failures."""
+    tracemalloc.start()
+    breaker = CircuitBreaker()
+    for _ in range(N):
+        breaker.record_failure("hot", failures)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    print(f"{'failures':>8} {'ns/op':>8} {'calls/sec':>12} {'bytes':>10}")
+    for failures in (3, 100, 1000):
+        ns = min(hammer(failures) for _ in range(3))
+        print(f"{failures:>8} {ns:>8.0f} {1e9 / ns:>12,.0f} {memory(failures):>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Hedging against a simulated long-tailed backend - p50/p99 latency.
+
+Run: python -m benchmarks.bench_hedge
+"""
+
+import asyncio
+import random
+import time
+
+from resilient_result import Budget, hedge
+
+CALLS = 2000
+CONCURRENCY = 50
+
+
+async def backend():
+    """10ms typical, 5% of calls stall for 200ms."""
+    await asyncio.sleep(0.2 if random.random() < 0.05 else 0.01)
+    return "data"
+
+
+async def run(func) -> list:
+    """Latencies in ms for CALLS calls, CONCURRENCY at a time."""
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await func()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(CALLS)))
+    return sorted(latencies)
+
+
+def pct(latencies: list, p: float) -> float:
+    return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+
+def main():
+    random.seed(7)
+    hedged = hedge(percentile=0.9, budget=Budget(ratio=0.1, key="bench"))(backend)
+
+    print(f"{'':<10} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, func in (("plain", backend), ("hedged", hedged)):
+        latencies = asyncio.run(run(func))
+        print(f"{name:<10} {pct(latencies, 0.5):>8.1f} {pct(latencies, 0.99):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
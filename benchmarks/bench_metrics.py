@@ -0,0 +1,82 @@
+"""Metrics overhead - ns/op with metrics disabled vs enabled.
+
+Run: python -m benchmarks.bench_metrics
+"""
+
+import time
+
+from resilient_result import circuit, metrics, rate_limit, retry
+from resilient_result.metrics import Metrics
+
+N = 200_000
+
+
+def ns_per_call(func) -> float:
+    """Best-of-5 ns per call."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(N):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / N * 1e9
+
+
+def check_cost() -> float:
+    """ns for the disabled check itself - a loop with it minus one without."""
+    registry = Metrics()
+
+    def checked():
+        for _ in range(N):
+            if registry.enabled:
+                pass
+
+    def bare():
+        for _ in range(N):
+            pass
+
+    return min(_timed(checked) - _timed(bare) for _ in range(5)) / N * 1e9
+
+
+def _timed(loop) -> float:
+    start = time.perf_counter()
+    loop()
+    return time.perf_counter() - start
+
+
+def main():
+    @retry()
+    def retried():
+        return "ok"
+
+    @circuit(key="bench-circuit")
+    def protected():
+        return "ok"
+
+    @rate_limit(rps=1e9, key="bench-rate")
+    def limited():
+        return "ok"
+
+    @retry(retry_on=None)
+    @circuit(key="bench-stack")
+    def stacked():
+        return "ok"
+
+    print(f"disabled check: {check_cost():.1f} ns")
+    print(f"{'call':<10} {'disabled':>10} {'enabled':>10}")
+    for name, func in (
+        ("retry", retried),
+        ("circuit", protected),
+        ("rate_limit", limited),
+        ("stacked", stacked),
+    ):
+        metrics.enabled = False
+        disabled = ns_per_call(func)
+        metrics.enabled = True
+        enabled = ns_per_call(func)
+        print(f"{name:<10} {disabled:>10.0f} {enabled:>10.0f}")
+    metrics.enabled = False
+
+
+if __name__ == "__main__":
+    main()
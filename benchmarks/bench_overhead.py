@@ -0,0 +1,231 @@
+"""Per-call decorator overhead on the success path - ns/op with baselines.
+
+Run:     python -m benchmarks.bench_overhead
+Save:    python -m benchmarks.bench_overhead --save
+Compare: python -m benchmarks.bench_overhead --compare
+
+--compare exits 1 when any case is more than --threshold slower than the
+stored baseline. Baselines are only comparable on the machine and Python
+that wrote them - save one there first, then compare against it.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from resilient_result import (
+    Err,
+    Ok,
+    Result,
+    circuit,
+    rate_limit,
+    resilient,
+    retry,
+    timeout,
+)
+
+BASELINE = Path(__file__).with_name("baseline_overhead.json")
+
+MIN_TIME = 0.05  # Seconds per timed run - number doubles until a run lasts this long
+REPEAT = 5  # Timed runs per case - the fastest counts
+THRESHOLD = 0.25  # Slowdown --compare reports as a regression
+
+NESTED = Ok(Ok(Ok("data")))
+
+
+def _sync():
+    def func():
+        return "ok"
+
+    return func
+
+
+def _async():
+    async def func():
+        return "ok"
+
+    return func
+
+
+def _decorated(*decorators):
+    """Factory for a decorated sync or async function - outermost first."""
+
+    def make(func):
+        for decorator in reversed(decorators):
+            func = decorator(func)
+        return func
+
+    return make
+
+
+def _collect_case(size: int):
+    """collect over already-finished operations - gather and unwrap only."""
+
+    async def value(i):
+        return Ok(i)
+
+    async def run():
+        return await Result.collect([value(i) for i in range(size)])
+
+    return run
+
+
+# name -> (factory returning the callable, async?) - "call" is the bare
+# function every decorator case wraps, so the difference is the overhead
+CASES = {
+    "call": (_sync, False),
+    "call async": (_async, True),
+    "Ok(data)": (lambda: lambda: Ok("data"), False),
+    "Err(error)": (lambda: lambda: Err("error"), False),
+    "flatten": (lambda: NESTED.flatten, False),
+    "collect x10": (lambda: _collect_case(10), True),
+}
+
+DECORATORS = {
+    "retry": lambda: [retry()],
+    "timeout": lambda: [timeout()],
+    "circuit": lambda: [circuit()],
+    "rate_limit": lambda: [rate_limit(rps=1e9)],
+    "resilient": lambda: [resilient()],
+    "rate_limit+circuit+retry": lambda: [rate_limit(rps=1e9), circuit(), retry()],
+    "rate_limit+circuit+timeout+retry": lambda: [
+        rate_limit(rps=1e9),
+        circuit(),
+        timeout(),
+        retry(),
+    ],
+}
+
+for _name, _decorators in DECORATORS.items():
+    CASES[_name] = (lambda d=_decorators: _decorated(*d())(_sync()), False)
+    CASES[f"{_name} async"] = (lambda d=_decorators: _decorated(*d())(_async()), True)
+
+
+def _timed_sync(func, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+async def _timed_async(func, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await func()
+    return time.perf_counter() - start
+
+
+def measure(factory, is_async: bool, min_time: float = MIN_TIME) -> float:
+    """Best-of-REPEAT ns per call, each run at least min_time long."""
+    loop = asyncio.new_event_loop() if is_async else None
+    try:
+        if is_async:
+            # Built inside the loop, like a real caller would
+            func = loop.run_until_complete(_build(factory))
+
+            def timed(number):
+                return loop.run_until_complete(_timed_async(func, number))
+
+        else:
+            func = factory()
+
+            def timed(number):
+                return _timed_sync(func, number)
+
+        number = 1
+        while (elapsed := timed(number)) < min_time:
+            number *= 2
+        best = min([elapsed] + [timed(number) for _ in range(REPEAT - 1)])
+        return best / number * 1e9
+    finally:
+        if loop is not None:
+            loop.close()
+
+
+async def _build(factory):
+    return factory()
+
+
+def run_cases(only=None, min_time: float = MIN_TIME) -> dict:
+    """ns/op for every case whose name contains `only`, printed as they finish."""
+    results = {}
+    print(f"{'case':<40} {'ns/op':>10}")
+    for name, (factory, is_async) in CASES.items():
+        if only and only not in name:
+            continue
+        results[name] = measure(factory, is_async, min_time)
+        print(f"{name:<40} {results[name]:>10.0f}")
+    return results
+
+
+def _environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+    }
+
+
+def save(results: dict, path: Path) -> None:
+    path.write_text(
+        json.dumps(
+            {**_environment(), "results": {k: round(v, 1) for k, v in results.items()}},
+            indent=2,
+        )
+        + "\n"
+    )
+    print(f"\nBaseline written to {path}")
+
+
+def compare(results: dict, path: Path, threshold: float) -> bool:
+    """Print each case against the baseline - False if any regressed."""
+    baseline = json.loads(path.read_text())
+    environment = _environment()
+    for field, value in environment.items():
+        if baseline.get(field) != value:
+            print(f"\nwarning: baseline {field} {baseline.get(field)} != {value}")
+
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>10} {'now':>10} {'change':>8}")
+    for name, ns in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<40} {'-':>10} {ns:>10.0f} {'new':>8}")
+            continue
+        change = ns / before - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<40} {before:>10.0f} {ns:>10.0f} {change:>+8.0%}{flag}")
+        if flag:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) over {threshold:.0%} slower")
+    return not regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--compare", action="store_true", help="exit 1 on regression vs baseline"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--only", help="run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME)
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.only, args.min_time)
+    if args.save:
+        save(results, args.baseline)
+    if args.compare:
+        return 0 if compare(results, args.baseline, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Registry memory under key churn - one million distinct rate limit keys.
+
+Run: python -m benchmarks.bench_registry
+"""
+
+import time
+import tracemalloc
+
+from resilient_result.circuit import CircuitBreaker
+from resilient_result.rate_limit import RateLimiter
+
+N = 1_000_000
+
+
+def churn(name: str, make, max_keys, touch) -> None:
+    """Held bytes, keys and ns/op after touching N distinct keys."""
+    tracemalloc.start()
+    mechanism = make(max_keys=max_keys)
+    start = time.perf_counter()
+    for i in range(N):
+        touch(mechanism, f"tenant-{i}")
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<28} {len(mechanism.keys):>10,} {size / 1e6:>10.1f} "
+        f"{elapsed / N * 1e9:>8.0f}"
+    )
+
+
+def main():
+    print(f"{'registry':<28} {'keys':>10} {'MB':>10} {'ns/op':>8}")
+    for max_keys in (None, 100_000, 10_000):
+        churn(
+            f"rate_limit max_keys={max_keys}",
+            RateLimiter,
+            max_keys,
+            lambda limiter, key: limiter.reserve(key, 10.0),
+        )
+    for max_keys in (None, 10_000):
+        churn(
+            f"circuit max_keys={max_keys}",
+            CircuitBreaker,
+            max_keys,
+            lambda breaker, key: breaker.record_failure(key, 3, 60),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Result construction micro-benchmark - ns/op and allocations per op.
+
+Run: python -m benchmarks.bench_result
+"""
+
+import timeit
+import tracemalloc
+
+from resilient_result import Err, Ok
+
+NESTED = Ok(Ok(Ok("data")))
+OK = Ok("data")
+
+CASES = {
+    "Ok(data)": lambda: Ok("data"),
+    "Ok()": lambda: Ok(),
+    "Err(error)": lambda: Err("error"),
+    "success": lambda: OK.success,
+    "unwrap": lambda: OK.unwrap(),
+    "flatten": lambda: NESTED.flatten(),
+}
+
+
+def ns_per_op(fn, number: int = 200_000, repeat: int = 5) -> float:
+    """Best-of-repeat nanoseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def allocs_per_op(fn, number: int = 10_000) -> float:
+    """Live blocks allocated per call (objects kept alive by the call)."""
+    keep = [None] * number
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(number):
+        keep[i] = fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(s.count_diff for s in stats) / number
+
+
+def main():
+    print(f"{'case':<12} {'ns/op':>8} {'allocs/op':>10}")
+    for name, fn in CASES.items():
+        print(f"{name:<12} {ns_per_op(fn):>8.1f} {allocs_per_op(fn):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,25 @@
 """Resilient Result - Result pattern with resilience decorators for clean error handling."""
 
+from .adaptive import adaptive
+from .bulkhead import bulkhead
+from .cache import cache
 from .circuit import circuit
-from .errors import CircuitError, RateLimitError, RetryError
-from .policies import Backoff, Circuit, Retry, Timeout
+from .clock import Clock, VirtualClock, set_clock
+from .coalesce import coalesce
+from .deadlines import deadline, remaining
+from .errors import (
+    BulkheadError,
+    CircuitError,
+    FallbackError,
+    RateLimitError,
+    RetryError,
+)
+from .fallback import fallback
+from .hedge import hedge
+from .hooks import Hook, hooks
+from .log import RetryLog
+from .metrics import metrics
+from .policies import Backoff, Budget, Circuit, Retry, Timeout
 from .rate_limit import rate_limit
 from .resilient import Resilient, resilient, retry
 from .result import Err, Ok, Result
@@ -19,11 +36,29 @@ __all__ = [
     "timeout",
     "circuit",
     "rate_limit",
+    "hedge",
+    "bulkhead",
+    "adaptive",
+    "coalesce",
+    "cache",
+    "fallback",
+    "deadline",
+    "remaining",
+    "Clock",
+    "VirtualClock",
+    "set_clock",
+    "metrics",
+    "Hook",
+    "hooks",
+    "RetryLog",
     "Retry",
     "Circuit",
     "Backoff",
+    "Budget",
     "Timeout",
+    "BulkheadError",
     "CircuitError",
+    "FallbackError",
     "RateLimitError",
     "RetryError",
 ]
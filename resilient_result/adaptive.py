@@ -0,0 +1,245 @@
+"""Adaptive concurrency - a limit that tracks backend capacity."""
+
+import asyncio
+import math
+import threading
+from functools import wraps
+from typing import Dict
+
+from . import clock
+from .bulkhead import Bulkhead
+from .defaults import (
+    ADAPTIVE_BACKOFF,
+    ADAPTIVE_INITIAL,
+    ADAPTIVE_MAX,
+    ADAPTIVE_MIN,
+    ADAPTIVE_SMOOTHING,
+    ADAPTIVE_TOLERANCE,
+    ADAPTIVE_WINDOW,
+    BULKHEAD_QUEUE_SIZE,
+)
+from .errors import BulkheadError
+from .result import Err, Ok, Result
+
+AIMD = "aimd"
+GRADIENT = "gradient"
+
+
+class _Limit:
+    """Concurrency limit and smoothed measurements for one key."""
+
+    __slots__ = ("limit", "rtt", "error_rate", "samples")
+
+    def __init__(self, initial: int):
+        self.limit = float(initial)
+        self.rtt = 0.0
+        self.error_rate = 0.0
+        self.samples = 0
+
+
+def _aimd(state: _Limit, latency: float, failed: bool, active: int) -> float:
+    """+1 per round trip while the limit is in use, x0.9 on an error."""
+    if failed:
+        return state.limit * ADAPTIVE_BACKOFF
+    if active * 2 >= state.limit:
+        return state.limit + 1.0 / state.limit
+    return state.limit
+
+
+def _gradient(state: _Limit, latency: float, failed: bool, active: int) -> float:
+    """Scale by smoothed RTT / sample RTT plus sqrt(limit) queueing headroom."""
+    if failed:
+        return state.limit * ADAPTIVE_BACKOFF
+    if latency <= 0:
+        return state.limit
+    gradient = max(0.5, min(1.0, ADAPTIVE_TOLERANCE * state.rtt / latency))
+    target = state.limit * gradient + math.sqrt(state.limit)
+    if target > state.limit and active * 2 < state.limit:
+        return state.limit  # Not using the limit - don't grow it
+    # A round trip brings `limit` samples - smooth per round trip, not per call
+    return state.limit + (target - state.limit) * ADAPTIVE_SMOOTHING / state.limit
+
+
+ALGORITHMS = {AIMD: _aimd, GRADIENT: _gradient}
+
+
+class AdaptiveLimiter:
+    """Per-key concurrency limit adjusted from call latency and errors.
+
+    Admission runs on a private Bulkhead whose cap is the current limit.
+    Each finished call is one sample: its latency is compared with a
+    long-term RTT average (which drops quickly when the backend gets
+    faster) and failures count as drops. The algorithm turns the sample
+    into a new limit, clamped to [min_limit, max_limit].
+    """
+
+    def __init__(self):
+        self._limits: Dict[str, _Limit] = {}
+        self._lock = threading.Lock()
+        self._slots = Bulkhead()
+
+    def _state(self, key: str, initial: int) -> _Limit:
+        state = self._limits.get(key)
+        if state is None:
+            with self._lock:
+                state = self._limits.setdefault(key, _Limit(initial))
+        return state
+
+    def limit(self, key: str) -> int:
+        """Current concurrency limit for key (0 before its first call)."""
+        state = self._limits.get(key)
+        return int(state.limit) if state else 0
+
+    async def acquire(
+        self,
+        key: str,
+        initial: int = ADAPTIVE_INITIAL,
+        queue_size: int = BULKHEAD_QUEUE_SIZE,
+        timeout: float = None,
+    ) -> None:
+        """Wait for a slot under the current limit - raises BulkheadError."""
+        limit = int(self._state(key, initial).limit)
+        await self._slots.acquire(key, limit, queue_size, timeout)
+
+    def acquire_sync(
+        self,
+        key: str,
+        initial: int = ADAPTIVE_INITIAL,
+        queue_size: int = BULKHEAD_QUEUE_SIZE,
+        timeout: float = None,
+    ) -> None:
+        """Block for a slot under the current limit - raises BulkheadError."""
+        limit = int(self._state(key, initial).limit)
+        self._slots.acquire_sync(key, limit, queue_size, timeout)
+
+    def record(
+        self,
+        key: str,
+        latency: float,
+        failed: bool,
+        algorithm: str = AIMD,
+        min_limit: int = ADAPTIVE_MIN,
+        max_limit: int = ADAPTIVE_MAX,
+    ) -> None:
+        """Feed one finished call into the limit and free its slot."""
+        with self._lock:
+            state = self._limits[key]
+            if state.samples == 0:
+                state.rtt = latency
+            state.samples += 1
+            state.error_rate += (failed - state.error_rate) / ADAPTIVE_WINDOW
+
+            active = 0 if failed else self._slots.stats(key)["active"]
+            limit = ALGORITHMS[algorithm](state, latency, failed, active)
+            if not failed:
+                # Falls fast, rises over ~WINDOW round trips: tracks no-load
+                # RTT but follows a backend that has genuinely got slower
+                if latency < state.rtt:
+                    state.rtt = latency + (state.rtt - latency) * 0.5
+                else:
+                    state.rtt += (latency - state.rtt) / (ADAPTIVE_WINDOW * state.limit)
+
+            state.limit = max(min_limit, min(max_limit, limit))
+            self._slots.release(key, int(state.limit))
+
+    def release(self, key: str) -> None:
+        """Free a slot without a sample - for calls that never finished."""
+        self._slots.release(key, int(self._limits[key].limit))
+
+    def stats(self, key: str) -> Dict[str, float]:
+        """Limit, active and queued calls, smoothed RTT and error rate."""
+        state = self._limits.get(key)
+        if state is None:
+            return {"limit": 0, "active": 0, "queued": 0, "rtt": 0.0, "error_rate": 0.0}
+        return {
+            "limit": int(state.limit),
+            **self._slots.stats(key),
+            "rtt": state.rtt,
+            "error_rate": state.error_rate,
+        }
+
+
+# Global instance
+adaptive_limiter = AdaptiveLimiter()
+
+
+def adaptive(
+    initial: int = ADAPTIVE_INITIAL,
+    min_limit: int = ADAPTIVE_MIN,
+    max_limit: int = ADAPTIVE_MAX,
+    algorithm: str = AIMD,
+    queue_size: int = BULKHEAD_QUEUE_SIZE,
+    timeout: float = None,
+    key: str = None,
+):
+    """Start at 10 concurrent calls and follow the backend - AIMD by default.
+
+    algorithm="aimd" grows the limit by one per round trip while it is in
+    use and backs off on errors; algorithm="gradient" also backs off as
+    latency rises above its long-term average. Raised exceptions and
+    Err(Exception) results count as errors. Calls over the limit queue like
+    a bulkhead and get Err(BulkheadError) once the queue is full.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown adaptive algorithm: {algorithm!r}")
+
+    def decorator(func):
+        func_key = key or f"{func.__module__}.{func.__qualname__}"
+
+        def finish(start, result):
+            failed = isinstance(result._error, Exception)
+            adaptive_limiter.record(
+                func_key,
+                clock.now() - start,
+                failed,
+                algorithm,
+                min_limit,
+                max_limit,
+            )
+            return result
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_adaptive(*args, **kwargs):
+                try:
+                    await adaptive_limiter.acquire(
+                        func_key, initial, queue_size, timeout
+                    )
+                except BulkheadError as e:
+                    return Err(e)
+
+                start = clock.now()
+                try:
+                    result = await func(*args, **kwargs)
+                    result = Ok(result) if not isinstance(result, Result) else result
+                except Exception as e:
+                    result = Err(e)
+                except BaseException:
+                    adaptive_limiter.release(func_key)
+                    raise
+                return finish(start, result)
+
+            return async_adaptive
+
+        @wraps(func)
+        def sync_adaptive(*args, **kwargs):
+            try:
+                adaptive_limiter.acquire_sync(func_key, initial, queue_size, timeout)
+            except BulkheadError as e:
+                return Err(e)
+
+            start = clock.now()
+            try:
+                result = func(*args, **kwargs)
+                result = Ok(result) if not isinstance(result, Result) else result
+            except Exception as e:
+                result = Err(e)
+            except BaseException:
+                adaptive_limiter.release(func_key)
+                raise
+            return finish(start, result)
+
+        return sync_adaptive
+
+    return decorator
@@ -0,0 +1,97 @@
+"""Retry budget - stops retry storms against a struggling dependency."""
+
+import threading
+from typing import List, Optional
+
+from . import clock
+from .defaults import REGISTRY_IDLE, REGISTRY_MAX_KEYS
+from .registry import Registry
+
+BUCKETS = 10
+
+
+class _Window:
+    """Request and retry counts over a sliding window of time buckets."""
+
+    __slots__ = (
+        "width",
+        "index",
+        "edge",
+        "requests",
+        "retries",
+        "total_requests",
+        "total_retries",
+    )
+
+    def __init__(self, window: float, now: float):
+        self.width = window / BUCKETS
+        self.index = 0
+        self.edge = now + self.width
+        self.requests: List[int] = [0] * BUCKETS
+        self.retries: List[int] = [0] * BUCKETS
+        self.total_requests = 0
+        self.total_retries = 0
+
+    def advance(self, now: float) -> None:
+        """Expire buckets that slid out of the window - at most BUCKETS steps."""
+        steps = 0
+        while now >= self.edge and steps < BUCKETS:
+            self.index = (self.index + 1) % BUCKETS
+            self.total_requests -= self.requests[self.index]
+            self.total_retries -= self.retries[self.index]
+            self.requests[self.index] = 0
+            self.retries[self.index] = 0
+            self.edge += self.width
+            steps += 1
+        if now >= self.edge:
+            self.edge = now + self.width
+
+
+class RetryBudget:
+    """Sliding-window retry budget per key.
+
+    A retry is allowed while retries in the window stay under
+    `min_retries + ratio * requests`. Counts live in fixed time buckets,
+    so recording and checking are O(1) with constant memory per key.
+    Keys live in a bounded `Registry`.
+    """
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = REGISTRY_MAX_KEYS,
+        idle: Optional[float] = REGISTRY_IDLE,
+    ):
+        self.keys = Registry(max_keys, idle)
+        self._lock = threading.Lock()
+
+    def _window(self, key: str, window: float, now: float) -> _Window:
+        counts = self.keys.get(key)
+        if counts is None:
+            counts = _Window(window, now)
+            self.keys.put(key, counts)
+        else:
+            counts.advance(now)
+        return counts
+
+    def record_request(self, key: str, window: float) -> None:
+        """Count one call (not attempt) against key."""
+        with self._lock:
+            counts = self._window(key, window, clock.now())
+            counts.requests[counts.index] += 1
+            counts.total_requests += 1
+
+    def try_retry(
+        self, key: str, ratio: float, window: float, min_retries: int
+    ) -> bool:
+        """Spend one retry if the budget allows it."""
+        with self._lock:
+            counts = self._window(key, window, clock.now())
+            if counts.total_retries >= min_retries + ratio * counts.total_requests:
+                return False
+            counts.retries[counts.index] += 1
+            counts.total_retries += 1
+            return True
+
+
+# Global instance
+retry_budget = RetryBudget()
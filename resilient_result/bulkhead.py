@@ -0,0 +1,196 @@
+"""Bulkhead isolation - cap concurrent calls and shed overload early."""
+
+import asyncio
+import threading
+from collections import deque
+from functools import wraps
+from typing import Deque, Dict
+
+from .defaults import BULKHEAD_MAX_CONCURRENT, BULKHEAD_QUEUE_SIZE
+from .errors import BulkheadError
+from .result import Err, Ok, Result
+
+
+class _Compartment:
+    """Active calls and FIFO waiters for one key."""
+
+    __slots__ = ("active", "waiters")
+
+    def __init__(self):
+        self.active = 0
+        self.waiters: Deque[tuple] = deque()
+
+
+def _wake(future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class Bulkhead:
+    """Per-key concurrency cap with a bounded FIFO queue.
+
+    Slots are handed directly from a finishing call to the oldest waiter,
+    which may be a coroutine on any loop or a blocked thread, so sync and
+    async callers of a key share one compartment. A full queue rejects in
+    O(1) without allocating a waiter.
+    """
+
+    def __init__(self):
+        self._compartments: Dict[str, _Compartment] = {}
+        self._lock = threading.Lock()
+
+    def _enter(self, key: str, max_concurrent: int, queue_size: int, waiter):
+        """Take a slot (None) or queue waiter (its compartment) - lock held."""
+        compartment = self._compartments.get(key)
+        if compartment is None:
+            compartment = self._compartments[key] = _Compartment()
+        if compartment.active < max_concurrent and not compartment.waiters:
+            compartment.active += 1
+            return None
+        if len(compartment.waiters) >= queue_size:
+            raise BulkheadError("Bulkhead full")
+        compartment.waiters.append(waiter)
+        return compartment
+
+    def _abandon(self, compartment: _Compartment, waiter) -> bool:
+        """Leave the queue - False if a slot was already handed over."""
+        with self._lock:
+            try:
+                compartment.waiters.remove(waiter)
+            except ValueError:
+                return False
+            return True
+
+    async def acquire(
+        self,
+        key: str,
+        max_concurrent: int = BULKHEAD_MAX_CONCURRENT,
+        queue_size: int = BULKHEAD_QUEUE_SIZE,
+        timeout: float = None,
+    ) -> None:
+        """Wait for a slot - raises BulkheadError if full or timed out."""
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future.get_loop(), future)
+        with self._lock:
+            compartment = self._enter(key, max_concurrent, queue_size, waiter)
+        if compartment is None:
+            return
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            if self._abandon(compartment, waiter):
+                raise BulkheadError(f"Bulkhead queue wait over {timeout}s") from None
+        except asyncio.CancelledError:
+            if not self._abandon(compartment, waiter):
+                self.release(key)
+            raise
+
+    def acquire_sync(
+        self,
+        key: str,
+        max_concurrent: int = BULKHEAD_MAX_CONCURRENT,
+        queue_size: int = BULKHEAD_QUEUE_SIZE,
+        timeout: float = None,
+    ) -> None:
+        """Block for a slot - raises BulkheadError if full or timed out."""
+        event = threading.Event()
+        waiter = (None, event)
+        with self._lock:
+            compartment = self._enter(key, max_concurrent, queue_size, waiter)
+        if compartment is None:
+            return
+
+        if not event.wait(timeout) and self._abandon(compartment, waiter):
+            raise BulkheadError(f"Bulkhead queue wait over {timeout}s")
+
+    def release(self, key: str, max_concurrent: int = None) -> None:
+        """Free a slot, handing it to the oldest waiter if any.
+
+        With `max_concurrent`, waiters are admitted up to that cap instead,
+        so a raised cap drains the queue and a lowered one takes effect.
+        """
+        woken = []
+        with self._lock:
+            compartment = self._compartments[key]
+            compartment.active -= 1
+            if max_concurrent is None:
+                max_concurrent = compartment.active + 1
+            while compartment.waiters and compartment.active < max_concurrent:
+                woken.append(compartment.waiters.popleft())
+                compartment.active += 1
+
+        for loop, signal in woken:
+            if loop is None:
+                signal.set()
+            else:
+                loop.call_soon_threadsafe(_wake, signal)
+
+    def stats(self, key: str) -> Dict[str, int]:
+        """Active and queued calls for key."""
+        with self._lock:
+            compartment = self._compartments.get(key)
+            if compartment is None:
+                return {"active": 0, "queued": 0}
+            return {"active": compartment.active, "queued": len(compartment.waiters)}
+
+
+# Global instance
+bulkheads = Bulkhead()
+
+
+def bulkhead(
+    max_concurrent: int = BULKHEAD_MAX_CONCURRENT,
+    queue_size: int = BULKHEAD_QUEUE_SIZE,
+    timeout: float = None,
+    key: str = None,
+):
+    """10 concurrent, 100 queued - reasonable everywhere.
+
+    On success: returns Ok(result)
+    On failure: returns Err(exception)
+    Queue full or wait over `timeout`: returns Err(BulkheadError)
+    """
+
+    def decorator(func):
+        func_key = key or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_bulkheaded(*args, **kwargs):
+                try:
+                    await bulkheads.acquire(
+                        func_key, max_concurrent, queue_size, timeout
+                    )
+                except BulkheadError as e:
+                    return Err(e)
+
+                try:
+                    result = await func(*args, **kwargs)
+                    return Ok(result) if not isinstance(result, Result) else result
+                except Exception as e:
+                    return Err(e)
+                finally:
+                    bulkheads.release(func_key)
+
+            return async_bulkheaded
+
+        @wraps(func)
+        def sync_bulkheaded(*args, **kwargs):
+            try:
+                bulkheads.acquire_sync(func_key, max_concurrent, queue_size, timeout)
+            except BulkheadError as e:
+                return Err(e)
+
+            try:
+                result = func(*args, **kwargs)
+                return Ok(result) if not isinstance(result, Result) else result
+            except Exception as e:
+                return Err(e)
+            finally:
+                bulkheads.release(func_key)
+
+        return sync_bulkheaded
+
+    return decorator
@@ -0,0 +1,262 @@
+"""Result caching - fresh, stale and negative entries in a bounded LRU."""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from functools import partial, wraps
+from typing import Dict
+
+from . import clock
+from .defaults import CACHE_MAXSIZE, CACHE_TTL
+from .errors import CircuitError
+from .registry import arguments
+from .result import Err, Ok, Result
+
+
+class _Entry:
+    """A cached Result and the times it goes stale and expires."""
+
+    __slots__ = ("result", "fresh_until", "stale_until")
+
+    def __init__(self, result: Result, fresh_until: float, stale_until: float):
+        self.result = result
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class _Store:
+    """LRU entries and counters for one function."""
+
+    __slots__ = ("entries", "refreshing", "hits", "stale", "misses")
+
+    def __init__(self):
+        self.entries: OrderedDict = OrderedDict()
+        self.refreshing = set()
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+
+
+class ResultCache:
+    """Per-function LRU of Results with fresh and stale lifetimes.
+
+    Ok results stay fresh for `ttl`, then may be served stale while one
+    background refresh runs. Err results are only kept for `error_ttl`, and
+    Err(CircuitError) is never kept - while the circuit is open, the last Ok
+    is served instead, however old, until it is evicted.
+    """
+
+    def __init__(self):
+        self._stores: Dict[str, _Store] = {}
+        self._lock = threading.Lock()
+
+    def _store(self, name: str) -> _Store:
+        store = self._stores.get(name)
+        if store is None:
+            with self._lock:
+                store = self._stores.setdefault(name, _Store())
+        return store
+
+    def get(self, name: str, key):
+        """Cached entry for key, marked most recently used, or None."""
+        store = self._store(name)
+        with self._lock:
+            entry = store.entries.get(key)
+            if entry is not None:
+                store.entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        name: str,
+        key,
+        result: Result,
+        ttl: float = CACHE_TTL,
+        stale: float = 0.0,
+        error_ttl: float = 0.0,
+        maxsize: int = CACHE_MAXSIZE,
+    ) -> None:
+        """Store result under its lifetime - errors without one are dropped."""
+        if result._error is None:
+            fresh = ttl
+        elif error_ttl > 0 and not isinstance(result._error, CircuitError):
+            fresh, stale = error_ttl, 0.0
+        else:
+            return
+
+        now = clock.now()
+        store = self._store(name)
+        with self._lock:
+            store.entries[key] = _Entry(result, now + fresh, now + fresh + stale)
+            store.entries.move_to_end(key)
+            while len(store.entries) > maxsize:
+                store.entries.popitem(last=False)
+
+    def _count(self, name: str, outcome: str) -> None:
+        store = self._store(name)
+        with self._lock:
+            setattr(store, outcome, getattr(store, outcome) + 1)
+
+    def _claim(self, name: str, key) -> bool:
+        """Take the refresh for key - False if one is already running."""
+        store = self._store(name)
+        with self._lock:
+            if key in store.refreshing:
+                return False
+            store.refreshing.add(key)
+            return True
+
+    def _settle(self, name: str, key) -> None:
+        with self._lock:
+            self._stores[name].refreshing.discard(key)
+
+    def invalidate(self, name: str, key=None) -> None:
+        """Drop one key, or every entry for name."""
+        store = self._store(name)
+        with self._lock:
+            if key is None:
+                store.entries.clear()
+            else:
+                store.entries.pop(key, None)
+
+    def stats(self, name: str) -> Dict[str, int]:
+        """Fresh hits, stale hits, misses and entry count."""
+        store = self._store(name)
+        with self._lock:
+            return {
+                "hits": store.hits,
+                "stale": store.stale,
+                "misses": store.misses,
+                "size": len(store.entries),
+            }
+
+
+# Global instance
+result_cache = ResultCache()
+
+
+def cache(
+    ttl: float = CACHE_TTL,
+    maxsize: int = CACHE_MAXSIZE,
+    error_ttl: float = 0.0,
+    stale: float = 0.0,
+    key_func=None,
+    key: str = None,
+):
+    """60s TTL, 1024 entries - reasonable everywhere.
+
+    Ok results are cached for `ttl`; Err results for `error_ttl` (not at
+    all by default). For `stale` seconds past the TTL the old Ok is
+    returned at once while a background call refreshes it. When a call
+    returns Err(CircuitError), the last cached Ok is returned instead.
+    `key_func(*args, **kwargs)` builds the cache key - the arguments by
+    default; unhashable keys skip the cache. `func.invalidate()` clears it.
+    """
+    key_func = key_func or arguments
+
+    def decorator(func):
+        name = key or f"{func.__module__}.{func.__qualname__}"
+        lifetimes = (ttl, stale, error_ttl, maxsize)
+
+        def lookup(args, kwargs):
+            """(key, entry, fresh) - key is None when it can't be cached."""
+            try:
+                cache_key = key_func(*args, **kwargs)
+                entry = result_cache.get(name, cache_key)
+            except TypeError:
+                return None, None, False
+            fresh = entry is not None and clock.now() < entry.fresh_until
+            return cache_key, entry, fresh
+
+        def settle(cache_key, entry, result):
+            """Store a fresh call's result, or fall back to the cached Ok."""
+            if (
+                isinstance(result._error, CircuitError)
+                and entry is not None
+                and entry.result._error is None
+            ):
+                result_cache._count(name, "stale")
+                return entry.result
+            result_cache._count(name, "misses")
+            result_cache.put(name, cache_key, result, *lifetimes)
+            return result
+
+        def revalidating(entry) -> bool:
+            return entry.result._error is None and clock.now() < entry.stale_until
+
+        if asyncio.iscoroutinefunction(func):
+            refreshes = set()
+
+            async def call(args, kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                    return Ok(result) if not isinstance(result, Result) else result
+                except Exception as e:
+                    return Err(e)
+
+            async def refresh(cache_key, args, kwargs):
+                try:
+                    result_cache.put(
+                        name, cache_key, await call(args, kwargs), *lifetimes
+                    )
+                finally:
+                    result_cache._settle(name, cache_key)
+
+            @wraps(func)
+            async def async_cached(*args, **kwargs):
+                cache_key, entry, fresh = lookup(args, kwargs)
+                if cache_key is None:
+                    return await call(args, kwargs)
+                if fresh:
+                    result_cache._count(name, "hits")
+                    return entry.result
+                if entry is not None and revalidating(entry):
+                    result_cache._count(name, "stale")
+                    if result_cache._claim(name, cache_key):
+                        # Keep a reference so the task isn't collected mid-flight
+                        task = asyncio.ensure_future(refresh(cache_key, args, kwargs))
+                        refreshes.add(task)
+                        task.add_done_callback(refreshes.discard)
+                    return entry.result
+                return settle(cache_key, entry, await call(args, kwargs))
+
+            async_cached.invalidate = partial(result_cache.invalidate, name)
+            return async_cached
+
+        def sync_call(args, kwargs):
+            try:
+                result = func(*args, **kwargs)
+                return Ok(result) if not isinstance(result, Result) else result
+            except Exception as e:
+                return Err(e)
+
+        def sync_refresh(cache_key, args, kwargs):
+            try:
+                result_cache.put(name, cache_key, sync_call(args, kwargs), *lifetimes)
+            finally:
+                result_cache._settle(name, cache_key)
+
+        @wraps(func)
+        def sync_cached(*args, **kwargs):
+            cache_key, entry, fresh = lookup(args, kwargs)
+            if cache_key is None:
+                return sync_call(args, kwargs)
+            if fresh:
+                result_cache._count(name, "hits")
+                return entry.result
+            if entry is not None and revalidating(entry):
+                result_cache._count(name, "stale")
+                if result_cache._claim(name, cache_key):
+                    threading.Thread(
+                        target=sync_refresh,
+                        args=(cache_key, args, kwargs),
+                        name="resilient-cache",
+                        daemon=True,
+                    ).start()
+                return entry.result
+            return settle(cache_key, entry, sync_call(args, kwargs))
+
+        sync_cached.invalidate = partial(result_cache.invalidate, name)
+        return sync_cached
+
+    return decorator
@@ -1,95 +1,277 @@
 """Circuit breaker for runaway protection."""
 
 import asyncio
-import time
-from collections import defaultdict
+import threading
+from collections import deque
 from functools import wraps
-from typing import Dict
+from typing import TYPE_CHECKING, Optional
 
-from .defaults import CIRCUIT_FAILURES, CIRCUIT_WINDOW
+from . import clock
+from .defaults import (
+    CIRCUIT_FAILURES,
+    CIRCUIT_PROBES,
+    CIRCUIT_WINDOW,
+    REGISTRY_IDLE,
+    REGISTRY_MAX_KEYS,
+)
+from .errors import REJECTIONS, CircuitError
+from .hooks import hooks
+from .metrics import CIRCUIT_OPENS, metrics
+from .registry import Registry, sharded, unsharded
+from .result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from .policies import Backoff
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _State:
+    """Per-key breaker state."""
+
+    __slots__ = ("state", "fails", "until", "trips", "probing")
+
+    def __init__(self, failures: int):
+        self.state = CLOSED
+        self.fails = deque(maxlen=failures)
+        self.until = 0.0
+        self.trips = 0
+        self.probing = 0
 
 
 class CircuitBreaker:
-    """Minimal circuit breaker for runaway protection."""
+    """Closed/open/half-open circuit breaker for runaway protection.
+
+    Closed: each key keeps only its last `failures` timestamps in a ring
+    buffer and trips once the oldest of them is inside the window - O(1)
+    with constant memory per key.
+    Open: calls are rejected until the open duration elapses - `window`,
+    or `backoff.calculate(trips)` so repeat trips stay open longer.
+    Half-open: `probes` concurrent calls are admitted, the rest rejected.
+    A probe success closes the circuit, a probe failure re-opens it.
 
-    def __init__(self):
-        self._failures: Dict[str, list] = defaultdict(list)
+    Keys live in a bounded `Registry` - an evicted key comes back closed.
+    Transitions and probe admission are locked, so threads racing at the
+    reopen instant admit at most `probes` calls; closed calls take no lock.
+    """
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = REGISTRY_MAX_KEYS,
+        idle: Optional[float] = REGISTRY_IDLE,
+    ):
+        self.keys = Registry(max_keys, idle)
+        # Guards state transitions and probe counts - closed calls skip it
+        self._lock = threading.Lock()
+
+    def state(self, func_name: str) -> str:
+        """Current state for this function - closed, open or half_open."""
+        circuit = self.keys.get(func_name)
+        if circuit is None:
+            return CLOSED
+        if circuit.state == OPEN and clock.now() >= circuit.until:
+            return HALF_OPEN
+        return circuit.state
+
+    def is_open(
+        self,
+        func_name: str,
+        failures: int,
+        window: int,
+        probes: int = CIRCUIT_PROBES,
+    ) -> bool:
+        """Check if a call should be rejected, admitting half-open probes."""
+        circuit = self.keys.get(func_name)
+        if circuit is None or circuit.state == CLOSED:
+            return False
 
-    def is_open(self, func_name: str, failures: int, window: int) -> bool:
-        """Check if circuit is open (too many failures)."""
-        now = time.time()
-        fails = self._failures[func_name]
+        transition = False
+        with self._lock:
+            if circuit.state == CLOSED:
+                return False
+            if circuit.state == OPEN:
+                if clock.now() < circuit.until:
+                    return True
+                circuit.state = HALF_OPEN
+                circuit.probing = 0
+                transition = True
+            rejected = circuit.probing >= probes
+            if not rejected:
+                circuit.probing += 1
+        if transition and hooks.active:
+            hooks.circuit_transition(func_name, OPEN, HALF_OPEN)
+        return rejected
 
-        # Remove old failures outside time window
-        self._failures[func_name] = [f for f in fails if now - f < window]
+    def record_failure(
+        self,
+        func_name: str,
+        failures: int = CIRCUIT_FAILURES,
+        window: int = CIRCUIT_WINDOW,
+        backoff: Optional["Backoff"] = None,
+    ) -> None:
+        """Record a failure - trips the circuit at the threshold or on a probe."""
+        circuit = self.keys.get(func_name)
+        if circuit is None:
+            circuit = _State(failures)
+            self.keys.put(func_name, circuit)
+        elif circuit.fails.maxlen != failures:
+            circuit.fails = deque(circuit.fails, maxlen=failures)
 
-        return len(self._failures[func_name]) >= failures
+        with self._lock:
+            now = clock.now()
+            old = circuit.state
+            if old == CLOSED:
+                fails = circuit.fails
+                fails.append(now)
+                if len(fails) < failures or now - fails[-failures] >= window:
+                    return
+            elif old == OPEN:
+                return  # Late result from a call admitted before the trip
 
-    def record_failure(self, func_name: str) -> None:
-        """Record a failure for this function."""
-        self._failures[func_name].append(time.time())
+            # Trip: closed past threshold, or a half-open probe failed
+            circuit.state = OPEN
+            circuit.until = now + (
+                backoff.calculate(circuit.trips) if backoff else window
+            )
+            circuit.trips += 1
+            circuit.probing = 0
+            circuit.fails.clear()
+        if hooks.active:
+            hooks.circuit_transition(func_name, old, OPEN)
+        if metrics.enabled:
+            metrics.count(CIRCUIT_OPENS, unsharded(func_name))
 
     def record_success(self, func_name: str) -> None:
-        """Record a success and reset failures."""
-        self._failures[func_name] = []
+        """Record a success - closes a half-open circuit."""
+        circuit = self.keys.get(func_name)
+        if circuit is None:
+            return
+        if circuit.state != CLOSED:
+            with self._lock:
+                old = circuit.state
+                if old == OPEN:
+                    return  # Late result from a call admitted before the trip
+                circuit.state = CLOSED
+                circuit.trips = 0
+                circuit.probing = 0
+                circuit.fails.clear()
+            if old != CLOSED and hooks.active:
+                hooks.circuit_transition(func_name, old, CLOSED)
+        elif circuit.fails:
+            circuit.fails.clear()
+
+    def release(self, func_name: str) -> None:
+        """Free a probe slot for a call that ended without a result."""
+        circuit = self.keys.get(func_name)
+        if circuit is not None and circuit.probing:
+            with self._lock:
+                if circuit.probing:
+                    circuit.probing -= 1
 
 
 # Global instance
 circuit_breaker = CircuitBreaker()
 
 
-def circuit(failures: int = CIRCUIT_FAILURES, window: int = CIRCUIT_WINDOW):
+def _tag(wrapper, func, func_name: str, shard=None):
+    """List the circuits a wrapper passes through, so callers such as
+    fallback() can skip it while one is open without calling it."""
+    wrapper.__circuits__ = getattr(func, "__circuits__", ()) + (
+        (circuit_breaker, func_name, shard),
+    )
+    return wrapper
+
+
+def circuit(
+    failures: int = CIRCUIT_FAILURES,
+    window: int = CIRCUIT_WINDOW,
+    probes: int = CIRCUIT_PROBES,
+    backoff: Optional["Backoff"] = None,
+    key: str = None,
+    key_func=None,
+):
     """3 failures circuit breaker - reasonable everywhere.
 
     On success: returns Ok(result)
     On failure: records failure and returns Err(exception)
     Circuit open: returns Err(CircuitError)
+
+    A returned Err(Exception) - such as an inner timeout's Err(TimeoutError)
+    - counts as a failure too; Err("value") errors count as successes.
+
+    After `window` seconds open (or `backoff.calculate(trips)` when given),
+    `probes` concurrent calls test recovery while the rest are rejected.
+
+    `key_func(*args, **kwargs)` gives each host, tenant or shard its own
+    circuit, so one bad partition doesn't trip it for every caller.
     """
 
+    def _settle(name, result):
+        """Record func's outcome - a returned Err(Exception) is a failure."""
+        if not isinstance(result, Result):
+            circuit_breaker.record_success(name)
+            return Ok(result)
+        error = result._error
+        if isinstance(error, REJECTIONS):
+            # Shed by an inner mechanism - says nothing about the backend
+            circuit_breaker.release(name)
+        elif isinstance(error, Exception):
+            circuit_breaker.record_failure(name, failures, window, backoff)
+        else:
+            circuit_breaker.record_success(name)
+        return result
+
     def decorator(func):
-        func_name = f"{func.__module__}.{func.__qualname__}"
+        func_name = key or f"{func.__module__}.{func.__qualname__}"
+        shard = None if key_func is None else sharded(func_name, key_func)
         is_async = asyncio.iscoroutinefunction(func)
 
         if is_async:
 
             @wraps(func)
             async def async_circuit_protected(*args, **kwargs):
-                from .result import Err, Ok, Result
-
+                try:
+                    name = func_name if shard is None else shard(args, kwargs)
+                except Exception as e:
+                    return Err(e)
                 # Check if circuit is open
-                if circuit_breaker.is_open(func_name, failures, window):
-                    from .errors import CircuitError
-
+                if circuit_breaker.is_open(name, failures, window, probes):
                     return Err(CircuitError("Circuit breaker open"))
 
                 try:
                     result = await func(*args, **kwargs)
-                    circuit_breaker.record_success(func_name)
-                    return Ok(result) if not isinstance(result, Result) else result
                 except Exception as e:
-                    circuit_breaker.record_failure(func_name)
+                    circuit_breaker.record_failure(name, failures, window, backoff)
                     return Err(e)
+                except BaseException:
+                    circuit_breaker.release(name)
+                    raise
+                return _settle(name, result)
 
-            return async_circuit_protected
+            return _tag(async_circuit_protected, func, func_name, shard)
 
         @wraps(func)
         def sync_circuit_protected(*args, **kwargs):
-            from .result import Err, Ok, Result
-
+            try:
+                name = func_name if shard is None else shard(args, kwargs)
+            except Exception as e:
+                return Err(e)
             # Check if circuit is open
-            if circuit_breaker.is_open(func_name, failures, window):
-                from .errors import CircuitError
-
+            if circuit_breaker.is_open(name, failures, window, probes):
                 return Err(CircuitError("Circuit breaker open"))
 
             try:
                 result = func(*args, **kwargs)
-                circuit_breaker.record_success(func_name)
-                return Ok(result) if not isinstance(result, Result) else result
             except Exception as e:
-                circuit_breaker.record_failure(func_name)
+                circuit_breaker.record_failure(name, failures, window, backoff)
                 return Err(e)
+            except BaseException:
+                circuit_breaker.release(name)
+                raise
+            return _settle(name, result)
 
-        return sync_circuit_protected
+        return _tag(sync_circuit_protected, func, func_name, shard)
 
     return decorator
@@ -0,0 +1,144 @@
+"""Clocks - monotonic by default, virtual for tests."""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Optional
+
+# Quiet loop passes before a virtual sleeper jumps the clock
+_SETTLE = 3
+
+
+class Clock:
+    """Monotonic system clock - immune to wall-clock jumps."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    async def sleep_async(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    async def wait_for(self, awaitable, timeout: float):
+        return await asyncio.wait_for(awaitable, timeout)
+
+
+class VirtualClock(Clock):
+    """Simulated time for tests - sleeps return at once and move the clock.
+
+    Async sleepers wake in deadline order: each waits until it is the
+    earliest pending sleeper and the queue has settled, then jumps the
+    clock to its wake time, so simulated hours of backoff run in
+    microseconds. Time also moves on advance(). Real I/O still takes real
+    time; only clock sleeps jump.
+
+    Starts at the current clock's time unless `start` is given, so state
+    recorded before set_clock() - an open circuit's reopen time, a bucket's
+    next slot - stays on the same timebase.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self._now = _clock.now() if start is None else start
+        self._sleepers = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._changes = 0
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by seconds."""
+        with self._lock:
+            self._now += seconds
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(max(0.0, seconds))
+
+    async def sleep_async(self, seconds: float) -> None:
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+
+        sleeper = (self._now + seconds, next(self._order))
+        heapq.heappush(self._sleepers, sleeper)
+        self._changes += 1
+        try:
+            # Jump only once the queue has stayed put for a few loop passes,
+            # so tasks woken by the last jump can queue or cancel sleeps first
+            seen, quiet = None, 0
+            while True:
+                await asyncio.sleep(0)
+                if self._sleepers[0] is not sleeper:
+                    continue
+                if sleeper[0] <= self._now:
+                    break
+                if self._changes == seen:
+                    quiet += 1
+                    if quiet >= _SETTLE:
+                        break
+                else:
+                    seen, quiet = self._changes, 0
+        except BaseException:
+            self._sleepers.remove(sleeper)
+            heapq.heapify(self._sleepers)
+            self._changes += 1
+            raise
+        heapq.heappop(self._sleepers)
+        self._changes += 1
+        with self._lock:
+            self._now = max(self._now, sleeper[0])
+
+    async def wait_for(self, awaitable, timeout: float):
+        task = asyncio.ensure_future(awaitable)
+        timer = asyncio.ensure_future(self.sleep_async(timeout))
+        try:
+            await asyncio.wait((task, timer), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            timer.cancel()
+            if not task.done():
+                task.cancel()
+        if task.done() and not task.cancelled():
+            return task.result()
+        raise asyncio.TimeoutError
+
+
+_clock = Clock()
+
+
+def get_clock() -> Clock:
+    """The clock every mechanism reads."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Swap the clock every mechanism reads - returns the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def now() -> float:
+    return _clock.now()
+
+
+def sleep(seconds: float) -> None:
+    _clock.sleep(seconds)
+
+
+async def sleep_async(seconds: float) -> None:
+    await _clock.sleep_async(seconds)
+
+
+async def wait_for(awaitable, timeout: float):
+    return await _clock.wait_for(awaitable, timeout)
+
+
+def overran(start: float, limit: float) -> bool:
+    """Simulated time passed limit during a sync call - it can't be cut short
+    like a real one, so the result is discarded afterwards instead."""
+    return isinstance(_clock, VirtualClock) and _clock.now() - start > limit
@@ -0,0 +1,172 @@
+"""Request coalescing - one in-flight execution per argument key."""
+
+import asyncio
+import threading
+from functools import partial, wraps
+from typing import Dict
+
+from .registry import arguments
+from .result import Err, Ok, Result
+
+
+class _Flight:
+    """One shared execution and the callers waiting on it."""
+
+    __slots__ = ("loop", "task", "done", "result", "waiters")
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.task = None
+        self.done = None
+        self.result = None
+        self.waiters = 0
+
+
+class Coalescer:
+    """Singleflight registry - concurrent identical calls share one Result.
+
+    Async flights run as a task on the caller's loop and every caller awaits
+    it shielded, so one caller's cancellation doesn't fail the others; the
+    task is only cancelled once every caller has gone. Sync flights run in
+    the first caller's thread while the rest block on an event. A flight
+    ends when its call does - nothing is cached afterwards.
+    """
+
+    def __init__(self):
+        self._flights: Dict[tuple, _Flight] = {}
+        self._counts: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, executed: bool) -> None:
+        """Count a call - lock held."""
+        counts = self._counts.get(name)
+        if counts is None:
+            counts = self._counts[name] = [0, 0]
+        counts[0] += 1
+        counts[1] += executed
+
+    def _land(self, key: tuple, flight: _Flight, task=None) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    async def run(self, name: str, key, call) -> Result:
+        """Join the flight for key or start one with call()."""
+        loop = asyncio.get_running_loop()
+        flight_key = (name, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None or flight.loop is not loop
+            self._count(name, leader)
+            if leader:
+                flight = self._flights[flight_key] = _Flight(loop)
+                flight.task = loop.create_task(call())
+                flight.task.add_done_callback(partial(self._land, flight_key, flight))
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0
+                # Nobody left - later callers must not join a dying flight
+                if abandoned and self._flights.get(flight_key) is flight:
+                    del self._flights[flight_key]
+            if abandoned:
+                flight.task.cancel()
+            raise
+
+    def run_sync(self, name: str, key, call) -> Result:
+        """Wait for the flight for key or run call() as its leader."""
+        flight_key = (name, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None or flight.loop is not None
+            self._count(name, leader)
+            if leader:
+                flight = self._flights[flight_key] = _Flight(None)
+                flight.done = threading.Event()
+
+        if not leader:
+            flight.done.wait()
+            # The leader died with a BaseException - run our own call
+            return flight.result if flight.result is not None else call()
+
+        try:
+            flight.result = call()
+        finally:
+            self._land(flight_key, flight)
+            flight.done.set()
+        return flight.result
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """Calls, executions and the share of calls that were deduplicated."""
+        with self._lock:
+            calls, executions = self._counts.get(name, (0, 0))
+        return {
+            "calls": calls,
+            "executions": executions,
+            "dedup_ratio": 1 - executions / calls if calls else 0.0,
+        }
+
+
+# Global instance
+coalescer = Coalescer()
+
+
+def coalesce(key_func=None, key: str = None):
+    """Concurrent calls with equal arguments share one execution.
+
+    `key_func(*args, **kwargs)` picks what counts as equal - the arguments
+    themselves by default. Calls whose key isn't hashable run on their own.
+    Every caller gets the same Ok(result) or Err(exception).
+    """
+    key_func = key_func or arguments
+
+    def decorator(func):
+        name = key or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+
+            async def call(args, kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                    return Ok(result) if not isinstance(result, Result) else result
+                except Exception as e:
+                    return Err(e)
+
+            @wraps(func)
+            async def async_coalesced(*args, **kwargs):
+                try:
+                    flight_key = key_func(*args, **kwargs)
+                    hash(flight_key)
+                except TypeError:
+                    return await call(args, kwargs)
+                return await coalescer.run(
+                    name, flight_key, partial(call, args, kwargs)
+                )
+
+            return async_coalesced
+
+        def sync_call(args, kwargs):
+            try:
+                result = func(*args, **kwargs)
+                return Ok(result) if not isinstance(result, Result) else result
+            except Exception as e:
+                return Err(e)
+
+        @wraps(func)
+        def sync_coalesced(*args, **kwargs):
+            try:
+                flight_key = key_func(*args, **kwargs)
+                hash(flight_key)
+            except TypeError:
+                return sync_call(args, kwargs)
+            return coalescer.run_sync(
+                name, flight_key, partial(sync_call, args, kwargs)
+            )
+
+        return sync_coalesced
+
+    return decorator
@@ -0,0 +1,80 @@
+"""Deadline propagation - nested calls share the tightest time budget."""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+
+from . import clock
+
+# Absolute clock deadline for the current context, if any
+_deadline: contextvars.ContextVar = contextvars.ContextVar(
+    "resilient_result_deadline", default=None
+)
+
+# Seconds allowed per attempt or nested timeout - timeout(operation=...)
+_operation: contextvars.ContextVar = contextvars.ContextVar(
+    "resilient_result_operation", default=None
+)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline - None without one."""
+    at = _deadline.get()
+    return None if at is None else at - clock.now()
+
+
+def attempt_limit() -> Optional[float]:
+    """Per-attempt ceiling set by an enclosing timeout(operation=...)."""
+    return _operation.get()
+
+
+def clamp(seconds: float) -> float:
+    """Cut seconds down to the attempt ceiling and what the deadline leaves."""
+    ceiling = _operation.get()
+    if ceiling is not None and ceiling < seconds:
+        seconds = ceiling
+    left = remaining()
+    if left is None or seconds < left:
+        return seconds
+    return max(0.0, left)
+
+
+def enter(seconds: float) -> contextvars.Token:
+    """Set the deadline `seconds` from now - clamp() first, reset the token."""
+    return _deadline.set(clock.now() + seconds)
+
+
+def leave(token: contextvars.Token) -> None:
+    """Restore the deadline from before enter()."""
+    _deadline.reset(token)
+
+
+def enter_attempts(seconds: float) -> contextvars.Token:
+    """Cap each nested attempt at seconds, or the tighter enclosing cap."""
+    ceiling = _operation.get()
+    return _operation.set(seconds if ceiling is None else min(seconds, ceiling))
+
+
+def leave_attempts(token: contextvars.Token) -> None:
+    """Restore the attempt cap from before enter_attempts()."""
+    _operation.reset(token)
+
+
+def exceeded(error_type: type, seconds: float, limit: float) -> Exception:
+    """Timeout error - names the outer deadline when it cut `seconds` short."""
+    if limit < seconds:
+        return error_type("Deadline exceeded")
+    return error_type(f"Timeout after {seconds}s")
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Bound everything inside - timeouts clamp to it, retries stop at it.
+
+    Works in sync and async code; threads started by `timeout` inherit it.
+    """
+    token = enter(clamp(seconds))
+    try:
+        yield
+    finally:
+        leave(token)
@@ -4,15 +4,55 @@
 RETRY_ATTEMPTS = 2
 RETRY_BACKOFF = 1.0
 
+# Retry budget defaults
+BUDGET_RATIO = 0.2  # Retries may add up to 20% on top of requests
+BUDGET_WINDOW = 10.0  # Sliding window in seconds
+BUDGET_MIN_RETRIES = 10  # Always allowed per window, for low traffic
+
 # Backoff defaults
 BACKOFF_JITTER = True  # Prevent thundering herd by default
 
 # Circuit breaker defaults
 CIRCUIT_FAILURES = 3
 CIRCUIT_WINDOW = 60  # 1 minute
+CIRCUIT_PROBES = 1  # Concurrent calls admitted while half-open
 
 # Timeout default
 TIMEOUT_SECONDS = 30.0
+TIMEOUT_WORKERS = 32  # Thread pool bound for sync timeouts
+
+# Bulkhead defaults
+BULKHEAD_MAX_CONCURRENT = 10
+BULKHEAD_QUEUE_SIZE = 100
+
+# Adaptive concurrency defaults
+ADAPTIVE_INITIAL = 10
+ADAPTIVE_MIN = 1
+ADAPTIVE_MAX = 200
+ADAPTIVE_BACKOFF = 0.9  # Multiplicative decrease on a drop
+ADAPTIVE_TOLERANCE = 1.5  # Gradient backs off above 1.5x the no-load RTT
+ADAPTIVE_SMOOTHING = 0.2  # Gradient moves 20% towards its target per round trip
+ADAPTIVE_WINDOW = 100  # Round trips in the RTT average, calls in the error rate
+
+# Cache defaults
+CACHE_TTL = 60.0  # Seconds an Ok result stays fresh
+CACHE_MAXSIZE = 1024  # Entries per function, least recently used evicted
+
+# Fallback defaults
+FALLBACK_STAGGER = 0.1  # Seconds before racing the next provider
+
+# Hedge defaults
+HEDGE_ATTEMPTS = 2  # Original call plus one hedge
+HEDGE_PERCENTILE = 0.95  # Hedge once a call is slower than this share of calls
+HEDGE_DELAY = 0.1  # Hedge delay until enough latencies are tracked
+HEDGE_RATIO = 0.1  # Hedges may add up to 10% on top of requests
+
+# Metrics defaults - latency histogram bucket bounds in seconds
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Registry defaults - per-key state in circuits, rate limits, budgets, hedging
+REGISTRY_MAX_KEYS = 100_000  # Keys per registry, least recently used evicted
+REGISTRY_IDLE = 3600.0  # Seconds unused before a key's state is dropped
 
 # Rate limit default
 RATE_LIMIT_RPS = 100.0
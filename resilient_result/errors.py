@@ -1,12 +1,26 @@
 """Mechanism-focused error types for resilience patterns."""
 
 
+class BulkheadError(Exception):
+    """Bulkhead queue is full or the wait for a slot timed out."""
+
+    pass
+
+
 class CircuitError(Exception):
     """Circuit breaker is open."""
 
     pass
 
 
+class FallbackError(Exception):
+    """Every provider in a fallback chain failed - errors in call order."""
+
+    def __init__(self, errors: list):
+        super().__init__(f"All {len(errors)} providers failed: {errors!r}")
+        self.errors = errors
+
+
 class RateLimitError(Exception):
     """Rate limit exceeded."""
 
@@ -17,3 +31,7 @@ class RetryError(Exception):
     """Max retry attempts exhausted."""
 
     pass
+
+
+# Load shed by another mechanism - retrying would send it straight back
+REJECTIONS = (BulkheadError, CircuitError, RateLimitError)
@@ -0,0 +1,136 @@
+"""Fallback chains - alternative providers, in turn or staggered."""
+
+import asyncio
+from functools import wraps
+
+from .circuit import OPEN
+from .defaults import FALLBACK_STAGGER
+from .errors import CircuitError, FallbackError
+from .result import Err, Ok, Result
+
+SEQUENTIAL = "sequential"
+PARALLEL = "parallel"
+
+
+def _open(provider, args: tuple, kwargs: dict) -> bool:
+    """True if a circuit the provider would pass through for args is open."""
+    for breaker, name, shard in getattr(provider, "__circuits__", ()):
+        if shard is not None:
+            try:
+                name = shard(args, kwargs)
+            except Exception:
+                continue  # The provider's own wrapper returns the Err
+        if breaker.state(name) == OPEN:
+            return True
+    return False
+
+
+async def _attempt(provider, args, kwargs) -> Result:
+    try:
+        result = await provider(*args, **kwargs)
+    except Exception as e:
+        return Err(e)
+    return Ok(result) if not isinstance(result, Result) else result.flatten()
+
+
+def _attempt_sync(provider, args, kwargs) -> Result:
+    try:
+        result = provider(*args, **kwargs)
+    except Exception as e:
+        return Err(e)
+    return Ok(result) if not isinstance(result, Result) else result.flatten()
+
+
+def fallback(providers, mode: str = SEQUENTIAL, stagger: float = FALLBACK_STAGGER):
+    """Try the decorated function, then each provider with the same arguments.
+
+    mode="sequential" calls the next provider once the previous returns
+    Err; mode="parallel" also starts it after `stagger` seconds, returns the
+    first Ok and cancels the rest. Providers whose circuit is open are
+    skipped without being called. If every provider fails, returns
+    Err(FallbackError) with their errors in chain order. Sync functions
+    always run sequentially.
+    """
+    if mode not in (SEQUENTIAL, PARALLEL):
+        raise ValueError(f"Unknown fallback mode: {mode!r}")
+
+    def decorator(func):
+        chain = (func, *providers)
+
+        if asyncio.iscoroutinefunction(func):
+
+            async def sequential(args, kwargs):
+                errors = []
+                for provider in chain:
+                    if _open(provider, args, kwargs):
+                        errors.append(CircuitError("Circuit breaker open"))
+                        continue
+                    result = await _attempt(provider, args, kwargs)
+                    if result._error is None:
+                        return result
+                    errors.append(result._error)
+                return Err(FallbackError(errors))
+
+            async def parallel(args, kwargs):
+                errors = [None] * len(chain)
+                waiting = iter(range(len(chain)))
+                pending = {}
+
+                def launch() -> bool:
+                    """Start the next provider whose circuit isn't open."""
+                    for index in waiting:
+                        if _open(chain[index], args, kwargs):
+                            errors[index] = CircuitError("Circuit breaker open")
+                            continue
+                        task = asyncio.ensure_future(
+                            _attempt(chain[index], args, kwargs)
+                        )
+                        pending[task] = index
+                        return True
+                    return False
+
+                exhausted = not launch()
+                try:
+                    while pending:
+                        done, _ = await asyncio.wait(
+                            pending,
+                            timeout=None if exhausted else stagger,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        for task in done:
+                            result = task.result()
+                            if result._error is None:
+                                return result
+                            errors[pending.pop(task)] = result._error
+                        # Slower than stagger, or failed - bring in the next one
+                        if not exhausted:
+                            exhausted = not launch()
+                    return Err(FallbackError(errors))
+                finally:
+                    for task in pending:
+                        task.cancel()
+
+            run = parallel if mode == PARALLEL else sequential
+
+            @wraps(func)
+            async def async_fallback(*args, **kwargs):
+                return await run(args, kwargs)
+
+            return async_fallback
+
+        @wraps(func)
+        def sync_fallback(*args, **kwargs):
+            errors = []
+            for provider in chain:
+                if _open(provider, args, kwargs):
+                    errors.append(CircuitError("Circuit breaker open"))
+                    continue
+                result = _attempt_sync(provider, args, kwargs)
+                if result._error is None:
+                    return result
+                errors.append(result._error)
+            return Err(FallbackError(errors))
+
+        return sync_fallback
+
+    return decorator
@@ -0,0 +1,193 @@
+"""Hedged requests - duplicate slow calls to cut tail latency."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import TYPE_CHECKING, Deque, Optional
+
+from . import clock
+from .budget import RetryBudget
+from .defaults import (
+    HEDGE_ATTEMPTS,
+    HEDGE_DELAY,
+    HEDGE_PERCENTILE,
+    HEDGE_RATIO,
+    REGISTRY_IDLE,
+    REGISTRY_MAX_KEYS,
+)
+from .registry import Registry
+from .result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from .policies import Backoff, Budget
+
+SAMPLES = 128  # Latencies kept per key
+REFRESH = 16  # Recompute the percentile every N samples
+
+
+class _Latencies:
+    """Recent latencies for one key with a cached percentile."""
+
+    __slots__ = ("samples", "fresh", "cached", "percentile")
+
+    def __init__(self):
+        self.samples: Deque[float] = deque(maxlen=SAMPLES)
+        self.fresh = 0
+        self.cached: Optional[float] = None
+        self.percentile = None
+
+
+class LatencyTracker:
+    """Per-key latency percentiles over the last SAMPLES calls.
+
+    The percentile is recomputed every REFRESH samples rather than per
+    call, so recording stays O(1) amortized. Keys live in a bounded
+    `Registry`.
+    """
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = REGISTRY_MAX_KEYS,
+        idle: Optional[float] = REGISTRY_IDLE,
+    ):
+        self.keys = Registry(max_keys, idle)
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """Record one call latency for key."""
+        with self._lock:
+            latencies = self.keys.get(key)
+            if latencies is None:
+                latencies = _Latencies()
+                self.keys.put(key, latencies)
+            latencies.samples.append(seconds)
+            latencies.fresh += 1
+
+    def percentile(self, key: str, percentile: float) -> Optional[float]:
+        """Latency at percentile for key - None until REFRESH samples exist."""
+        with self._lock:
+            latencies = self.keys.get(key)
+            if latencies is None or len(latencies.samples) < REFRESH:
+                return None
+            if latencies.fresh >= REFRESH or latencies.percentile != percentile:
+                ordered = sorted(latencies.samples)
+                index = min(len(ordered) - 1, int(percentile * len(ordered)))
+                latencies.cached = ordered[index]
+                latencies.percentile = percentile
+                latencies.fresh = 0
+            return latencies.cached
+
+
+# Global instances
+latency_tracker = LatencyTracker()
+hedge_budget = RetryBudget()
+
+
+def hedge(
+    attempts: int = HEDGE_ATTEMPTS,
+    backoff: Optional["Backoff"] = None,
+    percentile: float = HEDGE_PERCENTILE,
+    budget: Optional["Budget"] = None,
+    key: str = None,
+):
+    """1 hedge at the p95 latency, 10% budget - reasonable everywhere.
+
+    Starts a duplicate call whenever the in-flight ones are slower than
+    the function's tracked `percentile` latency (or `backoff.calculate(n)`
+    for hedge n), returns the first Ok and cancels the rest. Cancelled
+    attempts are tracked at the time they ran, so hedging doesn't skew the
+    percentile towards the calls that won. Hedges spend
+    from a per-key budget so a slow backend isn't flooded with duplicates;
+    `budget.key` shares that budget across functions, while latency stays
+    tracked per function (or `key`).
+    Sync functions can't be hedged without threads - they run once.
+    """
+    from .policies import Budget
+
+    if budget is None:
+        budget = Budget(ratio=HEDGE_RATIO)
+
+    def decorator(func):
+        func_key = key or f"{func.__module__}.{func.__qualname__}"
+        budget_key = budget.key or func_key
+
+        def _delay(hedges: int) -> float:
+            """Seconds to wait before launching hedge number `hedges`."""
+            if backoff is not None:
+                return backoff.calculate(hedges - 1)
+            tracked = latency_tracker.percentile(func_key, percentile)
+            return HEDGE_DELAY if tracked is None else tracked
+
+        if asyncio.iscoroutinefunction(func):
+
+            async def attempt(args, kwargs):
+                start = clock.now()
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    # Hedged and lost - it took at least this long, and
+                    # dropping it would pull the percentile down
+                    latency_tracker.record(func_key, clock.now() - start)
+                    raise
+                except Exception as e:
+                    return Err(e)
+                latency_tracker.record(func_key, clock.now() - start)
+                return (
+                    Ok(result) if not isinstance(result, Result) else result.flatten()
+                )
+
+            @wraps(func)
+            async def async_hedged(*args, **kwargs):
+                hedge_budget.record_request(budget_key, budget.window)
+                pending = {asyncio.ensure_future(attempt(args, kwargs))}
+                launched = 1
+                # Launch times follow asyncio.wait's timeouts, so loop time
+                next_at = time.monotonic() + _delay(launched)
+                result = None
+                try:
+                    while pending:
+                        wait = None
+                        if launched < attempts:
+                            wait = max(0.0, next_at - time.monotonic())
+                        done, pending = await asyncio.wait(
+                            pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                        )
+
+                        for task in done:
+                            result = task.result()
+                            if result._error is None:
+                                return result
+
+                        if not done:
+                            # Slower than expected - hedge if the budget allows
+                            if not hedge_budget.try_retry(
+                                budget_key,
+                                budget.ratio,
+                                budget.window,
+                                budget.min_retries,
+                            ):
+                                launched = attempts
+                                continue
+                            pending.add(asyncio.ensure_future(attempt(args, kwargs)))
+                            launched += 1
+                            next_at = time.monotonic() + _delay(launched)
+                    return result
+                finally:
+                    for task in pending:
+                        task.cancel()
+
+            return async_hedged
+
+        @wraps(func)
+        def sync_hedged(*args, **kwargs):
+            try:
+                result = func(*args, **kwargs)
+                return Ok(result) if not isinstance(result, Result) else result
+            except Exception as e:
+                return Err(e)
+
+        return sync_hedged
+
+    return decorator
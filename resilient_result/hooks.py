@@ -0,0 +1,100 @@
+"""Tracing hooks - callbacks at attempt, retry, circuit and rate limit events."""
+
+import logging
+from typing import List
+
+logger = logging.getLogger("resilient_result")
+
+
+class Hook:
+    """Base tracing hook - override the events you care about.
+
+    `name` is the retried function's name; `key` is a circuit or rate limit
+    key, a (name, partition) tuple for partitioned ones. Whatever
+    on_attempt_start returns comes back to on_attempt_end as `token`, so a
+    hook can open a span per attempt and close it with the result.
+    """
+
+    def on_attempt_start(self, name: str, attempt: int):
+        return None
+
+    def on_attempt_end(self, name: str, attempt: int, result, token) -> None:
+        pass
+
+    def on_retry_sleep(self, name: str, attempt: int, delay: float, error) -> None:
+        pass
+
+    def on_circuit_transition(self, key, old: str, new: str) -> None:
+        pass
+
+    def on_rate_limit_wait(self, key, delay: float) -> None:
+        pass
+
+
+class Hooks:
+    """Registered hooks and the dispatch every mechanism calls.
+
+    Mechanisms check `active` before dispatching, so with no hooks each
+    event costs one attribute lookup and allocates nothing. A hook that
+    raises is logged and skipped - tracing never fails a call.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._hooks: List[Hook] = []
+
+    def add(self, hook: Hook) -> Hook:
+        """Register hook - returns it, so it can be removed later."""
+        self._hooks = [*self._hooks, hook]
+        self.active = True
+        return hook
+
+    def remove(self, hook: Hook) -> None:
+        self._hooks = [h for h in self._hooks if h is not hook]
+        self.active = bool(self._hooks)
+
+    def clear(self) -> None:
+        self._hooks = []
+        self.active = False
+
+    def attempt_start(self, name: str, attempt: int) -> list:
+        """Start an attempt - returns each hook's token for attempt_end."""
+        tokens = []
+        for hook in self._hooks:
+            try:
+                tokens.append((hook, hook.on_attempt_start(name, attempt)))
+            except Exception:
+                logger.exception("Hook %r failed on attempt start", hook)
+        return tokens
+
+    def attempt_end(self, tokens: list, name: str, attempt: int, result) -> None:
+        for hook, token in tokens:
+            try:
+                hook.on_attempt_end(name, attempt, result, token)
+            except Exception:
+                logger.exception("Hook %r failed on attempt end", hook)
+
+    def retry_sleep(self, name: str, attempt: int, delay: float, error) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_retry_sleep(name, attempt, delay, error)
+            except Exception:
+                logger.exception("Hook %r failed on retry sleep", hook)
+
+    def circuit_transition(self, key, old: str, new: str) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_circuit_transition(key, old, new)
+            except Exception:
+                logger.exception("Hook %r failed on circuit transition", hook)
+
+    def rate_limit_wait(self, key, delay: float) -> None:
+        for hook in self._hooks:
+            try:
+                hook.on_rate_limit_wait(key, delay)
+            except Exception:
+                logger.exception("Hook %r failed on rate limit wait", hook)
+
+
+# Global instance
+hooks = Hooks()
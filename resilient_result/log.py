@@ -0,0 +1,97 @@
+"""Retry logging - lazy, guarded and sampled structured records."""
+
+import logging
+from typing import Optional
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+
+
+class RetryLog:
+    """Sink for retry events - the resilient_result logger by default.
+
+    Each event asks the logger whether its level is enabled before building
+    anything; the logger caches that answer per level and drops the cache
+    whenever levels change, so a disabled event costs one dict lookup and
+    never touches handlers, formats a message or looks up an error's type.
+
+    Records carry `function`, `attempt`, `attempts`, `delay` and
+    `error_type` attributes for structured handlers. `sample` keeps that
+    share of retry records (0.01 logs one in a hundred); recoveries and
+    give-ups are always logged. Subclass and override `emit` to send the
+    records somewhere other than `logging`.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, sample: float = 1.0):
+        self.logger = logger or logging.getLogger("resilient_result")
+        self.sample = sample
+        self._credit = 0.0
+
+    def _sampled(self) -> bool:
+        """Keep `sample` of calls, spread evenly."""
+        if self.sample >= 1.0:
+            return True
+        self._credit += self.sample
+        if self._credit < 1.0:
+            return False
+        self._credit -= 1.0
+        return True
+
+    def emit(self, level: int, msg: str, args: tuple, fields: dict) -> None:
+        """Write one record - fields become attributes on the LogRecord."""
+        self.logger.log(level, msg, *args, extra=fields)
+
+    def retrying(self, func, attempt: int, attempts: int, delay: float, error) -> None:
+        """About to sleep before attempt `attempt` (1-based) of `attempts`."""
+        if not self.logger.isEnabledFor(DEBUG) or not self._sampled():
+            return
+        error_type = type(error).__name__
+        self.emit(
+            DEBUG,
+            "Retrying %s (attempt %d/%d) after %s: waiting %.1fs",
+            (func.__name__, attempt, attempts, error_type, delay),
+            {
+                "function": func.__qualname__,
+                "attempt": attempt,
+                "attempts": attempts,
+                "delay": delay,
+                "error_type": error_type,
+            },
+        )
+
+    def recovered(self, func, attempts: int) -> None:
+        """Succeeded after `attempts` attempts."""
+        if not self.logger.isEnabledFor(INFO):
+            return
+        self.emit(
+            INFO,
+            "%s succeeded after %d attempts",
+            (func.__name__, attempts),
+            {"function": func.__qualname__, "attempt": attempts},
+        )
+
+    def budget_exhausted(self, func) -> None:
+        """Gave up because the retry budget is spent."""
+        if not self.logger.isEnabledFor(DEBUG):
+            return
+        self.emit(
+            DEBUG,
+            "Retry budget exhausted for %s",
+            (func.__name__,),
+            {"function": func.__qualname__},
+        )
+
+    def deadline_overrun(self, func, attempt: int, delay: float) -> None:
+        """Gave up because the backoff would overrun the deadline."""
+        if not self.logger.isEnabledFor(DEBUG):
+            return
+        self.emit(
+            DEBUG,
+            "Not retrying %s: %.1fs backoff overruns the deadline",
+            (func.__name__, delay),
+            {"function": func.__qualname__, "attempt": attempt, "delay": delay},
+        )
+
+
+# Global instance
+retry_log = RetryLog()
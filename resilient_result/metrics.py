@@ -0,0 +1,190 @@
+"""Metrics - counters and latency histograms recorded by every mechanism."""
+
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, List
+
+from .defaults import METRICS_BUCKETS
+
+# Counters
+ATTEMPTS = "attempts"
+SUCCESSES = "successes"
+FAILURES = "failures"
+TIMEOUTS = "timeouts"
+CIRCUIT_OPENS = "circuit_opens"
+RATE_LIMIT_WAITS = "rate_limit_waits"
+
+# Histograms
+CALL_SECONDS = "call_seconds"
+RATE_LIMIT_WAIT_SECONDS = "rate_limit_wait_seconds"
+
+
+class _Shard:
+    """One thread's counters and histograms - only that thread writes them."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        self.counters: Dict[tuple, float] = {}
+        self.histograms: Dict[tuple, List[float]] = {}
+
+
+class _Owner:
+    """Per-thread sentinel - collected when its thread exits."""
+
+
+def _label(key) -> str:
+    """Label value for a registry key - (name, partition) keys flattened."""
+    if isinstance(key, tuple):
+        return f"{key[0]}[{key[1]}]"
+    return str(key)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Per-key counters and histograms in lock-free per-thread shards.
+
+    Off until `enabled` is set - mechanisms check the flag before doing any
+    work, so disabled metrics cost one attribute lookup per call. Each
+    thread records into its own shard without locking; snapshot() sums
+    the shards. A thread's shard is folded into one retired shard when the
+    thread exits, so short-lived threads don't grow memory.
+    """
+
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.enabled = False
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        # Shards of exited threads are merged into the first one
+        self._retired = _Shard()
+        self._shards: List[_Shard] = [self._retired]
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            # Dropped with the thread's locals when it exits
+            self._local.owner = owner = _Owner()
+            weakref.finalize(owner, self._retire, shard)
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold an exited thread's shard into the retired totals."""
+        with self._lock:
+            self._shards.remove(shard)
+            counters = self._retired.counters
+            for index, value in shard.counters.items():
+                counters[index] = counters.get(index, 0) + value
+            histograms = self._retired.histograms
+            for index, counts in shard.histograms.items():
+                total = histograms.get(index)
+                if total is None:
+                    histograms[index] = counts
+                else:
+                    for i, count in enumerate(counts):
+                        total[i] += count
+
+    def count(self, name: str, key, amount: float = 1) -> None:
+        """Add amount to the name counter for key."""
+        counters = self._shard().counters
+        index = (name, key)
+        counters[index] = counters.get(index, 0) + amount
+
+    def observe(self, name: str, key, seconds: float) -> None:
+        """Record one duration in the name histogram for key."""
+        self._observe(self._shard().histograms, (name, key), seconds)
+
+    def _observe(self, histograms: dict, index: tuple, seconds: float) -> None:
+        counts = histograms.get(index)
+        if counts is None:
+            # One count per bucket, then +Inf, then the running sum
+            counts = histograms[index] = [0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, seconds)] += 1
+        counts[-1] += seconds
+
+    def record_call(self, key, attempts: int, ok: bool, seconds: float) -> None:
+        """Record one retried call - its attempts, outcome and latency."""
+        shard = self._shard()
+        counters = shard.counters
+        index = (ATTEMPTS, key)
+        counters[index] = counters.get(index, 0) + attempts
+        index = (SUCCESSES if ok else FAILURES, key)
+        counters[index] = counters.get(index, 0) + 1
+        self._observe(shard.histograms, (CALL_SECONDS, key), seconds)
+
+    def timed_out(self, func) -> None:
+        """Count a timeout of func - off the hot path, so checks enabled itself."""
+        if self.enabled:
+            self.count(TIMEOUTS, f"{func.__module__}.{func.__qualname__}")
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Totals across threads - counters[name][key] and
+        histograms[name][key] with cumulative `buckets`, `count` and `sum`."""
+        with self._lock:
+            shards = list(self._shards)
+        counters: Dict[str, Dict] = {}
+        merged: Dict[tuple, List[float]] = {}
+        for shard in shards:
+            for (name, key), value in shard.counters.copy().items():
+                per_key = counters.setdefault(name, {})
+                per_key[key] = per_key.get(key, 0) + value
+            for index, counts in shard.histograms.copy().items():
+                total = merged.get(index)
+                if total is None:
+                    merged[index] = list(counts)
+                else:
+                    for i, count in enumerate(counts):
+                        total[i] += count
+
+        histograms: Dict[str, Dict] = {}
+        for (name, key), counts in merged.items():
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                cumulative[bound] = running
+            histograms.setdefault(name, {})[key] = {
+                "buckets": cumulative,
+                "count": running,
+                "sum": counts[-1],
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            for shard in self._shards:
+                shard.counters.clear()
+                shard.histograms.clear()
+
+    def prometheus(self, prefix: str = "resilient") -> str:
+        """Snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, per_key in sorted(snapshot["counters"].items()):
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for key, value in per_key.items():
+                lines.append(f'{metric}{{key="{_escape(_label(key))}"}} {value}')
+        for name, per_key in sorted(snapshot["histograms"].items()):
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for key, histogram in per_key.items():
+                label = f'key="{_escape(_label(key))}"'
+                for bound, count in histogram["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f'{metric}_bucket{{{label},le="{le}"}} {count}')
+                lines.append(f"{metric}_sum{{{label}}} {histogram['sum']}")
+                lines.append(f"{metric}_count{{{label}}} {histogram['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# Global instance
+metrics = Metrics()
@@ -0,0 +1,92 @@
+"""OpenTelemetry adapter - a span per retry attempt, events for the rest.
+
+Needs opentelemetry-api: pip install resilient-result[otel]
+
+    from resilient_result import hooks
+    from resilient_result.otel import OpenTelemetryHook
+
+    hooks.add(OpenTelemetryHook())
+"""
+
+from .hooks import Hook
+
+try:
+    from opentelemetry import context, trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # pragma: no cover - optional dependency
+    context = trace = None
+
+
+class OpenTelemetryHook(Hook):
+    """Spans for retry attempts, span events for everything else.
+
+    Each attempt gets a "<name> attempt" span with `resilient.attempt`,
+    marked as an error when the attempt returns Err. The span is current
+    while the attempt runs, so spans from instrumented clients inside it
+    become its children. Retry sleeps, circuit transitions and rate limit
+    waits fall between attempts and are added as events to whatever span
+    is current in the caller - usually the operation being retried.
+    """
+
+    def __init__(self, tracer=None):
+        if tracer is None:
+            if trace is None:
+                raise ImportError(
+                    "OpenTelemetryHook needs opentelemetry-api: "
+                    "pip install resilient-result[otel]"
+                )
+            tracer = trace.get_tracer("resilient_result")
+        self.tracer = tracer
+
+    def on_attempt_start(self, name: str, attempt: int):
+        span = self.tracer.start_span(
+            f"{name} attempt",
+            attributes={"resilient.function": name, "resilient.attempt": attempt},
+        )
+        attached = None
+        if trace is not None:
+            attached = context.attach(trace.set_span_in_context(span))
+        return span, attached
+
+    def on_attempt_end(self, name: str, attempt: int, result, token) -> None:
+        span, attached = token
+        if attached is not None:
+            context.detach(attached)
+        error = result.error
+        if error is not None:
+            if isinstance(error, BaseException):
+                span.record_exception(error)
+            span.set_attribute("resilient.error", type(error).__name__)
+            if trace is not None:
+                span.set_status(Status(StatusCode.ERROR, str(error)))
+        span.end()
+
+    def _event(self, name: str, attributes: dict) -> None:
+        if trace is None:
+            return
+        span = trace.get_current_span()
+        if span.is_recording():
+            span.add_event(name, attributes)
+
+    def on_retry_sleep(self, name: str, attempt: int, delay: float, error) -> None:
+        self._event(
+            "resilient.retry_sleep",
+            {
+                "resilient.function": name,
+                "resilient.attempt": attempt,
+                "resilient.delay": delay,
+                "resilient.error": type(error).__name__,
+            },
+        )
+
+    def on_circuit_transition(self, key, old: str, new: str) -> None:
+        self._event(
+            "resilient.circuit_transition",
+            {"resilient.key": str(key), "resilient.from": old, "resilient.to": new},
+        )
+
+    def on_rate_limit_wait(self, key, delay: float) -> None:
+        self._event(
+            "resilient.rate_limit_wait",
+            {"resilient.key": str(key), "resilient.delay": delay},
+        )
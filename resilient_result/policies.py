@@ -4,7 +4,11 @@ import random
 
 from .defaults import (
     BACKOFF_JITTER,
+    BUDGET_MIN_RETRIES,
+    BUDGET_RATIO,
+    BUDGET_WINDOW,
     CIRCUIT_FAILURES,
+    CIRCUIT_PROBES,
     CIRCUIT_WINDOW,
     RETRY_ATTEMPTS,
     TIMEOUT_SECONDS,
@@ -20,12 +24,36 @@ class Retry:
         self.timeout = timeout
 
 
+class Budget:
+    """Retry budget policy - caps retries as a share of requests per key."""
+
+    def __init__(
+        self,
+        ratio: float = BUDGET_RATIO,
+        window: float = BUDGET_WINDOW,
+        min_retries: int = BUDGET_MIN_RETRIES,
+        key: str = None,
+    ):
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self.key = key
+
+
 class Circuit:
     """Circuit breaker policy - runaway protection."""
 
-    def __init__(self, failures: int = CIRCUIT_FAILURES, window: int = CIRCUIT_WINDOW):
+    def __init__(
+        self,
+        failures: int = CIRCUIT_FAILURES,
+        window: int = CIRCUIT_WINDOW,
+        probes: int = CIRCUIT_PROBES,
+        backoff: "Backoff" = None,
+    ):
         self.failures = failures
         self.window = window
+        self.probes = probes
+        self.backoff = backoff
 
 
 class Backoff:
@@ -99,7 +127,29 @@ class Backoff:
 
 
 class Timeout:
-    """Timeout policy for time-based protection."""
+    """Timeout policy for time-based protection.
 
-    def __init__(self, seconds: float = TIMEOUT_SECONDS):
+    Multi-level: `operation` caps each attempt, `request` the whole call
+    with its retries, `total` the end-to-end budget when nothing encloses it.
+    """
+
+    def __init__(
+        self,
+        seconds: float = TIMEOUT_SECONDS,
+        operation: float = None,
+        request: float = None,
+        total: float = None,
+    ):
         self.seconds = seconds
+        self.operation = operation
+        self.request = request
+        self.total = total
+
+    @property
+    def levels(self) -> bool:
+        """True if any of operation/request/total is set."""
+        return (
+            self.operation is not None
+            or self.request is not None
+            or self.total is not None
+        )
@@ -1,53 +1,111 @@
 """Token bucket rate limiting - smooth, configurable, beautiful."""
 
 import asyncio
-import time
+import threading
 from functools import wraps
-from typing import Dict
+from typing import Optional, Tuple
 
+from . import clock
+from .defaults import REGISTRY_IDLE, REGISTRY_MAX_KEYS
+from .hooks import hooks
+from .metrics import RATE_LIMIT_WAIT_SECONDS, RATE_LIMIT_WAITS, metrics
+from .registry import Registry, sharded, unsharded
+from .result import Err, Ok, Result
 
-class RateLimiter:
-    """Token bucket rate limiter - smooth, configurable, beautiful."""
 
-    def __init__(self):
-        self._buckets: Dict[str, Dict] = {}
+class RateLimiter:
+    """Token bucket rate limiter - smooth, configurable, beautiful.
+
+    Buckets are tracked as a theoretical arrival time per key (GCRA):
+    each caller reserves the next slot atomically before sleeping, so
+    concurrent waiters are spaced 1/rps apart and served in FIFO order.
+    Reservations take a lock only for the bucket update, so sync callers
+    in threads and async callers on the loop share one bucket per key.
+    Buckets live in a bounded `Registry`; an evicted key gets a full burst.
+    """
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = REGISTRY_MAX_KEYS,
+        idle: Optional[float] = REGISTRY_IDLE,
+    ):
+        self.keys = Registry(max_keys, idle)
+        self._lock = threading.Lock()
+
+    def _reserve(self, key: str, rps: float, burst: int) -> Tuple[float, float]:
+        """Reserve the next slot - returns (seconds to wait, reservation end)."""
+        burst = burst or max(1, int(rps * 2))  # 2x RPS burst
+        interval = 1.0 / rps
+        with self._lock:
+            now = clock.now()
+            # Full burst allowance for new or idle keys
+            arrival = max(self.keys.get(key) or now, now)
+            reserved = arrival + interval
+            self.keys.put(key, reserved)
+        return max(0.0, arrival - (burst - 1) * interval - now), reserved
+
+    def reserve(self, key: str, rps: float = 1.0, burst: int = None) -> float:
+        """Reserve the next slot for key - returns seconds to wait for it."""
+        return self._reserve(key, rps, burst)[0]
+
+    def _waited(self, key: str, delay: float) -> None:
+        name = unsharded(key)
+        metrics.count(RATE_LIMIT_WAITS, name)
+        metrics.observe(RATE_LIMIT_WAIT_SECONDS, name, delay)
+
+    def _unreserve(self, key: str, rps: float, reserved: float) -> None:
+        """Hand a slot back if nobody reserved after it."""
+        with self._lock:
+            if self.keys.get(key) == reserved:
+                self.keys.put(key, reserved - 1.0 / rps)
 
     async def acquire(self, key: str, rps: float = 1.0, burst: int = None) -> None:
         """Acquire permission to proceed - sleeps if rate limit exceeded."""
-        burst = burst or max(1, int(rps * 2))  # 2x RPS burst
-        now = time.time()
-
-        # Initialize new bucket with full burst allowance
-        if key not in self._buckets:
-            self._buckets[key] = {"tokens": float(burst), "last_refill": now}
-
-        bucket = self._buckets[key]
-
-        # Refill tokens based on time elapsed
-        elapsed = now - bucket["last_refill"]
-        bucket["tokens"] = min(burst, bucket["tokens"] + elapsed * rps)
-        bucket["last_refill"] = now
-
-        # If no tokens available, sleep until we can get one
-        if bucket["tokens"] < 1:
-            sleep_time = (1 - bucket["tokens"]) / rps
-            await asyncio.sleep(sleep_time)
-            bucket["tokens"] = 0  # Consumed the token we waited for
-        else:
-            bucket["tokens"] -= 1  # Consume a token
+        delay, reserved = self._reserve(key, rps, burst)
+        if delay <= 0:
+            return
+        if metrics.enabled:
+            self._waited(key, delay)
+        if hooks.active:
+            hooks.rate_limit_wait(key, delay)
+
+        try:
+            await clock.sleep_async(delay)
+        except asyncio.CancelledError:
+            self._unreserve(key, rps, reserved)
+            raise
+
+    def acquire_sync(self, key: str, rps: float = 1.0, burst: int = None) -> None:
+        """Acquire permission to proceed - blocks the thread if rate exceeded."""
+        delay, reserved = self._reserve(key, rps, burst)
+        if delay <= 0:
+            return
+        if metrics.enabled:
+            self._waited(key, delay)
+        if hooks.active:
+            hooks.rate_limit_wait(key, delay)
+
+        try:
+            clock.sleep(delay)
+        except BaseException:
+            self._unreserve(key, rps, reserved)
+            raise
 
 
 # Global instance
 rate_limiter = RateLimiter()
 
 
-def rate_limit(rps: float = 10.0, burst: int = None, key: str = None):
-    """10 rps rate limiting - reasonable everywhere."""
+def rate_limit(rps: float = 10.0, burst: int = None, key: str = None, key_func=None):
+    """10 rps rate limiting - reasonable everywhere.
 
-    def decorator(func):
-        from .result import Err, Ok, Result
+    `key_func(*args, **kwargs)` gives each tenant or host its own bucket of
+    `rps`, so a busy partition doesn't throttle the others.
+    """
 
+    def decorator(func):
         func_key = key or f"{func.__module__}.{func.__qualname__}"
+        shard = None if key_func is None else sharded(func_key, key_func)
         is_async = asyncio.iscoroutinefunction(func)
 
         if is_async:
@@ -55,7 +113,9 @@ def rate_limit(rps: float = 10.0, burst: int = None, key: str = None):
             @wraps(func)
             async def async_rate_limited(*args, **kwargs):
                 try:
-                    await rate_limiter.acquire(func_key, rps, burst)
+                    await rate_limiter.acquire(
+                        func_key if shard is None else shard(args, kwargs), rps, burst
+                    )
                     result = await func(*args, **kwargs)
                     return Ok(result) if not isinstance(result, Result) else result
                 except Exception as e:
@@ -66,8 +126,9 @@ def rate_limit(rps: float = 10.0, burst: int = None, key: str = None):
         @wraps(func)
         def sync_rate_limited(*args, **kwargs):
             try:
-                # Note: Sync functions can't properly rate limit without blocking
-                # Consider using async version for true rate limiting
+                rate_limiter.acquire_sync(
+                    func_key if shard is None else shard(args, kwargs), rps, burst
+                )
                 result = func(*args, **kwargs)
                 return Ok(result) if not isinstance(result, Result) else result
             except Exception as e:
@@ -0,0 +1,130 @@
+"""Bounded per-key state - least recently used and idle keys are evicted."""
+
+import threading
+from typing import Dict, Optional
+
+from . import clock
+from .defaults import REGISTRY_IDLE, REGISTRY_MAX_KEYS
+
+
+class Registry:
+    """Per-key mechanism state bounded by key count and idle time.
+
+    Keys live in two generations. Lookups hit the current one, or move a
+    key up from the previous one. Once the current generation holds half
+    of `max_keys`, or is `idle` seconds old, it becomes the previous one
+    and the keys nobody used in between are dropped - an approximate LRU
+    whose hits cost one dict lookup, so dynamic keys such as one per
+    tenant can't grow state without bound. At most `max_keys` are held,
+    and a key unused for twice `idle` is gone once new keys arrive. An
+    evicted key starts over as if new. Either limit may be None.
+    """
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = REGISTRY_MAX_KEYS,
+        idle: Optional[float] = REGISTRY_IDLE,
+    ):
+        self.max_keys = max_keys
+        self.idle = idle
+        self._current: Dict = {}
+        self._previous: Dict = {}
+        self._started = clock.now()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def get(self, key):
+        """State for key, marked as recently used, or None."""
+        value = self._current.get(key)
+        if value is None and self._previous:
+            with self._lock:
+                value = self._previous.pop(key, None)
+                if value is not None:
+                    self._current[key] = value
+        return value
+
+    def put(self, key, value) -> None:
+        """Store state for key, evicting unused keys to make room."""
+        current = self._current
+        if key in current:
+            current[key] = value
+            return
+        with self._lock:
+            self._previous.pop(key, None)
+            self._age(clock.now())
+            self._current[key] = value
+
+    def _age(self, now: float) -> None:
+        """Start a new generation if the current one is full or old."""
+        full = self.max_keys is not None and len(self._current) >= max(
+            1, self.max_keys // 2
+        )
+        old = self.idle is not None and now - self._started >= self.idle
+        if full or old:
+            self.evicted += len(self._previous)
+            self._previous, self._current = self._current, {}
+            self._started = now
+
+    def pop(self, key, default=None):
+        """Forget key - returns its state, or default."""
+        with self._lock:
+            value = self._current.pop(key, None)
+            if value is None:
+                value = self._previous.pop(key, None)
+            return default if value is None else value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current = {}
+            self._previous = {}
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._current or key in self._previous
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Key count, limits and how many keys were evicted."""
+        return {
+            "keys": len(self),
+            "max_keys": self.max_keys,
+            "idle": self.idle,
+            "evicted": self.evicted,
+        }
+
+
+def arguments(*args, **kwargs):
+    """Default per-call key - the call's arguments. Raises TypeError when
+    a keyword value isn't hashable, so call it inside the hash guard."""
+    return (args, frozenset(kwargs.items())) if kwargs else args
+
+
+def sharded(name: str, key_func):
+    """Per-call registry key - name split by `key_func(*args, **kwargs)`.
+
+    Returns a function of (args, kwargs). Calls whose shard isn't hashable
+    share the unsharded name.
+    """
+
+    def shard(args: tuple, kwargs: dict):
+        try:
+            key = (name, key_func(*args, **kwargs))
+            hash(key)
+        except TypeError:
+            return name
+        return key
+
+    return shard
+
+
+def unsharded(key):
+    """The function-wide name of a `sharded` key - what metrics label by,
+    so per-partition state doesn't become a label per tenant."""
+    return key[0] if isinstance(key, tuple) else key
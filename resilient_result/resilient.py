@@ -1,27 +1,43 @@
 """Beautiful @resilient decorators for resilient operations."""
 
 import asyncio
-import logging
-import time
 from functools import wraps
 from typing import TYPE_CHECKING, Optional
 
+from . import clock
+from .adaptive import adaptive
+from .budget import retry_budget
+from .bulkhead import bulkhead
+from .cache import cache
 from .circuit import circuit
+from .coalesce import coalesce
+from .deadlines import attempt_limit, remaining
 from .defaults import (
+    ADAPTIVE_INITIAL,
+    BULKHEAD_MAX_CONCURRENT,
+    BULKHEAD_QUEUE_SIZE,
+    CACHE_TTL,
     CIRCUIT_FAILURES,
+    CIRCUIT_PROBES,
     CIRCUIT_WINDOW,
+    HEDGE_ATTEMPTS,
     RATE_LIMIT_RPS,
     RETRY_ATTEMPTS,
     TIMEOUT_SECONDS,
 )
+from .errors import REJECTIONS
+from .fallback import fallback
+from .hedge import hedge
+from .hooks import hooks
+from .log import retry_log
+from .metrics import metrics
 from .rate_limit import rate_limit
 from .result import Err, Ok, Result
 from .timeout import timeout
 
 if TYPE_CHECKING:
-    from .policies import Backoff
-
-logger = logging.getLogger("resilient_result")
+    from .log import RetryLog
+    from .policies import Backoff, Budget
 
 
 def retry(
@@ -29,16 +45,55 @@ def retry(
     backoff: Optional["Backoff"] = None,
     error_type: Optional[type] = None,
     handler=None,
+    retry_on=Exception,
+    budget: Optional["Budget"] = None,
+    log: Optional["RetryLog"] = None,
 ):
-    """2 attempts, 1s fixed backoff - reasonable everywhere."""
+    """2 attempts, 1s fixed backoff - reasonable everywhere.
+
+    Raised exceptions are always retried. Returned Err results are retried
+    when their error matches `retry_on` - an exception type, a tuple of
+    types, or a predicate. The default retries Err(Exception) such as a
+    timeout's Err(TimeoutError) but passes value errors like Err("not found")
+    straight through; retry_on=None never retries returned Errs.
+
+    Rejections - Err(CircuitError), Err(BulkheadError), Err(RateLimitError)
+    - are only retried when retry_on names them. One that ends the loop
+    after a failed attempt returns that attempt's error instead.
+
+    With a Budget, retries for the key stop once they exceed the budget's
+    share of recent calls and the last error is returned immediately. The
+    same happens when the backoff would overrun an enclosing deadline.
+
+    Retries and recoveries are reported to `log` - `retry_log` by default,
+    which writes to the resilient_result logger.
+    """
     from .policies import Backoff
 
+    if log is None:
+        log = retry_log
+
     if backoff is None:
         backoff = Backoff.fixed(1.0)
 
     if error_type is None:
         error_type = Exception
 
+    if retry_on is None:
+
+        def _retryable(error):
+            return False
+
+    elif isinstance(retry_on, (type, tuple)):
+        named = retry_on if isinstance(retry_on, tuple) else (retry_on,)
+        skipped = tuple(error for error in REJECTIONS if error not in named)
+
+        def _retryable(error):
+            return isinstance(error, retry_on) and not isinstance(error, skipped)
+
+    else:
+        _retryable = retry_on
+
     async def _should_stop_async(e, attempt):
         """Check if we should stop retrying based on async handler."""
         if handler and asyncio.iscoroutinefunction(handler):
@@ -64,89 +119,182 @@ def retry(
         return e if error_type is Exception else error_type(str(e))
 
     def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        budget_key = None
+        if budget:
+            budget_key = budget.key or name
+
+        bounded = {}
+
+        def _attempt_func():
+            """func, bounded per attempt by an enclosing timeout(operation=...)."""
+            ceiling = attempt_limit()
+            if ceiling is None:
+                return func
+            wrapped = bounded.get(ceiling)
+            if wrapped is None:
+                wrapped = bounded[ceiling] = timeout(ceiling)(func)
+            return wrapped
+
+        def _over_budget():
+            """Spend a retry from the budget - True if none are left."""
+            if budget and not retry_budget.try_retry(
+                budget_key, budget.ratio, budget.window, budget.min_retries
+            ):
+                log.budget_exhausted(func)
+                return True
+            return False
+
+        def _delay(error, attempt):
+            """Backoff before the next attempt, or None if it would overrun
+            the deadline."""
+            delay = backoff.calculate(attempt)
+            left = remaining()
+            if left is not None and delay >= left:
+                log.deadline_overrun(func, attempt + 2, delay)
+                return None
+            log.retrying(func, attempt + 2, attempts, delay, error)
+            return delay
+
+        def _record(start, attempt, result):
+            metrics.record_call(
+                name, attempt + 1, result._error is None, clock.now() - start
+            )
+
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
+                if budget:
+                    retry_budget.record_request(budget_key, budget.window)
+                start = clock.now() if metrics.enabled else None
+                call = _attempt_func()
                 error = None
+                attempt = 0
                 for attempt in range(attempts):
+                    tokens = (
+                        hooks.attempt_start(name, attempt + 1) if hooks.active else None
+                    )
                     try:
-                        result = await func(*args, **kwargs)
-                        # Log success if we had retries
-                        if attempt > 0:
-                            logger.info(
-                                "%s succeeded after %d attempts",
-                                func.__name__,
-                                attempt + 1,
-                            )
-                        return (
+                        result = await call(*args, **kwargs)
+                    except Exception as e:
+                        error = e
+                        if tokens is not None:
+                            hooks.attempt_end(tokens, name, attempt + 1, Err(e))
+                    except BaseException as e:
+                        # Cancelled or cut off by a timeout - still end it
+                        if tokens is not None:
+                            hooks.attempt_end(tokens, name, attempt + 1, Err(e))
+                        raise
+                    else:
+                        result = (
                             Ok(result)
                             if not isinstance(result, Result)
                             else result.flatten()
                         )
-                    except Exception as e:
-                        error = e
+                        if tokens is not None:
+                            hooks.attempt_end(tokens, name, attempt + 1, result)
+                        if result._error is None or not _retryable(result._error):
+                            # Log success if we had retries
+                            if attempt > 0 and result._error is None:
+                                log.recovered(func, attempt + 1)
+                            elif error is not None and isinstance(
+                                result._error, REJECTIONS
+                            ):
+                                # Rejected after a failure - report what tripped it
+                                result = Err(_format_error(error))
+                            break
+                        error = result._error
 
-                        # Check if we should stop retrying
-                        if await _should_stop_async(e, attempt):
-                            return Err(_format_error(e))
-
-                        # If this is the last attempt, don't sleep or log
-                        if attempt < attempts - 1:
-                            delay = backoff.calculate(attempt)
-                            logger.debug(
-                                "Retrying %s (attempt %d/%d) after %s: waiting %.1fs",
-                                func.__name__,
-                                attempt + 2,
-                                attempts,
-                                type(e).__name__,
-                                delay,
-                            )
-                            await asyncio.sleep(delay)
-
-                # Return the last exception we caught
-                return Err(_format_error(error))
+                    # Check if we should stop retrying
+                    if await _should_stop_async(error, attempt):
+                        result = Err(_format_error(error))
+                        break
+
+                    # If this is the last attempt, don't sleep or log
+                    if attempt < attempts - 1:
+                        delay = None if _over_budget() else _delay(error, attempt)
+                        if delay is None:
+                            result = Err(_format_error(error))
+                            break
+                        if hooks.active:
+                            hooks.retry_sleep(name, attempt + 1, delay, error)
+                        await clock.sleep_async(delay)
+                else:
+                    # Return the last error we saw
+                    result = Err(_format_error(error))
+
+                if start is not None:
+                    _record(start, attempt, result)
+                return result
 
             return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
+            if budget:
+                retry_budget.record_request(budget_key, budget.window)
+            start = clock.now() if metrics.enabled else None
+            call = _attempt_func()
             error = None
+            attempt = 0
             for attempt in range(attempts):
+                tokens = (
+                    hooks.attempt_start(name, attempt + 1) if hooks.active else None
+                )
                 try:
-                    result = func(*args, **kwargs)
-                    # Log success if we had retries
-                    if attempt > 0:
-                        logger.info(
-                            "%s succeeded after %d attempts", func.__name__, attempt + 1
-                        )
-                    return (
+                    result = call(*args, **kwargs)
+                except Exception as e:
+                    error = e
+                    if tokens is not None:
+                        hooks.attempt_end(tokens, name, attempt + 1, Err(e))
+                except BaseException as e:
+                    # Cancelled or cut off by a timeout - still end it
+                    if tokens is not None:
+                        hooks.attempt_end(tokens, name, attempt + 1, Err(e))
+                    raise
+                else:
+                    result = (
                         Ok(result)
                         if not isinstance(result, Result)
                         else result.flatten()
                     )
-                except Exception as e:
-                    error = e
-
-                    # Check if we should stop retrying
-                    if _should_stop_sync(e, attempt):
-                        return Err(_format_error(e))
-
-                    # If this is the last attempt, don't sleep or log
-                    if attempt < attempts - 1:
-                        delay = backoff.calculate(attempt)
-                        logger.debug(
-                            "Retrying %s (attempt %d/%d) after %s: waiting %.1fs",
-                            func.__name__,
-                            attempt + 2,
-                            attempts,
-                            type(e).__name__,
-                            delay,
-                        )
-                        time.sleep(delay)
-
-            # Return the last exception we caught
-            return Err(_format_error(error))
+                    if tokens is not None:
+                        hooks.attempt_end(tokens, name, attempt + 1, result)
+                    if result._error is None or not _retryable(result._error):
+                        # Log success if we had retries
+                        if attempt > 0 and result._error is None:
+                            log.recovered(func, attempt + 1)
+                        elif error is not None and isinstance(
+                            result._error, REJECTIONS
+                        ):
+                            # Rejected after a failure - report what tripped it
+                            result = Err(_format_error(error))
+                        break
+                    error = result._error
+
+                # Check if we should stop retrying
+                if _should_stop_sync(error, attempt):
+                    result = Err(_format_error(error))
+                    break
+
+                # If this is the last attempt, don't sleep or log
+                if attempt < attempts - 1:
+                    delay = None if _over_budget() else _delay(error, attempt)
+                    if delay is None:
+                        result = Err(_format_error(error))
+                        break
+                    if hooks.active:
+                        hooks.retry_sleep(name, attempt + 1, delay, error)
+                    clock.sleep(delay)
+            else:
+                # Return the last error we saw
+                result = Err(_format_error(error))
+
+            if start is not None:
+                _record(start, attempt, result)
+            return result
 
         return sync_wrapper
 
@@ -166,9 +314,11 @@ class Resilient:
         backoff=None,
         error_type=None,
         handler=None,
+        retry_on=Exception,
+        budget=None,
     ):
         """@resilient or @resilient() - Main decorator with policy composition."""
-        from .policies import Backoff, Retry
+        from .policies import Backoff, Retry, Timeout
 
         if func is not None:
             # Called as @resilient (no parentheses)
@@ -178,6 +328,26 @@ class Resilient:
         retry_policy = retry if retry is not None else Retry()
         backoff_policy = backoff if backoff is not None else Backoff.fixed(1.0)
 
+        retry_decorator = globals()["retry"](
+            attempts=retry_policy.attempts,
+            backoff=backoff_policy,
+            error_type=error_type,
+            handler=handler,
+            retry_on=retry_on,
+            budget=budget,
+        )
+
+        if isinstance(timeout, Timeout):
+            if timeout.levels:
+                # Request/total around the retry loop, operation per attempt
+                levels = self.timeout(
+                    operation=timeout.operation,
+                    request=timeout.request,
+                    total=timeout.total,
+                )
+                return lambda func: levels(retry_decorator(func))
+            timeout = timeout.seconds
+
         # Handle timeout from retry policy or direct parameter
         timeout_seconds = timeout or (retry_policy.timeout if retry else None)
 
@@ -186,21 +356,11 @@ class Resilient:
             def decorator(func):
                 # Apply timeout first, then retry
                 timeout_func = self.timeout(timeout_seconds)(func)
-                return globals()["retry"](
-                    attempts=retry_policy.attempts,
-                    backoff=backoff_policy,
-                    error_type=error_type,
-                    handler=handler,
-                )(timeout_func)
+                return retry_decorator(timeout_func)
 
             return decorator
         # Just retry
-        return globals()["retry"](
-            attempts=retry_policy.attempts,
-            backoff=backoff_policy,
-            error_type=error_type,
-            handler=handler,
-        )
+        return retry_decorator
 
     # Direct pattern access
     @staticmethod
@@ -209,21 +369,68 @@ class Resilient:
         return retry(attempts, **kwargs)
 
     @staticmethod
-    def timeout(seconds: float = TIMEOUT_SECONDS, error_type: type = TimeoutError):
-        """@resilient.timeout - Pure timeout logic."""
-        return timeout(seconds, error_type)
+    def timeout(
+        seconds: float = TIMEOUT_SECONDS,
+        error_type: type = TimeoutError,
+        mode: str = "thread",
+        operation: float = None,
+        request: float = None,
+        total: float = None,
+    ):
+        """@resilient.timeout - Pure timeout logic, optionally multi-level."""
+        return timeout(seconds, error_type, mode, operation, request, total)
 
     @staticmethod
-    def circuit(failures: int = CIRCUIT_FAILURES, window: int = CIRCUIT_WINDOW):
+    def circuit(
+        failures: int = CIRCUIT_FAILURES,
+        window: int = CIRCUIT_WINDOW,
+        probes: int = CIRCUIT_PROBES,
+        backoff: Optional["Backoff"] = None,
+        **kwargs,
+    ):
         """@resilient.circuit - Circuit breaker that returns Result types."""
-        return circuit(failures, window)
+        return circuit(failures, window, probes, backoff, **kwargs)
+
+    @staticmethod
+    def bulkhead(
+        max_concurrent: int = BULKHEAD_MAX_CONCURRENT,
+        queue_size: int = BULKHEAD_QUEUE_SIZE,
+        **kwargs,
+    ):
+        """@resilient.bulkhead - Cap concurrent calls, reject when queue is full."""
+        return bulkhead(max_concurrent, queue_size, **kwargs)
+
+    @staticmethod
+    def adaptive(initial: int = ADAPTIVE_INITIAL, **kwargs):
+        """@resilient.adaptive - Concurrency limit that follows backend capacity."""
+        return adaptive(initial, **kwargs)
+
+    @staticmethod
+    def cache(ttl: float = CACHE_TTL, **kwargs):
+        """@resilient.cache - Cache Ok results, serve stale ones when degraded."""
+        return cache(ttl, **kwargs)
+
+    @staticmethod
+    def coalesce(key_func=None, **kwargs):
+        """@resilient.coalesce - Concurrent identical calls share one execution."""
+        return coalesce(key_func, **kwargs)
+
+    @staticmethod
+    def fallback(providers, **kwargs):
+        """@resilient.fallback - Try alternative providers until one returns Ok."""
+        return fallback(providers, **kwargs)
+
+    @staticmethod
+    def hedge(attempts: int = HEDGE_ATTEMPTS, **kwargs):
+        """@resilient.hedge - Duplicate slow calls, first Ok wins."""
+        return hedge(attempts, **kwargs)
 
     @staticmethod
-    def rate_limit(rps: float = RATE_LIMIT_RPS, burst: int = None):
+    def rate_limit(rps: float = RATE_LIMIT_RPS, burst: int = None, **kwargs):
         """@resilient.rate_limit - Rate limiting with Result wrapper."""
 
         def result_wrapper(func):
-            rate_limit_func = rate_limit(rps, burst)(func)
+            rate_limit_func = rate_limit(rps, burst, **kwargs)(func)
 
             if asyncio.iscoroutinefunction(func):
 
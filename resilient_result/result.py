@@ -1,7 +1,7 @@
 """Result type for error handling."""
 
 import asyncio
-from typing import Any, Generic, List, TypeVar
+from typing import Any, AsyncIterator, Generic, Iterable, List, Optional, TypeVar
 
 T = TypeVar("T")
 E = TypeVar("E")
@@ -10,6 +10,8 @@ E = TypeVar("E")
 class Result(Generic[T, E]):
     """Result type for success and failure cases."""
 
+    __slots__ = ("_data", "_error")
+
     def __init__(self, data: T = None, error: E = None):
         self._data = data
         self._error = error
@@ -50,23 +52,37 @@ class Result(Generic[T, E]):
             Result.ok(Result.ok("data")) -> Result.ok("data")
             Result.ok(Result.fail("error")) -> Result.fail("error")
         """
-        if not self.success:
-            return self  # Already failed, nothing to flatten
-
-        # If data is a Result, flatten it
-        if isinstance(self._data, Result):
-            return self._data.flatten()  # Recursively flatten
-
-        return self  # No nesting, return as-is
+        result = self
+        # Unwrap nesting iteratively - no recursion, no allocation
+        while result._error is None and isinstance(result._data, Result):
+            result = result._data
+        return result
 
     @classmethod
-    async def collect(cls, operations: List[Any]) -> "Result[List[T], E]":
+    async def collect(
+        cls, operations: Iterable[Any], max_concurrency: Optional[int] = None
+    ) -> "Result[List[T], E]":
         """Collect multiple async operations into a single Result.
 
         All operations must succeed for the result to be successful.
         Returns Result.ok([data1, data2, ...]) if all succeed.
         Returns Result.fail(first_error) if any fails.
+
+        With max_concurrency, at most that many operations run at once and
+        the first failure to complete cancels everything still in flight.
         """
+        if max_concurrency is not None:
+            collected = {}
+            completed = _completed(operations, max_concurrency)
+            try:
+                async for index, result in completed:
+                    if result._error is not None:
+                        return cls.fail(result._error)
+                    collected[index] = result._data
+            finally:
+                await completed.aclose()
+            return cls.ok([collected[index] for index in range(len(collected))])
+
         results = await asyncio.gather(*operations, return_exceptions=True)
 
         collected_data = []
@@ -82,6 +98,23 @@ class Result(Generic[T, E]):
 
         return cls.ok(collected_data)
 
+    @classmethod
+    async def stream(
+        cls, operations: Iterable[Any], max_concurrency: Optional[int] = None
+    ) -> AsyncIterator["Result[T, E]"]:
+        """Yield a Result per async operation, in completion order.
+
+        Operations are pulled lazily, so a generator of coroutines with
+        max_concurrency keeps memory bounded. Closing the iterator cancels
+        anything still in flight.
+        """
+        completed = _completed(operations, max_concurrency)
+        try:
+            async for _, result in completed:
+                yield result
+        finally:
+            await completed.aclose()
+
     def __eq__(self, other) -> bool:
         """Compare Results by value."""
         if not isinstance(other, Result):
@@ -90,24 +123,80 @@ class Result(Generic[T, E]):
 
     def unwrap(self):
         """Extract data, raising exception if failed."""
-        if self.success:
+        if self._error is None:
             return self._data
         if isinstance(self._error, Exception):
             raise self._error
         raise ValueError(f"Result failed with error: {self._error}")
 
     def __repr__(self) -> str:
-        if self.success:
+        if self._error is None:
             return f"Result.ok({repr(self._data)})"
         return f"Result.fail({repr(self._error)})"
 
 
-# Constructor functions
+async def _completed(operations, max_concurrency):
+    """Yield (index, Result) as operations finish, bounded by max_concurrency."""
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    source = iter(operations)
+    done = asyncio.Queue()
+    pending = {}
+    started = 0
+    try:
+        while True:
+            while max_concurrency is None or len(pending) < max_concurrency:
+                operation = next(source, None)
+                if operation is None:
+                    break
+                task = asyncio.ensure_future(operation)
+                task.add_done_callback(done.put_nowait)
+                pending[task] = started
+                started += 1
+
+            if not pending:
+                return
+
+            task = await done.get()
+            index = pending.pop(task)
+            error = task.exception()
+            if error is not None:
+                yield index, Err(error)
+            else:
+                data = task.result()
+                yield index, data if isinstance(data, Result) else Ok(data)
+    finally:
+        for task in pending:
+            task.cancel()
+        # Close coroutines we never started so they don't warn on collection
+        if isinstance(operations, (list, tuple)):
+            for operation in operations[started:]:
+                if asyncio.iscoroutine(operation):
+                    operation.close()
+
+
+# Constructor functions - build slots directly, skipping classmethod + __init__
+_new = object.__new__
+
+_OK_NONE = _new(Result)
+_OK_NONE._data = None
+_OK_NONE._error = None
+
+
 def Ok(data: T = None) -> Result[T, Any]:
-    """Create successful result."""
-    return Result.ok(data)
+    """Create successful result. Ok(None) is a shared instance."""
+    if data is None:
+        return _OK_NONE
+    result = _new(Result)
+    result._data = data
+    result._error = None
+    return result
 
 
 def Err(error: E) -> Result[Any, E]:
     """Create failed result."""
-    return Result.fail(error)
+    result = _new(Result)
+    result._data = None
+    result._error = error
+    return result
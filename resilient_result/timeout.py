@@ -1,37 +1,417 @@
 """Timeout pattern - orthogonal time-based protection."""
 
 import asyncio
+import contextvars
+import queue
+import signal
+import threading
+import time
 from functools import wraps
+from typing import Dict, List
 
-from .defaults import TIMEOUT_SECONDS
+from . import clock
+from .deadlines import (
+    clamp,
+    enter,
+    enter_attempts,
+    exceeded,
+    leave,
+    leave_attempts,
+    remaining,
+)
+from .defaults import TIMEOUT_SECONDS, TIMEOUT_WORKERS
+from .metrics import metrics
 from .result import Err, Ok, Result
 
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
 
-def timeout(seconds: float = TIMEOUT_SECONDS, error_type: type = TimeoutError):
-    """30s timeout - reasonable everywhere."""
+
+class _Expired(BaseException):
+    """Deadline passed - BaseException so user code can't swallow it."""
+
+
+class _Unwind(BaseException):
+    """SIGALRM for the signal timeout at `level` - passes through inner ones."""
+
+    def __init__(self, level: int):
+        super().__init__(level)
+        self.level = level
+
+
+class _Call:
+    """A sync call handed to a pool worker."""
+
+    __slots__ = (
+        "run",
+        "args",
+        "kwargs",
+        "state",
+        "abandoned",
+        "done",
+        "result",
+        "error",
+    )
+
+    def __init__(self, func, args, kwargs):
+        self.run = contextvars.copy_context().run
+        self.args = (func, *args)
+        self.kwargs = kwargs
+        self.state = QUEUED
+        self.abandoned = False
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class TimeoutPool:
+    """Bounded daemon thread pool that gives sync calls a real deadline.
+
+    Threads start on demand up to `max_workers` and are reused. A call that
+    misses its deadline while queued is dropped; one that is already running
+    can't be interrupted, so it is abandoned and keeps its worker until it
+    returns. Daemon threads mean a hung call never blocks interpreter exit.
+
+    A call made from one of the pool's own workers - a timeout nested in
+    another - runs inline on that worker instead of queueing behind the
+    outer calls holding every worker. The enclosing deadline already
+    bounds it; if it overruns its own limit, the result is discarded.
+    """
+
+    def __init__(self, max_workers: int = TIMEOUT_WORKERS):
+        self.max_workers = max_workers
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._idle = 0
+        self._queued = 0
+        self._calls = 0
+        self._timed_out = 0
+        self._abandoned = 0
+        self._local = threading.local()
+
+    def run(self, func, args: tuple, kwargs: dict, seconds: float):
+        """Run func on a worker - raises _Expired if it misses the deadline."""
+        if getattr(self._local, "worker", False):
+            start = time.monotonic()
+            result = func(*args, **kwargs)
+            if time.monotonic() - start > seconds:
+                with self._lock:
+                    self._timed_out += 1
+                raise _Expired
+            return result
+
+        call = _Call(func, args, kwargs)
+        with self._lock:
+            self._calls += 1
+            self._queued += 1
+            spawn = self._queued > self._idle and self._threads < self.max_workers
+            if spawn:
+                self._threads += 1
+        self._queue.put(call)
+        if spawn:
+            threading.Thread(
+                target=self._work, name="resilient-timeout", daemon=True
+            ).start()
+
+        try:
+            finished = call.done.wait(seconds)
+        except BaseException:
+            # An enclosing signal timeout expired while we waited
+            with self._lock:
+                self._abandon(call)
+            raise
+        if not finished:
+            with self._lock:
+                if self._abandon(call):
+                    self._timed_out += 1
+                    raise _Expired
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _abandon(self, call: _Call) -> bool:
+        """Give up on call - False if it already finished. Caller holds _lock."""
+        if call.state == DONE:
+            return False
+        if call.state == QUEUED:
+            call.state = CANCELLED
+        else:
+            call.abandoned = True
+            self._abandoned += 1
+        return True
+
+    def _work(self) -> None:
+        self._local.worker = True
+        while True:
+            with self._lock:
+                self._idle += 1
+            call = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                self._queued -= 1
+                if call.state == CANCELLED:
+                    continue
+                call.state = RUNNING
+
+            try:
+                call.result = call.run(*call.args, **call.kwargs)
+            except BaseException as e:
+                call.error = e
+
+            with self._lock:
+                call.state = DONE
+                if call.abandoned:
+                    self._abandoned -= 1
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Pool metrics - size, thread reuse and abandoned calls."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "threads": self._threads,
+                "idle": self._idle,
+                "queued": self._queued,
+                "calls": self._calls,
+                "reused": max(0, self._calls - self._threads),
+                "timed_out": self._timed_out,
+                "abandoned": self._abandoned,
+            }
+
+
+# Global instance
+timeout_pool = TimeoutPool()
+
+
+# Deadlines of the signal timeouts running in the main thread, outermost first
+_alarms: List[float] = []
+
+
+def _expire(signum, frame):
+    """SIGALRM - unwind to the outermost signal timeout whose deadline passed."""
+    now = time.monotonic()
+    for level, deadline in enumerate(_alarms):
+        if deadline <= now:
+            raise _Unwind(level)
+    # Fired a hair early - wait for the nearest deadline
+    _arm()
+
+
+def _arm() -> None:
+    """Set the itimer for the nearest deadline, or clear it if none is left."""
+    if not _alarms:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        return
+    signal.setitimer(signal.ITIMER_REAL, max(min(_alarms) - time.monotonic(), 1e-6))
+
+
+def _alarm(func, args: tuple, kwargs: dict, seconds: float):
+    """Run func with a SIGALRM deadline - main thread only.
+
+    Signal timeouts nest: the itimer tracks the nearest deadline, and an
+    outer deadline that passes inside an inner call unwinds past the inner
+    timeout, so the outer one reports it rather than the inner swallowing it.
+    """
+    if threading.current_thread() is not threading.main_thread() or not hasattr(
+        signal, "setitimer"
+    ):
+        return timeout_pool.run(func, args, kwargs, seconds)
+
+    level = len(_alarms)
+    # The itimer counts real time, so the wall clock, not the injectable one
+    _alarms.append(time.monotonic() + seconds)
+    previous = signal.signal(signal.SIGALRM, _expire)
+    _arm()
+    try:
+        return func(*args, **kwargs)
+    except _Unwind as e:
+        if e.level < level:
+            raise
+        raise _Expired from None
+    finally:
+        del _alarms[level:]
+        _arm()
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _caller(mode: str):
+    """Sync deadline call for mode - the pool, or SIGALRM."""
+    if mode not in ("thread", "signal"):
+        raise ValueError(f"Unknown timeout mode: {mode!r}")
+    call = timeout_pool.run if mode == "thread" else _alarm
+
+    def run(func, args: tuple, kwargs: dict, seconds: float):
+        start = clock.now()
+        result = call(func, args, kwargs, seconds)
+        if clock.overran(start, seconds):
+            raise _Expired
+        return result
+
+    return run
+
+
+def _runner(seconds: float, error_type: type, mode: str):
+    """Build the sync call path for mode - returns Err(error_type) on expiry."""
+    call = _caller(mode)
+
+    def run(func, args, kwargs):
+        limit = clamp(seconds)
+        if limit <= 0:
+            metrics.timed_out(func)
+            return Err(error_type("Deadline exceeded"))
+        token = enter(limit)
+        try:
+            return call(func, args, kwargs, limit)
+        except _Expired:
+            metrics.timed_out(func)
+            return Err(exceeded(error_type, seconds, limit))
+        finally:
+            leave(token)
+
+    return run
+
+
+def _levels(error_type: type, mode: str, operation, request, total):
+    """Build the multi-level decorator - see timeout()."""
+    call = _caller(mode)
+
+    def ceiling():
+        """This call's limit - request, and total when nothing encloses it."""
+        seconds = request
+        if total is not None and remaining() is None:
+            seconds = total if seconds is None else min(seconds, total)
+        return seconds
+
+    def scope():
+        """(seconds, limit, tokens) - limit <= 0 means the deadline passed."""
+        seconds = ceiling()
+        limit = None if seconds is None else clamp(seconds)
+        if limit is not None and limit <= 0:
+            return seconds, limit, None
+        tokens = (
+            None if limit is None else enter(limit),
+            None if operation is None else enter_attempts(operation),
+        )
+        return seconds, limit, tokens
+
+    def unscope(tokens):
+        if tokens[1] is not None:
+            leave_attempts(tokens[1])
+        if tokens[0] is not None:
+            leave(tokens[0])
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_levels(*args, **kwargs):
+                seconds, limit, tokens = scope()
+                if tokens is None:
+                    metrics.timed_out(func)
+                    return Err(error_type("Deadline exceeded"))
+                try:
+                    if limit is None:
+                        result = await func(*args, **kwargs)
+                    else:
+                        try:
+                            result = await clock.wait_for(
+                                func(*args, **kwargs), timeout=limit
+                            )
+                        except asyncio.TimeoutError:
+                            metrics.timed_out(func)
+                            return Err(exceeded(error_type, seconds, limit))
+                    return Ok(result) if not isinstance(result, Result) else result
+                except Exception as e:
+                    return Err(e)
+                finally:
+                    unscope(tokens)
+
+            return async_levels
+
+        @wraps(func)
+        def sync_levels(*args, **kwargs):
+            seconds, limit, tokens = scope()
+            if tokens is None:
+                metrics.timed_out(func)
+                return Err(error_type("Deadline exceeded"))
+            try:
+                if limit is None:
+                    result = func(*args, **kwargs)
+                else:
+                    result = call(func, args, kwargs, limit)
+                return Ok(result) if not isinstance(result, Result) else result
+            except _Expired:
+                metrics.timed_out(func)
+                return Err(exceeded(error_type, seconds, limit))
+            except Exception as e:
+                return Err(e)
+            finally:
+                unscope(tokens)
+
+        return sync_levels
+
+    return decorator
+
+
+def timeout(
+    seconds: float = TIMEOUT_SECONDS,
+    error_type: type = TimeoutError,
+    mode: str = "thread",
+    operation: float = None,
+    request: float = None,
+    total: float = None,
+):
+    """30s timeout - reasonable everywhere.
+
+    Sync functions run on `timeout_pool` (mode="thread"), or under a
+    SIGALRM deadline in the main thread (mode="signal").
+
+    The deadline propagates to nested calls: inner timeouts are clamped to
+    it and retries stop once their backoff would overrun it. Inside an
+    outer deadline that has already passed, returns Err at once.
+
+    Multi-level form - `seconds` is ignored once any level is given:
+    - request: ceiling for this call, retries and backoff included
+    - total: end-to-end budget, applied only when no deadline encloses
+      the call, so the outermost one sets it for everything beneath
+    - operation: ceiling for each retry attempt and nested timeout inside
+    """
+    if operation is not None or request is not None or total is not None:
+        return _levels(error_type, mode, operation, request, total)
+
+    run = _runner(seconds, error_type, mode)
 
     def decorator(func):
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
+                limit = clamp(seconds)
+                if limit <= 0:
+                    metrics.timed_out(func)
+                    return Err(error_type("Deadline exceeded"))
+                token = enter(limit)
                 try:
-                    result = await asyncio.wait_for(
-                        func(*args, **kwargs), timeout=seconds
-                    )
+                    result = await clock.wait_for(func(*args, **kwargs), timeout=limit)
                     return Ok(result) if not isinstance(result, Result) else result
                 except asyncio.TimeoutError:
-                    return Err(error_type(f"Timeout after {seconds}s"))
+                    metrics.timed_out(func)
+                    return Err(exceeded(error_type, seconds, limit))
                 except Exception as e:
                     return Err(e)
+                finally:
+                    leave(token)
 
             return async_wrapper
 
-        # Sync functions can't have true timeouts, but wrap in Result
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             try:
-                result = func(*args, **kwargs)
+                result = run(func, args, kwargs)
                 return Ok(result) if not isinstance(result, Result) else result
             except Exception as e:
                 return Err(e)
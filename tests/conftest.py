@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from resilient_result import Backoff, Retry, resilient
+from resilient_result import Backoff, Retry, VirtualClock, resilient, set_clock
 
 
 @pytest.fixture
@@ -25,6 +25,15 @@ def call_counter():
     return Counter()
 
 
+@pytest.fixture
+def virtual():
+    """Run the test on simulated time."""
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+
 @pytest.fixture
 def fast_retry():
     """Fast retry policy for tests."""
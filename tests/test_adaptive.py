@@ -0,0 +1,129 @@
+"""Test adaptive concurrency limits."""
+
+import asyncio
+
+import pytest
+
+from resilient_result import Err, Ok, adaptive, resilient
+from resilient_result.adaptive import AdaptiveLimiter, adaptive_limiter
+from resilient_result.bulkhead import Bulkhead
+
+
+def sample(limiter, key, latency, failed=False, initial=10, **kwargs):
+    """One synthetic call through a limiter."""
+    limiter.acquire_sync(key, initial)
+    limiter.record(key, latency, failed, **kwargs)
+
+
+def test_aimd_grows_while_used():
+    """AIMD adds about one per round trip when the limit is in use."""
+    limiter = AdaptiveLimiter()
+    for _ in range(4):
+        limiter.acquire_sync("k", initial=4)
+    for _ in range(4):
+        limiter.record("k", 0.01, False)
+    assert limiter.limit("k") == 4  # 4 + 1/4 + ... < 5
+
+    for _ in range(40):
+        sample(limiter, "k", 0.01)
+    assert limiter.limit("k") == 4  # 1 in flight - no need to grow
+
+
+def test_aimd_backs_off_on_errors():
+    """Each error cuts the limit multiplicatively down to min_limit."""
+    limiter = AdaptiveLimiter()
+    sample(limiter, "k", 0.01, True, initial=20)
+    assert limiter.limit("k") == 18
+    for _ in range(50):
+        sample(limiter, "k", 0.01, True, min_limit=3)
+    assert limiter.limit("k") == 3
+
+
+def test_gradient_backs_off_on_latency():
+    """The gradient algorithm shrinks the limit as latency rises."""
+    limiter = AdaptiveLimiter()
+    sample(limiter, "k", 0.01, algorithm="gradient", initial=20)
+    for _ in range(200):
+        sample(limiter, "k", 0.05, algorithm="gradient")
+    assert limiter.limit("k") < 20
+    assert limiter.stats("k")["rtt"] < 0.02
+
+
+def test_gradient_clamped_to_max():
+    """Limits never leave [min_limit, max_limit]."""
+    limiter = AdaptiveLimiter()
+    for _ in range(8):
+        limiter.acquire_sync("k", initial=8)
+    for _ in range(8):
+        limiter.record("k", 0.01, False, "gradient", 1, 8)
+    assert limiter.limit("k") == 8
+
+
+def test_unknown_algorithm():
+    """Unknown algorithms fail at decoration time."""
+    with pytest.raises(ValueError, match="Unknown adaptive algorithm"):
+        adaptive(algorithm="vegas")
+
+
+def test_raised_limit_drains_queue():
+    """Releasing under a higher cap admits several waiters."""
+    bulkhead = Bulkhead()
+    bulkhead.acquire_sync("k", 1, 10)
+
+    async def main():
+        waiters = [
+            asyncio.ensure_future(bulkhead.acquire("k", 1, 10)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        bulkhead.release("k", 3)
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+    asyncio.run(main())
+    assert bulkhead.stats("k") == {"active": 3, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_decorator_tracks_limit():
+    """Decorated calls feed the global limiter and return Results."""
+
+    @adaptive(initial=2, key="test_decorator_tracks_limit")
+    async def fetch(i):
+        await asyncio.sleep(0.001)
+        return i
+
+    results = await asyncio.gather(*(fetch(i) for i in range(40)))
+
+    assert results == [Ok(i) for i in range(40)]
+    stats = adaptive_limiter.stats("test_decorator_tracks_limit")
+    assert stats["limit"] > 2
+    assert stats["active"] == 0
+    assert stats["error_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_only_exceptions_count_as_errors():
+    """Err(Exception) lowers the limit, value errors don't."""
+
+    @adaptive(initial=10, key="test_only_exceptions")
+    async def fetch(kind):
+        if kind == "raise":
+            raise ConnectionError("down")
+        return Err("not found")
+
+    assert (await fetch("value")).error == "not found"
+    assert adaptive_limiter.limit("test_only_exceptions") == 10
+
+    result = await fetch("raise")
+    assert isinstance(result.error, ConnectionError)
+    assert adaptive_limiter.limit("test_only_exceptions") == 9
+
+
+def test_sync_adaptive():
+    """Sync functions are limited and wrapped too."""
+
+    @resilient.adaptive(initial=1)
+    def work():
+        return "done"
+
+    assert work() == Ok("done")
+    assert work() == Ok("done")
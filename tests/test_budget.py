@@ -0,0 +1,71 @@
+"""Test retry budgets against retry storms."""
+
+import pytest
+
+from resilient_result import Backoff, Budget, retry
+from resilient_result.budget import RetryBudget
+
+
+def test_budget_ratio():
+    """Retries are capped at min_retries + ratio * requests."""
+    budget = RetryBudget()
+    for _ in range(10):
+        budget.record_request("key", 10.0)
+
+    allowed = sum(budget.try_retry("key", 0.2, 10.0, 1) for _ in range(10))
+    assert allowed == 3  # 1 + 0.2 * 10
+
+
+def test_budget_window_slides(virtual):
+    """Retries spent outside the window no longer count."""
+    budget = RetryBudget()
+    budget.record_request("key", 10.0)
+    assert budget.try_retry("key", 0.0, 10.0, 1)
+    assert not budget.try_retry("key", 0.0, 10.0, 1)
+
+    virtual.advance(9.0)
+    assert not budget.try_retry("key", 0.0, 10.0, 1)
+    virtual.advance(2.0)
+    assert budget.try_retry("key", 0.0, 10.0, 1)
+
+
+def test_exhausted_budget_returns_error(call_counter):
+    """Once the budget is spent, calls fail after one attempt."""
+    budget = Budget(ratio=0.0, min_retries=2, key="test_exhausted")
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001), budget=budget)
+    def failing():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    result = failing()  # spends both retries
+    assert isinstance(result.error, ConnectionError)
+    assert call_counter.count == 3
+
+    call_counter.reset()
+    result = failing()
+    assert isinstance(result.error, ConnectionError)
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_shared_key(call_counter):
+    """Functions naming the same key share one budget."""
+    budget = Budget(ratio=0.0, min_retries=1, key="test_shared")
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.001), budget=budget)
+    async def first():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.001), budget=budget)
+    async def second():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    await first()
+    assert call_counter.count == 2
+
+    call_counter.reset()
+    await second()
+    assert call_counter.count == 1
@@ -0,0 +1,191 @@
+"""Test bulkhead concurrency isolation."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from resilient_result import BulkheadError, Ok, bulkhead, resilient
+from resilient_result.bulkhead import Bulkhead, bulkheads
+
+
+@pytest.mark.asyncio
+async def test_caps_concurrency():
+    """No more than max_concurrent calls run at once."""
+    active = peak = 0
+
+    @bulkhead(max_concurrent=2, queue_size=10)
+    async def work(i):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return i
+
+    results = await asyncio.gather(*(work(i) for i in range(6)))
+
+    assert results == [Ok(i) for i in range(6)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_full_rejects():
+    """Calls beyond max_concurrent + queue_size get Err(BulkheadError) at once."""
+
+    @bulkhead(max_concurrent=1, queue_size=1)
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    start = time.time()
+    tasks = [asyncio.ensure_future(work()) for _ in range(2)]
+    await asyncio.sleep(0)
+    rejected = await work()
+
+    assert rejected.failure
+    assert isinstance(rejected.error, BulkheadError)
+    assert time.time() - start < 0.04
+    assert await asyncio.gather(*tasks) == [Ok("done"), Ok("done")]
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout():
+    """Waiters give up after the queue timeout."""
+
+    @bulkhead(max_concurrent=1, queue_size=5, timeout=0.01)
+    async def work():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    first = asyncio.ensure_future(work())
+    await asyncio.sleep(0)
+    result = await work()
+
+    assert isinstance(result.error, BulkheadError)
+    assert "queue wait" in str(result.error)
+    assert await first == Ok("done")
+
+
+@pytest.mark.asyncio
+async def test_fifo_order():
+    """Queued calls are admitted in arrival order."""
+    order = []
+
+    @bulkhead(max_concurrent=1, queue_size=10)
+    async def work(i):
+        order.append(i)
+        await asyncio.sleep(0.001)
+
+    await asyncio.gather(*(work(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_frees_queue():
+    """A cancelled waiter leaves the queue and leaks no slot."""
+    key = "test_cancelled_waiter"
+
+    @bulkhead(max_concurrent=1, queue_size=1, key=key)
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(work())
+    waiter = asyncio.ensure_future(work())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    assert bulkheads.stats(key) == {"active": 1, "queued": 0}
+    assert await first == Ok("done")
+    assert bulkheads.stats(key) == {"active": 0, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_exception_releases_slot():
+    """Failed calls free their slot and return Err."""
+
+    @bulkhead(max_concurrent=1, queue_size=0)
+    async def work():
+        raise ValueError("boom")
+
+    for _ in range(3):
+        result = await work()
+        assert isinstance(result.error, ValueError)
+
+
+def test_sync_threads_capped():
+    """Sync calls across threads share the cap."""
+    lock = threading.Lock()
+    active = peak = 0
+    results = []
+
+    @bulkhead(max_concurrent=2, queue_size=10)
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return "done"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(work())) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [Ok("done")] * 6
+    assert peak == 2
+
+
+def test_sync_queue_timeout():
+    """Sync waiters give up after the queue timeout."""
+    started = threading.Event()
+
+    @bulkhead(max_concurrent=1, queue_size=1, timeout=0.01)
+    def work():
+        started.set()
+        time.sleep(0.1)
+        return "done"
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    started.wait()
+
+    result = work()
+    thread.join()
+    assert isinstance(result.error, BulkheadError)
+
+
+@pytest.mark.asyncio
+async def test_mixed_sync_async_share_compartment():
+    """A thread releasing a slot wakes an async waiter on the loop."""
+    limiter = Bulkhead()
+    limiter.acquire_sync("shared", 1, 1)
+
+    waiter = asyncio.ensure_future(limiter.acquire("shared", 1, 1))
+    await asyncio.sleep(0)
+    assert limiter.stats("shared") == {"active": 1, "queued": 1}
+
+    threading.Thread(target=limiter.release, args=("shared",)).start()
+    await asyncio.wait_for(waiter, 1)
+    limiter.release("shared")
+    assert limiter.stats("shared") == {"active": 0, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_resilient_bulkhead():
+    """@resilient.bulkhead wraps results."""
+
+    @resilient.bulkhead(max_concurrent=1)
+    async def work():
+        return "ok"
+
+    assert await work() == Ok("ok")
@@ -0,0 +1,212 @@
+"""Test Result caching."""
+
+import asyncio
+import time
+
+import pytest
+
+from resilient_result import CircuitError, Err, Ok, cache, circuit, resilient
+from resilient_result.cache import result_cache
+
+
+@pytest.mark.asyncio
+async def test_caches_ok(call_counter):
+    """Fresh Ok results are served from the cache."""
+
+    @cache(ttl=10)
+    async def fetch(user_id):
+        call_counter.increment()
+        return {"id": user_id}
+
+    assert await fetch(1) == Ok({"id": 1})
+    assert await fetch(1) == Ok({"id": 1})
+    assert await fetch(2) == Ok({"id": 2})
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_expires_after_ttl(call_counter):
+    """Entries older than ttl are fetched again."""
+
+    @cache(ttl=0.01)
+    async def fetch():
+        return call_counter.increment()
+
+    assert await fetch() == Ok(1)
+    await asyncio.sleep(0.02)
+    assert await fetch() == Ok(2)
+
+
+@pytest.mark.asyncio
+async def test_errors_not_cached_by_default(call_counter):
+    """Err results are retried on the next call."""
+
+    @cache(ttl=10)
+    async def fetch():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    await fetch()
+    await fetch()
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_ttl(call_counter):
+    """error_ttl caches Err results briefly."""
+
+    @cache(ttl=10, error_ttl=0.02)
+    async def fetch():
+        call_counter.increment()
+        return Err("not found")
+
+    assert (await fetch()).error == "not found"
+    assert (await fetch()).error == "not found"
+    assert call_counter.count == 1
+
+    await asyncio.sleep(0.03)
+    await fetch()
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(call_counter):
+    """The least recently used entry is evicted past maxsize."""
+
+    @cache(ttl=10, maxsize=2, key="test_lru_eviction")
+    async def fetch(n):
+        call_counter.increment()
+        return n
+
+    await fetch(1)
+    await fetch(2)
+    await fetch(1)  # 1 is now most recent
+    await fetch(3)  # evicts 2
+    assert call_counter.count == 3
+
+    await fetch(1)
+    assert call_counter.count == 3
+    await fetch(2)
+    assert call_counter.count == 4
+    assert result_cache.stats("test_lru_eviction")["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(call_counter):
+    """Stale values return at once while one background call refreshes."""
+
+    @cache(ttl=0.05, stale=10)
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return call_counter.increment()
+
+    assert await fetch() == Ok(1)
+    await asyncio.sleep(0.06)
+
+    start = time.time()
+    assert await fetch() == Ok(1)
+    assert await fetch() == Ok(1)
+    assert time.time() - start < 0.01
+
+    await asyncio.sleep(0.03)
+    assert call_counter.count == 2
+    assert await fetch() == Ok(2)
+
+
+@pytest.mark.asyncio
+async def test_stale_when_circuit_open(call_counter):
+    """An open circuit serves the last Ok instead of CircuitError."""
+    healthy = True
+
+    @cache(ttl=0.01)
+    @circuit(failures=1, window=10)
+    async def fetch():
+        call_counter.increment()
+        if not healthy:
+            raise ConnectionError("down")
+        return "data"
+
+    assert await fetch() == Ok("data")
+    healthy = False
+    await asyncio.sleep(0.02)
+
+    failed = await fetch()
+    assert isinstance(failed.error, ConnectionError)
+
+    assert await fetch() == Ok("data")
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_error_without_entry():
+    """No cached Ok - the CircuitError comes through uncached."""
+
+    @cache()
+    async def fetch():
+        return Err(CircuitError("Circuit breaker open"))
+
+    assert isinstance((await fetch()).error, CircuitError)
+
+
+@pytest.mark.asyncio
+async def test_stats_and_invalidate():
+    """stats() counts hits and misses; invalidate() clears entries."""
+
+    @cache(key="test_stats_and_invalidate")
+    async def fetch():
+        return "data"
+
+    await fetch()
+    await fetch()
+    assert result_cache.stats("test_stats_and_invalidate") == {
+        "hits": 1,
+        "stale": 0,
+        "misses": 1,
+        "size": 1,
+    }
+
+    fetch.invalidate()
+    assert result_cache.stats("test_stats_and_invalidate")["size"] == 0
+
+
+def test_sync_cache(call_counter):
+    """Sync functions are cached and refreshed in a background thread."""
+
+    @resilient.cache(ttl=0.01, stale=10)
+    def fetch():
+        return call_counter.increment()
+
+    assert fetch() == Ok(1)
+    assert fetch() == Ok(1)
+    time.sleep(0.02)
+    assert fetch() == Ok(1)
+    time.sleep(0.05)
+    assert fetch() == Ok(2)
+
+
+def test_unhashable_arguments_skip_cache(call_counter):
+    """Unhashable keys call through every time."""
+
+    @cache()
+    def fetch(ids):
+        call_counter.increment()
+        return len(ids)
+
+    assert fetch([1, 2]) == Ok(2)
+    assert fetch([1, 2]) == Ok(2)
+    assert fetch(ids=[1, 2]) == Ok(2)
+    assert call_counter.count == 3
+
+
+@pytest.mark.asyncio
+async def test_unhashable_kwargs_skip_cache_async(call_counter):
+    """Unhashable keyword values call through instead of raising."""
+
+    @cache()
+    async def fetch(ids=()):
+        call_counter.increment()
+        return len(ids)
+
+    assert await fetch(ids=[1, 2]) == Ok(2)
+    assert await fetch(ids=[1, 2]) == Ok(2)
+    assert call_counter.count == 2
@@ -1,10 +1,13 @@
 """Test circuit breaker for runaway protection."""
 
 import asyncio
+import sys
+import threading
 
 import pytest
 
-from resilient_result.circuit import circuit
+from resilient_result import Backoff, CircuitError, Err, timeout
+from resilient_result.circuit import CircuitBreaker, circuit
 
 
 @pytest.mark.asyncio
@@ -111,3 +114,215 @@ async def test_success_doesnt_trigger(call_counter):
     result4 = await func()
     assert result4.success
     assert result4.unwrap() == "success 4"
+
+
+def test_failure_window_bounded():
+    """Failure storage is capped at the failures threshold."""
+    breaker = CircuitBreaker()
+    for _ in range(1000):
+        breaker.record_failure("hot", 3, 60)
+
+    assert len(breaker.keys["hot"].fails) <= 3
+    assert breaker.is_open("hot", 3, 60)
+
+    breaker.record_success("hot")  # late result - stays open
+    assert breaker.is_open("hot", 3, 60)
+
+
+def test_failure_window_expires():
+    """Failures further apart than the window don't trip the circuit."""
+    breaker = CircuitBreaker()
+    breaker.record_failure("key", 2, 0)
+    breaker.record_failure("key", 2, 0)
+
+    assert breaker.state("key") == "closed"
+    assert not breaker.is_open("key", 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_one_probe():
+    """Half-open admits a single probe - concurrent callers are rejected."""
+    calls = 0
+
+    @circuit(failures=1, window=0.05)
+    async def func():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("fail")
+        await asyncio.sleep(0.01)
+        return "recovered"
+
+    assert (await func()).failure
+    await asyncio.sleep(0.06)
+
+    results = await asyncio.gather(*(func() for _ in range(5)))
+    assert calls == 2
+    assert sum(r.success for r in results) == 1
+    rejected = [r for r in results if r.failure]
+    assert all(isinstance(r.error, CircuitError) for r in rejected)
+
+    # Probe succeeded - circuit closed again
+    assert (await func()).success
+
+
+@pytest.mark.asyncio
+async def test_probe_failure_reopens_with_backoff():
+    """A failed probe re-opens the circuit for a longer backoff duration."""
+    calls = []
+
+    @circuit(failures=1, backoff=Backoff.exp(delay=0.02, factor=4, jitter=False))
+    async def func():
+        calls.append(1)
+        raise ValueError("down")
+
+    await func()  # trip 1: open 0.02s
+    await asyncio.sleep(0.03)
+    await func()  # probe fails, trip 2: open 0.08s
+    await asyncio.sleep(0.03)
+
+    result = await func()
+    assert isinstance(result.error, CircuitError)
+    assert len(calls) == 2
+
+
+def test_late_success_keeps_circuit_open():
+    """A call admitted before the trip can't close the open circuit."""
+    breaker = CircuitBreaker()
+    breaker.record_failure("late", 2, 60)
+    breaker.record_failure("late", 2, 60)
+    assert breaker.state("late") == "open"
+
+    breaker.record_success("late")
+    assert breaker.state("late") == "open"
+
+
+@pytest.mark.asyncio
+async def test_returned_err_counts_as_failure():
+    """Err(TimeoutError) from an inner timeout trips the circuit."""
+
+    @circuit(failures=2, key="circuit-timeouts")
+    @timeout(0.01)
+    async def hung():
+        await asyncio.sleep(1)
+
+    await hung()
+    await hung()
+    assert isinstance((await hung()).error, CircuitError)
+
+
+@pytest.mark.asyncio
+async def test_probe_returning_err_reopens():
+    """A half-open probe that returns Err(Exception) re-opens the circuit."""
+    calls = []
+
+    @circuit(failures=1, window=0.02, key="circuit-err-probe")
+    async def func():
+        calls.append(1)
+        return Err(ConnectionError("down"))
+
+    await func()
+    await asyncio.sleep(0.03)
+    assert isinstance((await func()).error, ConnectionError)  # probe
+    assert isinstance((await func()).error, CircuitError)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_value_err_is_not_a_failure():
+    """Err("value") results don't count against the circuit."""
+
+    @circuit(failures=1, key="circuit-value-err")
+    async def func():
+        return Err("not found")
+
+    await func()
+    assert (await func()).error == "not found"
+
+
+def test_cancelled_probe_releases_slot():
+    """A probe that ends without a result frees its slot."""
+    breaker = CircuitBreaker()
+    breaker.record_failure("key", 1, 60, Backoff.fixed(0.0, jitter=False))
+
+    assert not breaker.is_open("key", 1, 60)  # probe admitted
+    assert breaker.is_open("key", 1, 60)  # slot taken
+    breaker.release("key")
+    assert not breaker.is_open("key", 1, 60)
+
+
+def test_threads_at_reopen_admit_one_probe():
+    """Threads racing into half-open share the probe slots."""
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            breaker = CircuitBreaker()
+            breaker.record_failure("key", 1, 60, Backoff.fixed(0.0, jitter=False))
+            barrier = threading.Barrier(32)
+            admitted = []
+
+            def probe(breaker, barrier, admitted):
+                barrier.wait()
+                if not breaker.is_open("key", 1, 60, probes=1):
+                    admitted.append(1)
+
+            threads = [
+                threading.Thread(target=probe, args=(breaker, barrier, admitted))
+                for _ in range(32)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(admitted) == 1
+    finally:
+        sys.setswitchinterval(switch)
+
+
+@pytest.mark.asyncio
+async def test_key_func_isolates_partitions():
+    """A failing host trips only its own circuit."""
+    calls = []
+
+    @circuit(failures=2, window=60, key_func=lambda host, **_: host)
+    async def fetch(host, path="/"):
+        calls.append(host)
+        if host == "bad":
+            raise ConnectionError(host)
+        return path
+
+    for _ in range(3):
+        await fetch("bad")
+    result = await fetch("good", path="/ok")
+
+    assert isinstance((await fetch("bad")).error, CircuitError)
+    assert result.unwrap() == "/ok"
+    assert calls == ["bad", "bad", "good"]
+
+
+def test_key_func_unhashable_shares_circuit():
+    """Calls whose shard can't be hashed share the function's circuit."""
+
+    @circuit(failures=1, window=60, key_func=lambda items: items)
+    def func(items):
+        raise ValueError("fail")
+
+    func([1])
+    assert isinstance(func([2]).error, CircuitError)
+
+
+@pytest.mark.asyncio
+async def test_key_func_error_returns_err():
+    """A key_func that raises becomes Err - sync and async."""
+
+    @circuit(key_func=lambda request: request.tenant_id)
+    async def handle(request):
+        return "handled"
+
+    @circuit(key_func=lambda request: request.tenant_id)
+    def handle_sync(request):
+        return "handled"
+
+    assert isinstance((await handle(None)).error, AttributeError)
+    assert isinstance(handle_sync(None).error, AttributeError)
@@ -0,0 +1,163 @@
+"""Test injectable clocks."""
+
+import asyncio
+import time
+
+import pytest
+
+from resilient_result import (
+    Backoff,
+    VirtualClock,
+    circuit,
+    rate_limit,
+    retry,
+    set_clock,
+    timeout,
+)
+from resilient_result.circuit import CLOSED, OPEN, circuit_breaker
+from resilient_result.clock import Clock, get_clock
+
+
+def test_default_clock_is_monotonic():
+    """Mechanisms read a monotonic clock unless told otherwise."""
+    assert type(get_clock()) is Clock
+    assert abs(get_clock().now() - time.monotonic()) < 1
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_simulated(virtual, call_counter):
+    """Backoff sleeps finish instantly and advance the clock."""
+
+    @retry(attempts=4, backoff=Backoff.fixed(20.0, jitter=False))
+    async def flaky():
+        if call_counter.increment() < 4:
+            raise ConnectionError("down")
+        return "done"
+
+    origin, start = virtual.now(), time.time()
+    assert (await flaky()).unwrap() == "done"
+    assert time.time() - start < 0.5
+    assert virtual.now() - origin == pytest.approx(60.0)
+
+
+def test_sync_retry_backoff_simulated(virtual, call_counter):
+    """Sync retry sleeps on the clock too."""
+
+    @retry(attempts=3, backoff=Backoff.fixed(20.0, jitter=False))
+    def flaky():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    origin = virtual.now()
+    flaky()
+    assert virtual.now() - origin == pytest.approx(40.0)
+
+
+@pytest.mark.asyncio
+async def test_circuit_window_simulated(virtual):
+    """Circuits reopen after the window without real waiting."""
+
+    @circuit(failures=1, window=300)
+    async def failing():
+        raise ConnectionError("down")
+
+    name = f"{failing.__wrapped__.__module__}.{failing.__wrapped__.__qualname__}"
+    await failing()
+    assert circuit_breaker.state(name) == OPEN
+
+    virtual.advance(301)
+    await failing()  # half-open probe fails - open again
+    assert circuit_breaker.state(name) == OPEN
+    virtual.advance(301)
+    assert not circuit_breaker.is_open(name, 1, 300)  # probe admitted
+    circuit_breaker.record_success(name)
+    assert circuit_breaker.state(name) == CLOSED
+
+
+def test_virtual_clock_continues_current_time():
+    """State recorded before the swap keeps its deadlines on the new clock."""
+    circuit_breaker.record_failure("test_clock_swap", 1, 60)
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    try:
+        assert circuit_breaker.state("test_clock_swap") == OPEN
+        clock.advance(61)
+        assert not circuit_breaker.is_open("test_clock_swap", 1, 60)
+        circuit_breaker.record_success("test_clock_swap")
+        assert circuit_breaker.state("test_clock_swap") == CLOSED
+    finally:
+        set_clock(previous)
+    assert VirtualClock(start=0.0).now() == 0.0
+
+
+def test_circuit_ignores_wall_clock(monkeypatch):
+    """A wall-clock jump doesn't close an open circuit."""
+    circuit_breaker.record_failure("test_wall_clock", 1, 60)
+    monkeypatch.setattr(time, "time", lambda: 1e12)
+    assert circuit_breaker.state("test_wall_clock") == OPEN
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_simulated(virtual):
+    """Rate limit waits run on simulated time."""
+
+    origin = virtual.now()
+
+    @rate_limit(rps=1.0, burst=1)
+    async def call():
+        return virtual.now() - origin
+
+    start = time.time()
+    stamps = [(await call()).unwrap() for _ in range(5)]
+
+    assert stamps == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+    assert time.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_timeout_simulated(virtual):
+    """Async timeouts fire at simulated time."""
+
+    @timeout(10.0)
+    async def slow():
+        await virtual.sleep_async(100)
+
+    origin = virtual.now()
+    result = await slow()
+    assert isinstance(result.error, TimeoutError)
+    assert virtual.now() - origin == pytest.approx(10.0)
+
+
+def test_sync_timeout_overrun_simulated(virtual):
+    """Sync calls that overrun in simulated time are discarded."""
+
+    @timeout(10.0)
+    def slow():
+        virtual.sleep(100)
+        return "late"
+
+    assert isinstance(slow().error, TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_sleepers_wake_in_order(virtual):
+    """Concurrent sleepers wake in deadline order and share the timeline."""
+    origin, woke = virtual.now(), []
+
+    async def sleeper(seconds):
+        await virtual.sleep_async(seconds)
+        woke.append((seconds, virtual.now() - origin))
+
+    await asyncio.gather(sleeper(3), sleeper(1), sleeper(2))
+    assert woke == pytest.approx([(1, 1.0), (2, 2.0), (3, 3.0)])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_sleeper_leaves_queue(virtual):
+    """Cancelling a sleeper doesn't block later ones."""
+    origin = virtual.now()
+    short = asyncio.ensure_future(virtual.sleep_async(10))
+    await asyncio.sleep(0)
+    short.cancel()
+    await virtual.sleep_async(20)
+    assert virtual.now() - origin == pytest.approx(20.0)
@@ -0,0 +1,218 @@
+"""Test request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from resilient_result import Backoff, Err, Ok, circuit, coalesce, resilient, retry
+from resilient_result.coalesce import coalescer
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_execution(call_counter):
+    """Concurrent calls with equal arguments run once."""
+
+    @coalesce()
+    async def fetch(user_id):
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+    results = await asyncio.gather(*(fetch(1) for _ in range(5)))
+
+    assert results == [Ok({"id": 1})] * 5
+    assert results[0] is results[4]
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_different_arguments_run_separately(call_counter):
+    """Each distinct key gets its own execution."""
+
+    @coalesce()
+    async def fetch(user_id, full=False):
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        return user_id
+
+    await asyncio.gather(fetch(1), fetch(1), fetch(2), fetch(1, full=True))
+    assert call_counter.count == 3
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_not_cached(call_counter):
+    """A finished flight is not reused."""
+
+    @coalesce()
+    async def fetch():
+        return call_counter.increment()
+
+    assert await fetch() == Ok(1)
+    assert await fetch() == Ok(2)
+
+
+@pytest.mark.asyncio
+async def test_key_func(call_counter):
+    """key_func decides which calls are equal."""
+
+    @coalesce(key_func=lambda user_id, trace=None: user_id)
+    async def fetch(user_id, trace=None):
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        return user_id
+
+    await asyncio.gather(fetch(1, trace="a"), fetch(1, trace="b"))
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_shared(call_counter):
+    """Every caller sees the same Err."""
+
+    @coalesce()
+    async def fetch():
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    results = await asyncio.gather(fetch(), fetch())
+    assert all(isinstance(r.error, ConnectionError) for r in results)
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_unhashable_arguments_run_alone(call_counter):
+    """Unhashable keys fall back to an uncoalesced call."""
+
+    @coalesce()
+    async def fetch(ids):
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        return len(ids)
+
+    assert await asyncio.gather(fetch([1]), fetch([1])) == [Ok(1), Ok(1)]
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_unhashable_kwargs_run_alone(call_counter):
+    """Unhashable keyword values fall back too - sync and async."""
+
+    @coalesce()
+    async def fetch(ids=()):
+        call_counter.increment()
+        return len(ids)
+
+    @coalesce()
+    def fetch_sync(ids=()):
+        call_counter.increment()
+        return len(ids)
+
+    assert await fetch(ids=[1, 2]) == Ok(2)
+    assert fetch_sync(ids=[1, 2]) == Ok(2)
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_others():
+    """Cancelling one caller doesn't cancel the shared execution."""
+
+    @coalesce()
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "data"
+
+    first = asyncio.ensure_future(fetch())
+    second = asyncio.ensure_future(fetch())
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == Ok("data")
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_all_callers_cancelled_cancels_execution():
+    """The execution is cancelled once nobody is waiting."""
+    cancelled = []
+
+    @coalesce()
+    async def fetch():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    caller = asyncio.ensure_future(fetch())
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.sleep(0.01)
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_dedup_stats():
+    """stats() reports calls, executions and dedup ratio."""
+
+    @coalesce(key="test_dedup_stats")
+    async def fetch():
+        await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(fetch() for _ in range(4)))
+    assert coalescer.stats("test_dedup_stats") == {
+        "calls": 4,
+        "executions": 1,
+        "dedup_ratio": 0.75,
+    }
+
+
+@pytest.mark.asyncio
+async def test_composes_with_retry_and_circuit(call_counter):
+    """Coalescing a retried, circuit-protected call shares the whole attempt."""
+
+    @coalesce()
+    @retry(attempts=3, backoff=Backoff.fixed(0.0, jitter=False))
+    @circuit(failures=5)
+    async def fetch():
+        if call_counter.increment() < 3:
+            raise ConnectionError("flaky")
+        return "data"
+
+    results = await asyncio.gather(fetch(), fetch(), fetch())
+    assert results == [Ok("data")] * 3
+    assert call_counter.count == 3
+
+
+def test_sync_threads_share_execution(call_counter):
+    """Sync callers in threads block on the leader's call."""
+    results = []
+
+    @resilient.coalesce()
+    def fetch():
+        call_counter.increment()
+        time.sleep(0.05)
+        return "data"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(fetch())) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [Ok("data")] * 4
+    assert call_counter.count == 1
+
+
+def test_sync_value_errors_pass_through():
+    """Returned Results are shared unchanged."""
+
+    @coalesce()
+    def fetch():
+        return Err("not found")
+
+    assert fetch().error == "not found"
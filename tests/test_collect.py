@@ -1,5 +1,7 @@
 """Tests for Result.collect() method."""
 
+import asyncio
+
 import pytest
 
 from resilient_result import Err, Ok, Result, resilient
@@ -101,3 +103,96 @@ async def test_collect_resilient():
 
     assert result.success
     assert result.unwrap() == ["data1", "data2"]
+
+
+@pytest.mark.asyncio
+async def test_collect_bounded_order():
+    """Bounded collect() keeps input order and never exceeds the limit."""
+    running = 0
+    peak = 0
+
+    async def op(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (5 - i % 5))
+        running -= 1
+        return i
+
+    result = await Result.collect((op(i) for i in range(20)), max_concurrency=3)
+
+    assert result.success
+    assert result.unwrap() == list(range(20))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_collect_bounded_fail_fast():
+    """Bounded collect() cancels in-flight work on the first failure."""
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def failing():
+        raise ValueError("operation failed")
+
+    ops = [slow(), failing(), slow(), slow()]
+    result = await Result.collect(ops, max_concurrency=2)
+    await asyncio.sleep(0)
+
+    assert result.failure
+    assert str(result.error) == "operation failed"
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_stream_completion_order():
+    """stream() yields Results as operations complete."""
+
+    async def op(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    async def failing():
+        raise ValueError("boom")
+
+    ops = [op("slow", 0.03), op("fast", 0.005), failing(), op(Ok("wrapped"), 0.015)]
+    results = [r async for r in Result.stream(ops)]
+
+    assert results[0].failure
+    assert results[1:] == [Ok("fast"), Ok("wrapped"), Ok("slow")]
+
+
+@pytest.mark.asyncio
+async def test_stream_early_exit():
+    """Leaving stream() early cancels outstanding operations."""
+    cancelled = []
+
+    async def op(i):
+        try:
+            await asyncio.sleep(0.001 * i)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return i
+
+    stream = Result.stream((op(i) for i in range(100)), max_concurrency=4)
+    async for result in stream:
+        assert result == Ok(0)
+        break
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert sorted(cancelled) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_invalid_concurrency():
+    """max_concurrency must be positive."""
+    with pytest.raises(ValueError):
+        await Result.collect([], max_concurrency=0)
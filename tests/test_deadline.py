@@ -0,0 +1,151 @@
+"""Test deadline propagation through nested calls."""
+
+import asyncio
+import time
+
+import pytest
+
+from resilient_result import Backoff, deadline, remaining, resilient, retry, timeout
+
+
+@pytest.mark.asyncio
+async def test_inner_timeout_clamped():
+    """An inner timeout can't outlive the outer one."""
+
+    @timeout(10.0)
+    async def inner():
+        await asyncio.sleep(1)
+
+    @timeout(0.05)
+    async def outer():
+        return await inner()
+
+    start = time.time()
+    result = await outer()
+
+    assert isinstance(result.error, TimeoutError)
+    assert time.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_clamped_timeout_names_deadline():
+    """A clamped timeout reports the outer deadline."""
+
+    @timeout(10.0)
+    async def inner():
+        await asyncio.sleep(1)
+
+    with deadline(0.02):
+        result = await inner()
+    assert str(result.error) == "Deadline exceeded"
+
+
+@pytest.mark.asyncio
+async def test_remaining_inside_timeout():
+    """Code under a timeout sees the time it has left."""
+
+    @timeout(1.0)
+    async def work():
+        return remaining()
+
+    left = (await work()).unwrap()
+    assert 0.5 < left <= 1.0
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_passed_returns_immediately(call_counter):
+    """Calls under an expired deadline don't run."""
+
+    @timeout(1.0)
+    async def work():
+        call_counter.increment()
+
+    with deadline(0.0):
+        result = await work()
+
+    assert isinstance(result.error, TimeoutError)
+    assert call_counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_skips_sleep_past_deadline(call_counter):
+    """Retry returns the error instead of sleeping past the deadline."""
+
+    @retry(attempts=5, backoff=Backoff.fixed(1.0, jitter=False))
+    async def flaky():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    start = time.time()
+    with deadline(0.5):
+        result = await flaky()
+
+    assert isinstance(result.error, ConnectionError)
+    assert call_counter.count == 1
+    assert time.time() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_retry_inside_timeout():
+    """@timeout over @retry stops retrying once the budget runs out."""
+
+    @resilient.timeout(0.1)
+    @retry(attempts=10, backoff=Backoff.fixed(0.04, jitter=False))
+    async def flaky():
+        raise ConnectionError("down")
+
+    start = time.time()
+    result = await flaky()
+
+    assert isinstance(result.error, ConnectionError)
+    assert time.time() - start < 0.1
+
+
+def test_sync_timeout_propagates_to_thread():
+    """Pool threads inherit the deadline and clamp nested timeouts."""
+
+    @timeout(10.0)
+    def inner():
+        time.sleep(1)
+
+    @timeout(0.05)
+    def outer():
+        return inner()
+
+    start = time.time()
+    result = outer()
+
+    assert str(result.error) in ("Deadline exceeded", "Timeout after 0.05s")
+    assert time.time() - start < 0.5
+
+
+def test_sync_nested_remaining():
+    """Nested sync timeouts see the tighter deadline."""
+
+    @timeout(0.5)
+    def inner():
+        return remaining()
+
+    @timeout(5.0)
+    def outer():
+        return inner()
+
+    assert outer().unwrap() <= 0.5
+
+
+def test_deadline_restored():
+    """Leaving a deadline block restores the outer one."""
+    with deadline(10):
+        with deadline(1):
+            assert remaining() <= 1
+        assert remaining() > 1
+    assert remaining() is None
+
+
+def test_deadlines_module_not_shadowed():
+    import resilient_result.deadlines as deadlines
+
+    assert deadlines.remaining is remaining
+    with deadline(5.0):
+        assert 0 < deadlines.remaining() <= 5.0
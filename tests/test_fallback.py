@@ -0,0 +1,231 @@
+"""Test fallback chains."""
+
+import asyncio
+import time
+
+import pytest
+
+from resilient_result import (
+    CircuitError,
+    Err,
+    FallbackError,
+    Ok,
+    circuit,
+    fallback,
+    resilient,
+    retry,
+)
+
+
+@pytest.mark.asyncio
+async def test_primary_ok_skips_fallbacks(call_counter):
+    """The decorated function wins when it succeeds."""
+
+    async def backup(key):
+        call_counter.increment()
+        return "backup"
+
+    @fallback([backup])
+    async def primary(key):
+        return "primary"
+
+    assert await primary("k") == Ok("primary")
+    assert call_counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_sequential_cascade():
+    """Providers run in order with the same arguments until one is Ok."""
+    calls = []
+
+    async def replica(key):
+        calls.append(("replica", key))
+        return Err("stale replica")
+
+    async def cache_lookup(key):
+        calls.append(("cache", key))
+        return f"cached {key}"
+
+    @fallback([replica, cache_lookup])
+    async def primary(key):
+        calls.append(("primary", key))
+        raise ConnectionError("down")
+
+    assert await primary("k") == Ok("cached k")
+    assert calls == [("primary", "k"), ("replica", "k"), ("cache", "k")]
+
+
+@pytest.mark.asyncio
+async def test_all_fail_aggregates_errors():
+    """Every error is kept in chain order."""
+
+    async def backup():
+        return Err("missing")
+
+    @fallback([backup])
+    async def primary():
+        raise ConnectionError("down")
+
+    result = await primary()
+    assert isinstance(result.error, FallbackError)
+    assert isinstance(result.error.errors[0], ConnectionError)
+    assert result.error.errors[1] == "missing"
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skipped(call_counter):
+    """Providers behind an open circuit are not called."""
+
+    @circuit(failures=1, window=10)
+    async def flaky():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    await flaky()  # trips the circuit
+
+    async def backup():
+        return "backup"
+
+    @fallback([flaky, backup])
+    async def primary():
+        raise ConnectionError("down")
+
+    assert await primary() == Ok("backup")
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_seen_through_stacked_decorators():
+    """An open circuit under retry still skips the provider."""
+
+    @retry(attempts=2, retry_on=None)
+    @circuit(failures=1, window=10)
+    async def flaky():
+        raise ConnectionError("down")
+
+    await flaky()
+
+    @fallback([flaky], mode="parallel")
+    async def primary():
+        return Err("no")
+
+    result = await primary()
+    assert isinstance(result.error.errors[1], CircuitError)
+
+
+@pytest.mark.asyncio
+async def test_failing_key_func_moves_on():
+    """A provider whose key_func raises fails like any other provider."""
+
+    @circuit(key_func=lambda request: request.tenant_id)
+    async def tenant(request):
+        return "tenant"
+
+    async def backup(request):
+        return "backup"
+
+    @fallback([tenant, backup])
+    async def primary(request):
+        raise ConnectionError("down")
+
+    assert await primary(None) == Ok("backup")
+
+
+@pytest.mark.asyncio
+async def test_sharded_circuit_checked_per_call(call_counter):
+    """Only calls whose partition's circuit is open skip the provider."""
+
+    @circuit(failures=1, window=10, key_func=lambda region: region)
+    async def regional(region):
+        call_counter.increment()
+        raise ConnectionError(region)
+
+    await regional("eu")  # trips the eu circuit only
+
+    async def backup(region):
+        return "backup"
+
+    @fallback([regional, backup])
+    async def primary(region):
+        raise ConnectionError("down")
+
+    assert await primary("eu") == Ok("backup")
+    assert call_counter.count == 1
+    assert await primary("us") == Ok("backup")
+    assert call_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_parallel_staggered_start():
+    """A slow primary is raced by the next provider after the stagger."""
+    cancelled = []
+
+    async def backup():
+        return "backup"
+
+    @fallback([backup], mode="parallel", stagger=0.01)
+    async def primary():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "primary"
+
+    start = time.time()
+    assert await primary() == Ok("backup")
+    assert time.time() - start < 0.5
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_parallel_failure_starts_next_immediately():
+    """A fast failure doesn't wait out the stagger."""
+
+    async def backup():
+        return "backup"
+
+    @fallback([backup], mode="parallel", stagger=10)
+    async def primary():
+        raise ConnectionError("down")
+
+    start = time.time()
+    assert await primary() == Ok("backup")
+    assert time.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_parallel_all_fail():
+    """Parallel mode aggregates errors in chain order."""
+
+    async def backup():
+        await asyncio.sleep(0.01)
+        return Err("second")
+
+    @fallback([backup], mode="parallel", stagger=0.001)
+    async def primary():
+        await asyncio.sleep(0.02)
+        return Err("first")
+
+    result = await primary()
+    assert result.error.errors == ["first", "second"]
+
+
+def test_unknown_mode():
+    """Unknown modes fail at decoration time."""
+    with pytest.raises(ValueError, match="Unknown fallback mode"):
+        fallback([], mode="random")
+
+
+def test_sync_fallback():
+    """Sync chains run sequentially."""
+
+    def backup(key):
+        return key.upper()
+
+    @resilient.fallback([backup])
+    def primary(key):
+        raise ConnectionError("down")
+
+    assert primary("k") == Ok("K")
@@ -0,0 +1,143 @@
+"""Test hedged requests for tail latency."""
+
+import asyncio
+import time
+
+import pytest
+
+from resilient_result import Backoff, Budget, Err, Ok, hedge
+from resilient_result.hedge import LatencyTracker, latency_tracker
+
+
+@pytest.mark.asyncio
+async def test_hedge_beats_slow_call(call_counter):
+    """A hedge launched after the delay wins over a stuck first call."""
+    cancelled = []
+
+    @hedge(backoff=Backoff.fixed(0.01, jitter=False), budget=Budget(min_retries=100))
+    async def fetch():
+        if call_counter.increment() == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return "hedged"
+
+    start = time.time()
+    result = await fetch()
+    await asyncio.sleep(0)
+
+    assert result == Ok("hedged")
+    assert time.time() - start < 0.5
+    assert call_counter.count == 2
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_attempt_tracked(call_counter):
+    """The losing slow attempt still counts towards the percentile."""
+
+    @hedge(
+        backoff=Backoff.fixed(0.05, jitter=False),
+        budget=Budget(min_retries=100),
+        key="hedge-tracked",
+    )
+    async def fetch():
+        if call_counter.increment() == 1:
+            await asyncio.sleep(1)
+        return "hedged"
+
+    assert await fetch() == Ok("hedged")
+    await asyncio.sleep(0)
+
+    samples = sorted(latency_tracker.keys.get("hedge-tracked").samples)
+    assert len(samples) == 2
+    assert samples[0] < 0.05 <= samples[1]
+
+
+@pytest.mark.asyncio
+async def test_shared_budget_keeps_latency_per_function():
+    """Budget(key=...) shares hedges, not the functions' latency samples."""
+    budget = Budget(key="hedge-shared-budget")
+
+    @hedge(budget=budget)
+    async def fast():
+        return "fast"
+
+    @hedge(budget=budget)
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "slow"
+
+    await fast()
+    await slow()
+
+    for func in (fast, slow):
+        name = f"{func.__module__}.{func.__qualname__}"
+        assert len(latency_tracker.keys.get(name).samples) == 1
+    assert latency_tracker.keys.get("hedge-shared-budget") is None
+
+
+@pytest.mark.asyncio
+async def test_fast_call_not_hedged(call_counter):
+    """Calls finishing before the delay never hedge."""
+
+    @hedge(backoff=Backoff.fixed(0.05, jitter=False))
+    async def fetch():
+        call_counter.increment()
+        return "fast"
+
+    assert await fetch() == Ok("fast")
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_exhausted(call_counter):
+    """No hedges once the budget is spent."""
+
+    @hedge(
+        backoff=Backoff.fixed(0.001, jitter=False),
+        budget=Budget(ratio=0.0, min_retries=0),
+    )
+    async def fetch():
+        call_counter.increment()
+        await asyncio.sleep(0.01)
+        return "slow"
+
+    assert await fetch() == Ok("slow")
+    assert call_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_all_attempts_fail():
+    """The last error is returned when every attempt fails."""
+
+    @hedge(attempts=2, backoff=Backoff.fixed(0.001, jitter=False))
+    async def fetch():
+        await asyncio.sleep(0.005)
+        return Err("down")
+
+    assert await fetch() == Err("down")
+
+
+def test_latency_percentile():
+    """Tracker reports the requested percentile once warmed up."""
+    tracker = LatencyTracker()
+    assert tracker.percentile("key", 0.9) is None
+
+    for ms in range(100):
+        tracker.record("key", ms / 1000)
+
+    assert tracker.percentile("key", 0.9) == pytest.approx(0.09)
+    assert tracker.percentile("key", 0.5) == pytest.approx(0.05)
+
+
+def test_sync_runs_once():
+    """Sync functions run once and are wrapped in a Result."""
+
+    @hedge()
+    def fetch():
+        return "sync"
+
+    assert fetch() == Ok("sync")
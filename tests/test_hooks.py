@@ -0,0 +1,283 @@
+"""Test tracing hooks."""
+
+import asyncio
+import contextvars
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from resilient_result import (
+    Backoff,
+    Hook,
+    circuit,
+    hooks,
+    rate_limit,
+    retry,
+    timeout,
+)
+from resilient_result import otel as otel_module
+from resilient_result.circuit import CLOSED, HALF_OPEN, OPEN
+from resilient_result.otel import OpenTelemetryHook
+
+
+class Recorder(Hook):
+    """Hook that keeps every event."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_attempt_start(self, name, attempt):
+        self.events.append(("start", attempt))
+        return attempt * 10
+
+    def on_attempt_end(self, name, attempt, result, token):
+        self.events.append(("end", attempt, result.success, token))
+
+    def on_retry_sleep(self, name, attempt, delay, error):
+        self.events.append(("sleep", attempt, delay, type(error).__name__))
+
+    def on_circuit_transition(self, key, old, new):
+        self.events.append(("circuit", key, old, new))
+
+    def on_rate_limit_wait(self, key, delay):
+        self.events.append(("wait", key))
+
+
+@pytest.fixture
+def recorder():
+    """Register a Recorder for the test."""
+    hook = hooks.add(Recorder())
+    yield hook
+    hooks.remove(hook)
+
+
+def test_no_hooks_inactive():
+    """With nothing registered, mechanisms skip dispatch entirely."""
+    assert not hooks.active
+
+
+def test_retry_attempts_and_sleeps(recorder):
+    """Each attempt is bracketed, with a sleep event between attempts."""
+    calls = []
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.0, jitter=False))
+    def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise ConnectionError("down")
+        return "ok"
+
+    flaky()
+    assert recorder.events == [
+        ("start", 1),
+        ("end", 1, False, 10),
+        ("sleep", 1, 0.0, "ConnectionError"),
+        ("start", 2),
+        ("end", 2, True, 20),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_retry_attempts(recorder):
+    """Async retries report attempts too."""
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False))
+    async def func():
+        return "ok"
+
+    await func()
+    assert recorder.events == [("start", 1), ("end", 1, True, 10)]
+
+
+def test_stacked_retry_attempt(recorder):
+    """A retry over a circuit that returns Err reports its one attempt."""
+
+    @retry(retry_on=None)
+    @circuit(failures=5, key="hooks-stacked")
+    def func():
+        raise ValueError("fail")
+
+    func()
+    assert recorder.events == [("start", 1), ("end", 1, False, 10)]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_attempt_ends(recorder):
+    """An attempt cut off by an outer timeout still gets its end event."""
+
+    @timeout(0.01)
+    @retry(attempts=1)
+    async def slow():
+        await asyncio.sleep(1)
+
+    assert (await slow()).failure
+    assert recorder.events == [("start", 1), ("end", 1, False, 10)]
+
+
+def test_signal_expired_attempt_ends(recorder):
+    """A SIGALRM timeout around the retry ends the attempt too."""
+
+    @timeout(0.01, mode="signal")
+    @retry(attempts=1)
+    def slow():
+        time.sleep(1)
+
+    assert slow().failure
+    assert recorder.events == [("start", 1), ("end", 1, False, 10)]
+
+
+def test_circuit_transitions(recorder):
+    """Trips, half-open probes and recovery are all reported."""
+    fail = [True]
+
+    @circuit(failures=1, backoff=Backoff.fixed(0.0, jitter=False), key="hooks-c")
+    def func():
+        if fail[0]:
+            raise ValueError("fail")
+        return "ok"
+
+    func()
+    fail[0] = False
+    func()
+
+    assert recorder.events == [
+        ("circuit", "hooks-c", CLOSED, OPEN),
+        ("circuit", "hooks-c", OPEN, HALF_OPEN),
+        ("circuit", "hooks-c", HALF_OPEN, CLOSED),
+    ]
+
+
+def test_rate_limit_wait(recorder):
+    """Only throttled calls report a wait."""
+
+    @rate_limit(rps=100.0, burst=1, key="hooks-rate")
+    def func():
+        return "ok"
+
+    func()
+    func()
+    assert recorder.events == [("wait", "hooks-rate")]
+
+
+def test_failing_hook_does_not_fail_call():
+    """A hook that raises is logged and skipped."""
+
+    class Broken(Hook):
+        def on_attempt_start(self, name, attempt):
+            raise RuntimeError("broken hook")
+
+    hook = hooks.add(Broken())
+    try:
+
+        @retry(attempts=1)
+        def func():
+            return "ok"
+
+        assert func().unwrap() == "ok"
+    finally:
+        hooks.remove(hook)
+    assert not hooks.active
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        self.status = status
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+def test_otel_span_per_attempt(monkeypatch):
+    """The adapter opens and ends a span for every attempt."""
+    monkeypatch.setattr(otel_module, "trace", None)
+    tracer = FakeTracer()
+    hook = hooks.add(OpenTelemetryHook(tracer))
+    try:
+
+        @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False))
+        def func():
+            raise ConnectionError("down")
+
+        func()
+    finally:
+        hooks.remove(hook)
+
+    assert [span.attributes["resilient.attempt"] for span in tracer.spans] == [1, 2]
+    assert all(span.ended for span in tracer.spans)
+    assert tracer.spans[0].name.endswith("func attempt")
+    assert tracer.spans[0].attributes["resilient.error"] == "ConnectionError"
+    assert isinstance(tracer.spans[0].exceptions[0], ConnectionError)
+
+
+class FakeOtel:
+    """Stand-in for opentelemetry's trace and context modules."""
+
+    def __init__(self):
+        self.current = contextvars.ContextVar("span", default=None)
+
+    def set_span_in_context(self, span):
+        return span
+
+    def attach(self, span):
+        return self.current.set(span)
+
+    def detach(self, token):
+        self.current.reset(token)
+
+    def get_current_span(self):
+        return self.current.get() or Mock(is_recording=lambda: False)
+
+
+def test_otel_attempt_span_is_current(monkeypatch):
+    """Work inside an attempt sees the attempt's span as current."""
+    fake = FakeOtel()
+    monkeypatch.setattr(otel_module, "trace", fake)
+    monkeypatch.setattr(otel_module, "context", fake)
+    monkeypatch.setattr(otel_module, "Status", lambda *args: args, raising=False)
+    monkeypatch.setattr(otel_module, "StatusCode", Mock(), raising=False)
+    tracer = FakeTracer()
+    seen = []
+    hook = hooks.add(OpenTelemetryHook(tracer))
+    try:
+
+        @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False))
+        def func():
+            seen.append(fake.current.get())
+            raise ConnectionError("down")
+
+        func()
+    finally:
+        hooks.remove(hook)
+
+    assert seen == tracer.spans
+    assert fake.current.get() is None
+
+
+def test_otel_requires_package(monkeypatch):
+    """Without opentelemetry-api and no tracer, the adapter says what to install."""
+    monkeypatch.setattr(otel_module, "trace", None)
+    with pytest.raises(ImportError, match="opentelemetry-api"):
+        OpenTelemetryHook()
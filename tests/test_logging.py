@@ -4,7 +4,7 @@ import logging
 
 import pytest
 
-from resilient_result import Backoff, retry
+from resilient_result import Backoff, RetryLog, retry
 
 
 def test_debug_content(caplog):
@@ -177,3 +177,79 @@ def test_exception_types(caplog):
     assert "after ConnectionError" in debug_logs[0].message
     # Second retry should log TimeoutError
     assert "after TimeoutError" in debug_logs[1].message
+
+
+def test_structured_fields(caplog):
+    """Retry records carry function, attempt, delay and error type."""
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False))
+    def flaky():
+        raise ConnectionError("down")
+
+    with caplog.at_level(logging.DEBUG, logger="resilient_result"):
+        flaky()
+
+    (record,) = caplog.records
+    assert record.function.endswith("flaky")
+    assert record.attempt == 2
+    assert record.attempts == 2
+    assert record.delay == 0.0
+    assert record.error_type == "ConnectionError"
+
+
+def test_sampling(caplog):
+    """sample keeps that share of retry records."""
+    log = RetryLog(sample=0.25)
+
+    @retry(attempts=9, backoff=Backoff.fixed(0.0, jitter=False), log=log)
+    def flaky():
+        raise ConnectionError("down")
+
+    with caplog.at_level(logging.DEBUG, logger="resilient_result"):
+        flaky()
+
+    assert len(caplog.records) == 2  # 8 retries at 25%
+
+
+def test_disabled_level_skips_sink():
+    """With the level disabled, nothing is built or emitted."""
+
+    class Counting(RetryLog):
+        emitted = 0
+
+        def emit(self, level, msg, args, fields):
+            Counting.emitted += 1
+
+    log = Counting(logging.getLogger("resilient_result.quiet"))
+    log.logger.setLevel(logging.WARNING)
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.0, jitter=False), log=log)
+    def flaky():
+        raise ConnectionError("down")
+
+    flaky()
+    assert Counting.emitted == 0
+
+
+def test_custom_sink():
+    """A RetryLog subclass receives records instead of logging."""
+    records = []
+
+    class Collect(RetryLog):
+        def emit(self, level, msg, args, fields):
+            records.append((level, msg % args, fields))
+
+    log = Collect(logging.getLogger("resilient_result.collect"))
+    log.logger.setLevel(logging.DEBUG)
+    calls = []
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False), log=log)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise ValueError("once")
+        return "ok"
+
+    flaky()
+    assert [level for level, _, _ in records] == [logging.DEBUG, logging.INFO]
+    assert records[1][1] == "flaky succeeded after 2 attempts"
@@ -0,0 +1,204 @@
+"""Test the metrics registry."""
+
+import asyncio
+import threading
+
+import pytest
+
+from resilient_result import Backoff, circuit, metrics, rate_limit, retry, timeout
+from resilient_result.metrics import Metrics
+
+
+@pytest.fixture
+def recording():
+    """Record metrics for the test, starting from zero."""
+    metrics.reset()
+    metrics.enabled = True
+    yield metrics
+    metrics.enabled = False
+    metrics.reset()
+
+
+def test_disabled_records_nothing():
+    """Nothing is recorded until metrics are enabled."""
+    metrics.reset()
+
+    @retry(attempts=2, backoff=Backoff.fixed(0.0, jitter=False))
+    def func():
+        raise ValueError("fail")
+
+    func()
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_retry_attempts_and_outcomes(recording):
+    """Retried calls count attempts, successes, failures and latency."""
+    calls = []
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.0, jitter=False))
+    def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise ConnectionError("down")
+        return "ok"
+
+    flaky()
+    snapshot = recording.snapshot()
+    name = f"{__name__}.test_retry_attempts_and_outcomes.<locals>.flaky"
+
+    assert snapshot["counters"]["attempts"][name] == 2
+    assert snapshot["counters"]["successes"][name] == 1
+    assert name not in snapshot["counters"].get("failures", {})
+    assert snapshot["histograms"]["call_seconds"][name]["count"] == 1
+
+
+def test_stacked_retry_recorded(recording):
+    """A retry over a mechanism records its call once."""
+
+    @retry(retry_on=None)
+    @circuit(failures=5, key="metrics-stacked")
+    def func():
+        raise ValueError("fail")
+
+    func()
+    snapshot = recording.snapshot()
+    (name,) = snapshot["counters"]["failures"]
+    assert snapshot["counters"]["attempts"][name] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeouts_counted(recording):
+    """Expired timeouts count per function."""
+
+    @timeout(0.01)
+    async def slow():
+        await asyncio.sleep(1)
+
+    await slow()
+    (count,) = recording.snapshot()["counters"]["timeouts"].values()
+    assert count == 1
+
+
+def test_circuit_opens_counted(recording):
+    """Each trip counts once."""
+
+    @circuit(failures=2, window=60, key="metrics-circuit")
+    def func():
+        raise ValueError("fail")
+
+    for _ in range(4):
+        func()
+    assert recording.snapshot()["counters"]["circuit_opens"]["metrics-circuit"] == 1
+
+
+def test_rate_limit_waits_counted(recording):
+    """Throttled calls count as waits and record how long they waited."""
+
+    @rate_limit(rps=100.0, burst=1, key="metrics-rate")
+    def func():
+        return "ok"
+
+    for _ in range(3):
+        func()
+    snapshot = recording.snapshot()
+    assert snapshot["counters"]["rate_limit_waits"]["metrics-rate"] == 2
+    waits = snapshot["histograms"]["rate_limit_wait_seconds"]["metrics-rate"]
+    assert waits["count"] == 2
+    assert waits["buckets"][0.025] == 2
+
+
+def test_partitions_share_function_label(recording):
+    """key_func partitions count under the function, not a label per tenant."""
+
+    @circuit(failures=1, window=60, key="metrics-tenant", key_func=lambda t: t)
+    def func(tenant):
+        raise ValueError("fail")
+
+    @rate_limit(rps=100.0, burst=1, key="metrics-tenant-rate", key_func=lambda t: t)
+    def limited(tenant):
+        return "ok"
+
+    for tenant in ("a", "b", "c"):
+        func(tenant)
+        limited(tenant)
+        limited(tenant)
+    counters = recording.snapshot()["counters"]
+    assert counters["circuit_opens"] == {"metrics-tenant": 3}
+    assert counters["rate_limit_waits"] == {"metrics-tenant-rate": 3}
+
+
+def test_threads_merge_on_snapshot():
+    """Each thread records into its own shard; snapshots sum them."""
+    registry = Metrics()
+
+    def work():
+        for _ in range(1000):
+            registry.count("calls", "key")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.snapshot()["counters"]["calls"]["key"] == 4000
+
+
+def test_exited_threads_retire_shards():
+    """Shards of finished threads fold into one - memory stays bounded."""
+    registry = Metrics(buckets=(0.1,))
+
+    def work():
+        registry.count("calls", "key")
+        registry.observe("latency", "key", 0.05)
+
+    for _ in range(500):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert len(registry._shards) == 1
+    snapshot = registry.snapshot()
+    assert snapshot["counters"]["calls"]["key"] == 500
+    assert snapshot["histograms"]["latency"]["key"]["count"] == 500
+
+
+def test_histogram_buckets_cumulative():
+    """Bucket counts include every smaller bucket and end at +Inf."""
+    registry = Metrics(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 0.5, 5.0):
+        registry.observe("latency", "key", seconds)
+
+    histogram = registry.snapshot()["histograms"]["latency"]["key"]
+    assert histogram["buckets"] == {0.1: 1, 1.0: 3, float("inf"): 4}
+    assert histogram["count"] == 4
+    assert histogram["sum"] == pytest.approx(6.05)
+
+
+def test_prometheus_format():
+    """The exporter writes counters and histograms in text format."""
+    registry = Metrics(buckets=(0.1,))
+    registry.count("attempts", "mod.func", 3)
+    registry.count("attempts", ("mod.call", "host-1"))
+    registry.observe("call_seconds", 'we"ird', 0.05)
+
+    text = registry.prometheus()
+    assert "# TYPE resilient_attempts_total counter" in text
+    assert 'resilient_attempts_total{key="mod.func"} 3' in text
+    assert 'resilient_attempts_total{key="mod.call[host-1]"} 1' in text
+    assert "# TYPE resilient_call_seconds histogram" in text
+    assert 'resilient_call_seconds_bucket{key="we\\"ird",le="0.1"} 1' in text
+    assert 'resilient_call_seconds_bucket{key="we\\"ird",le="+Inf"} 1' in text
+    assert 'resilient_call_seconds_count{key="we\\"ird"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_prometheus_keeps_large_values_exact():
+    """Counters and sums past a million aren't rounded to 6 digits."""
+    registry = Metrics(buckets=(0.1,))
+    registry.count("attempts", "mod.func", 1234567)
+    registry.observe("call_seconds", "mod.func", 1234567.25)
+
+    text = registry.prometheus()
+    assert 'resilient_attempts_total{key="mod.func"} 1234567\n' in text
+    assert 'resilient_call_seconds_sum{key="mod.func"} 1234567.25\n' in text
@@ -2,7 +2,17 @@
 
 import pytest
 
-from resilient_result import Retry, RetryError, resilient, retry
+from resilient_result import (
+    Backoff,
+    BulkheadError,
+    CircuitError,
+    Err,
+    Retry,
+    RetryError,
+    circuit,
+    resilient,
+    retry,
+)
 
 
 @pytest.mark.asyncio
@@ -57,3 +67,101 @@ async def test_policy_based_retry():
     result = await db_operation()
     assert result.success
     assert result.unwrap() == {"data": "from_database"}
+
+
+@pytest.mark.asyncio
+async def test_timeout_retried(call_counter):
+    """Timed-out attempts returned as Err are retried."""
+    import asyncio
+
+    @resilient(timeout=0.02, backoff=Backoff.fixed(0.001))
+    async def flaky():
+        if call_counter.increment() == 1:
+            await asyncio.sleep(0.1)
+        return "recovered"
+
+    result = await flaky()
+    assert result.unwrap() == "recovered"
+    assert call_counter.count == 2
+
+
+def test_err_value_not_retried(call_counter):
+    """Value errors like Err("not found") pass straight through."""
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001))
+    def lookup():
+        call_counter.increment()
+        return Err("not found")
+
+    assert lookup() == Err("not found")
+    assert call_counter.count == 1
+
+
+def test_retry_on_filter(call_counter):
+    """retry_on filters returned Errs by type or predicate."""
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001), retry_on=ConnectionError)
+    def by_type():
+        call_counter.increment()
+        return Err(ValueError("bad input"))
+
+    assert by_type().failure
+    assert call_counter.count == 1
+
+    call_counter.reset()
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001), retry_on=lambda e: e == "busy")
+    def by_predicate():
+        call_counter.increment()
+        return Err("busy")
+
+    assert by_predicate() == Err("busy")
+    assert call_counter.count == 3
+
+
+def test_rejections_not_retried(call_counter):
+    """A tripped circuit ends the loop with the error that tripped it."""
+
+    @retry(attempts=4, backoff=Backoff.fixed(0.001))
+    @circuit(failures=1, key="retry-rejection")
+    def flaky():
+        call_counter.increment()
+        raise ValueError("boom")
+
+    result = flaky()
+    assert isinstance(result.error, ValueError)
+    assert call_counter.count == 1
+
+    call_counter.reset()
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001))
+    def shed():
+        call_counter.increment()
+        return Err(BulkheadError("full"))
+
+    assert isinstance(shed().error, BulkheadError)
+    assert call_counter.count == 1
+
+
+def test_rejections_retried_when_named(call_counter):
+    """Naming a rejection in retry_on opts back in."""
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001), retry_on=CircuitError)
+    def rejected():
+        call_counter.increment()
+        return Err(CircuitError("open"))
+
+    assert rejected().failure
+    assert call_counter.count == 3
+
+
+def test_retry_on_none(call_counter):
+    """retry_on=None only retries raised exceptions."""
+
+    @retry(attempts=3, backoff=Backoff.fixed(0.001), retry_on=None)
+    def func():
+        call_counter.increment()
+        return Err(TimeoutError("slow"))
+
+    assert func().failure
+    assert call_counter.count == 1
@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from resilient_result import Backoff, Circuit, Retry, resilient
+from resilient_result import Backoff, Budget, Circuit, Retry, Timeout, resilient
 
 
 def test_retry_defaults():
@@ -23,6 +23,8 @@ def test_circuit_defaults():
     circuit = Circuit()
     assert circuit.failures == 3
     assert circuit.window == 60
+    assert circuit.probes == 1
+    assert circuit.backoff is None
 
 
 def test_circuit_custom():
@@ -31,6 +33,14 @@ def test_circuit_custom():
     assert circuit.window == 60
 
 
+def test_budget_defaults():
+    budget = Budget()
+    assert budget.ratio == 0.2
+    assert budget.window == 10.0
+    assert budget.min_retries == 10
+    assert budget.key is None
+
+
 def test_backoff_defaults():
     backoff = Backoff()
     assert backoff.strategy == "exponential"
@@ -126,3 +136,9 @@ def test_sync_policies(call_counter, fast_backoff):
     assert result.success
     assert result.unwrap() == "sync success"
     assert call_counter.count == 2
+
+
+def test_timeout_levels():
+    """Timeout policy reports multi-level configuration."""
+    assert not Timeout(5.0).levels
+    assert Timeout(operation=1.0, total=30.0).levels
@@ -1,10 +1,11 @@
 """Test token bucket rate limiting."""
 
+import asyncio
 import time
 
 import pytest
 
-from resilient_result.rate_limit import rate_limit
+from resilient_result.rate_limit import RateLimiter, rate_limit
 
 
 @pytest.mark.asyncio
@@ -98,3 +99,112 @@ async def test_custom_key():
     assert elapsed >= 0.015
     assert result.success
     assert result.unwrap() == "Y"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_hold_rate():
+    """Concurrent callers on one key are spaced out, not released together."""
+    limiter = RateLimiter()
+
+    start = time.time()
+    await asyncio.gather(*(limiter.acquire("key", 200.0, 1) for _ in range(11)))
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_waiters_fifo():
+    """Waiters proceed in arrival order."""
+    limiter = RateLimiter()
+    order = []
+
+    async def waiter(i):
+        await limiter.acquire("key", 500.0, 1)
+        order.append(i)
+
+    await asyncio.gather(*(waiter(i) for i in range(20)))
+    assert order == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_slot():
+    """A cancelled last waiter hands its reserved slot back."""
+    limiter = RateLimiter()
+    await limiter.acquire("key", 10.0, 1)
+
+    task = asyncio.ensure_future(limiter.acquire("key", 10.0, 1))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.reserve("key", 10.0, 1) <= 0.1
+
+
+def test_sync_enforces_rate():
+    """Sync callers block until their slot."""
+
+    @rate_limit(rps=50.0, burst=1)
+    def func():
+        return "sync"
+
+    start = time.time()
+    results = [func() for _ in range(3)]
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.035
+    assert all(r.unwrap() == "sync" for r in results)
+
+
+def test_threads_share_bucket():
+    """Threads hammering one key together hold the configured rate."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    @rate_limit(rps=200.0, burst=1)
+    def func():
+        return time.time()
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: func(), range(21)))
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.095
+    assert all(r.success for r in results)
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_share_key():
+    """Sync and async callers of one key draw from the same bucket."""
+
+    @rate_limit(rps=50.0, burst=1, key="mixed")
+    def sync_func():
+        return "sync"
+
+    @rate_limit(rps=50.0, burst=1, key="mixed")
+    async def async_func():
+        return "async"
+
+    sync_func()
+    start = time.time()
+    result = await async_func()
+
+    assert time.time() - start >= 0.015
+    assert result.unwrap() == "async"
+
+
+def test_key_func_buckets_per_tenant():
+    """Each tenant draws from its own bucket."""
+
+    @rate_limit(rps=20.0, burst=1, key_func=lambda tenant: tenant)
+    def call(tenant):
+        return tenant
+
+    start = time.time()
+    results = [call(tenant).unwrap() for tenant in ("a", "b", "c")]
+    assert time.time() - start < 0.04
+    assert results == ["a", "b", "c"]
+
+    call("a")
+    assert time.time() - start >= 0.04
@@ -0,0 +1,100 @@
+"""Test bounded per-key registries."""
+
+from resilient_result.budget import RetryBudget
+from resilient_result.circuit import CLOSED, OPEN, CircuitBreaker
+from resilient_result.rate_limit import RateLimiter
+from resilient_result.registry import Registry
+
+
+def test_max_keys_evicts_least_recently_used():
+    """Keys nobody used since the last generation go first."""
+    keys = Registry(max_keys=4, idle=None)
+    keys.put("a", 1)
+    keys.put("b", 2)
+    keys.put("c", 3)
+    keys.get("a")
+    keys.put("d", 4)
+
+    assert all(key in keys for key in "acd")
+    assert "b" not in keys
+    assert keys.stats()["evicted"] == 1
+
+
+def test_idle_keys_evicted(virtual):
+    """Keys unused for two idle periods are dropped when a key is added."""
+    keys = Registry(max_keys=None, idle=10.0)
+    keys.put("old", 1)
+    virtual.advance(10)
+    keys.put("used", 2)
+    virtual.advance(5)
+    keys.get("used")
+    virtual.advance(5)
+    keys.put("new", 3)
+
+    assert "old" not in keys
+    assert keys.get("used") == 2
+    assert len(keys) == 2
+
+
+def test_updates_do_not_evict():
+    """Replacing an existing key's state never evicts another."""
+    keys = Registry(max_keys=2, idle=None)
+    keys.put("a", 1)
+    keys.put("b", 2)
+    keys.put("a", 10)
+
+    assert keys["a"] == 10 and keys["b"] == 2
+
+
+def test_pop_and_clear():
+    """Keys can be forgotten one by one or all at once."""
+    keys = Registry()
+    keys.put("a", 1)
+    keys.put("b", 2)
+    assert keys.pop("a") == 1
+    assert keys.pop("a", "gone") == "gone"
+    keys.clear()
+    assert len(keys) == 0
+
+
+def test_rate_limiter_keys_bounded():
+    """Per-tenant buckets stay within max_keys."""
+    limiter = RateLimiter(max_keys=100)
+    for tenant in range(1000):
+        limiter.reserve(f"tenant-{tenant}", rps=10.0)
+
+    assert 50 <= len(limiter.keys) <= 100
+    assert limiter.keys.stats()["evicted"] == 1000 - len(limiter.keys)
+
+
+def test_evicted_bucket_starts_with_full_burst():
+    """A bucket evicted mid-burst comes back as a new key."""
+    limiter = RateLimiter(max_keys=2)
+    limiter.reserve("a", rps=1.0, burst=1)
+    assert limiter.reserve("a", rps=1.0, burst=1) > 0
+    limiter.reserve("b", rps=1.0, burst=1)
+    limiter.reserve("c", rps=1.0, burst=1)
+    assert limiter.reserve("a", rps=1.0, burst=1) == 0
+
+
+def test_hot_circuit_survives_churn():
+    """An open circuit in use isn't evicted by a stream of new keys."""
+    breaker = CircuitBreaker(max_keys=10)
+    for _ in range(3):
+        breaker.record_failure("hot", 3, 60)
+    for key in range(100):
+        breaker.record_failure(f"cold-{key}", 3, 60)
+        breaker.is_open("hot", 3, 60)
+
+    assert breaker.state("hot") == OPEN
+    assert breaker.state("cold-0") == CLOSED
+    assert len(breaker.keys) <= 10
+
+
+def test_retry_budget_keys_bounded():
+    """Budget windows for idle keys are reclaimed."""
+    budget = RetryBudget(max_keys=6)
+    for key in range(50):
+        budget.record_request(f"key-{key}", 10.0)
+
+    assert len(budget.keys) <= 6
@@ -200,3 +200,25 @@ def test_result_aggregation():
         failures[0].unwrap()
     with pytest.raises(ValueError, match="error2"):
         failures[1].unwrap()
+
+
+def test_slots_no_dict():
+    """Test Result is slotted - no per-instance __dict__."""
+    assert not hasattr(Ok("data"), "__dict__")
+    assert not hasattr(Err("error"), "__dict__")
+
+
+def test_ok_none_shared():
+    """Test Ok(None) reuses a single shared instance."""
+    assert Ok() is Ok(None)
+    assert Ok().success
+    assert Ok().unwrap() is None
+    assert Ok() == Result.ok(None)
+
+
+def test_constructors_match_classmethods():
+    """Test Ok/Err fast paths are equivalent to Result.ok/Result.fail."""
+    assert Ok("data") == Result.ok("data")
+    assert Err("error") == Result.fail("error")
+    assert type(Ok("data")) is Result
+    assert repr(Err("error")) == "Result.fail('error')"
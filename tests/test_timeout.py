@@ -1,10 +1,14 @@
 """Lean tests for timeout pattern."""
 
 import asyncio
+import contextvars
+import threading
+import time
 
 import pytest
 
-from resilient_result import Ok, timeout
+from resilient_result import Backoff, Ok, Retry, Timeout, resilient, retry, timeout
+from resilient_result.timeout import TimeoutPool, _Expired
 
 
 def test_sync_timeout_success():
@@ -58,3 +62,260 @@ async def test_async_timeout_error():
     result = await failing()
     assert result.failure
     assert "boom" in str(result.error)
+
+
+def test_sync_timeout_exceeded():
+    @timeout(seconds=0.05)
+    def hung():
+        time.sleep(0.3)
+        return "never"
+
+    start = time.time()
+    result = hung()
+
+    assert time.time() - start < 0.2
+    assert result.failure
+    assert isinstance(result.error, TimeoutError)
+    assert "Timeout after 0.05s" in str(result.error)
+
+
+def test_sync_timeout_signal_mode():
+    @timeout(seconds=0.05, mode="signal")
+    def hung():
+        time.sleep(0.3)
+        return "never"
+
+    @timeout(seconds=1.0, mode="signal")
+    def fast():
+        return "success"
+
+    assert "Timeout after 0.05s" in str(hung().error)
+    assert fast() == Ok("success")
+
+
+def test_nested_signal_timeouts_keep_outer_deadline():
+    @timeout(seconds=0.2, mode="signal")
+    def inner():
+        return "inner"
+
+    @timeout(seconds=0.5, mode="signal")
+    def outer():
+        inner()
+        time.sleep(1.5)
+        return "finished"
+
+    start = time.monotonic()
+    result = outer()
+    assert result.failure
+    assert "Timeout after 0.5s" in str(result.error)
+    assert time.monotonic() - start < 1.0
+
+
+def test_nested_signal_timeout_expires_inside_inner():
+    @timeout(seconds=1.0, mode="signal")
+    def inner():
+        time.sleep(0.3)
+        return "inner"
+
+    @timeout(seconds=0.1, mode="signal")
+    def outer():
+        inner()
+        time.sleep(1.0)
+        return "finished"
+
+    start = time.monotonic()
+    assert outer().failure
+    assert time.monotonic() - start < 0.6
+
+
+def test_thread_timeout_inside_signal_timeout():
+    @timeout(seconds=1.0)
+    def inner():
+        time.sleep(0.5)
+        return "inner"
+
+    @timeout(seconds=0.1, mode="signal")
+    def outer():
+        return inner()
+
+    start = time.monotonic()
+    assert "Timeout after 0.1s" in str(outer().error)
+    assert time.monotonic() - start < 0.4
+
+
+def test_sync_timeout_keeps_context():
+    var = contextvars.ContextVar("var", default=None)
+
+    @timeout(seconds=1.0)
+    def read():
+        return var.get()
+
+    var.set("request-1")
+    assert read() == Ok("request-1")
+
+
+def test_pool_accounting():
+    pool = TimeoutPool(max_workers=1)
+    release = threading.Event()
+
+    with pytest.raises(_Expired):
+        pool.run(release.wait, (), {}, 0.01)  # running - abandoned
+    with pytest.raises(_Expired):
+        pool.run(lambda: "queued", (), {}, 0.01)  # queued - dropped
+
+    stats = pool.stats()
+    assert stats["threads"] == 1
+    assert stats["timed_out"] == 2
+    assert stats["abandoned"] == 1
+
+    release.set()
+    assert pool.run(lambda: "reused", (), {}, 1.0) == "reused"
+
+    stats = pool.stats()
+    assert stats["abandoned"] == 0
+    assert stats["threads"] == 1
+    assert stats["reused"] == 2
+
+
+def test_nested_calls_run_inline_on_workers():
+    """Inner calls don't queue behind outer calls holding every worker."""
+    pool = TimeoutPool(max_workers=2)
+    barrier = threading.Barrier(2)
+
+    def outer():
+        barrier.wait()  # both workers busy before either nests
+        return pool.run(lambda: "inner", (), {}, 0.2)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(pool.run(outer, (), {}, 2.0)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["inner", "inner"]
+    assert pool.stats()["threads"] == 2
+
+
+def test_nested_inline_call_overrunning_expires():
+    pool = TimeoutPool(max_workers=1)
+
+    def outer():
+        with pytest.raises(_Expired):
+            pool.run(time.sleep, (0.05,), {}, 0.01)
+        return "outer"
+
+    assert pool.run(outer, (), {}, 1.0) == "outer"
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        timeout(seconds=1.0, mode="process")
+
+
+@pytest.mark.asyncio
+async def test_operation_caps_each_attempt(call_counter):
+    """operation bounds every retry attempt, request the whole call."""
+
+    @resilient(
+        retry=Retry(attempts=3),
+        timeout=Timeout(operation=0.02, request=1.0),
+        backoff=Backoff.fixed(0.0, jitter=False),
+    )
+    async def flaky():
+        if call_counter.increment() < 3:
+            await asyncio.sleep(1)
+        return "done"
+
+    start = time.time()
+    assert await flaky() == Ok("done")
+    assert call_counter.count == 3
+    assert time.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_request_caps_all_attempts(call_counter):
+    """The request ceiling stops the retry loop early."""
+
+    @resilient(
+        retry=Retry(attempts=10),
+        timeout=Timeout(operation=0.03, request=0.05),
+        backoff=Backoff.fixed(0.0, jitter=False),
+    )
+    async def slow():
+        call_counter.increment()
+        await asyncio.sleep(1)
+
+    start = time.time()
+    result = await slow()
+
+    assert isinstance(result.error, TimeoutError)
+    assert call_counter.count <= 3
+    assert time.time() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_total_only_at_root():
+    """total starts a budget at the root and defers to an enclosing one."""
+
+    @timeout(total=10.0)
+    async def inner():
+        await asyncio.sleep(1)
+
+    @timeout(request=0.02)
+    async def outer():
+        return await inner()
+
+    start = time.time()
+    assert isinstance((await outer()).error, TimeoutError)
+    assert time.time() - start < 0.5
+
+    @timeout(total=0.02)
+    async def root():
+        await asyncio.sleep(1)
+
+    assert str((await root()).error) == "Timeout after 0.02s"
+
+
+@pytest.mark.asyncio
+async def test_total_budget_skips_backoff(call_counter):
+    """Retry under a total budget doesn't sleep past it."""
+
+    @timeout(total=0.1)
+    @retry(attempts=3, backoff=Backoff.fixed(0.5, jitter=False))
+    async def flaky():
+        call_counter.increment()
+        raise ConnectionError("down")
+
+    start = time.time()
+    result = await flaky()
+
+    assert isinstance(result.error, ConnectionError)
+    assert call_counter.count == 1
+    assert time.time() - start < 0.1
+
+
+def test_sync_request_timeout():
+    """Multi-level timeouts work for sync functions too."""
+
+    @timeout(request=0.02)
+    def slow():
+        time.sleep(1)
+
+    start = time.time()
+    assert isinstance(slow().error, TimeoutError)
+    assert time.time() - start < 0.5
+
+
+def test_operation_only_runs_inline(call_counter):
+    """Without request/total, the call itself isn't bounded or moved."""
+
+    @timeout(operation=0.01)
+    def work():
+        call_counter.increment()
+        return threading.current_thread() is threading.main_thread()
+
+    assert work() == Ok(True)